@@ -46,12 +46,15 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
-    "djangorestframework_camel_case.middleware.CamelCaseMiddleWare",
+    "core.middleware.CamelCaseQueryMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "core.querybudget.QueryBudgetMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "users.middleware.UserIdentityMapMiddleware",
+    "core.replicas.ReplicaPinMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -95,6 +98,80 @@ DATABASES = {
     }
 }
 
+# read replicas, aliases of DATABASES, see core/replicas.py. SQLITE_REPLICAS=n adds
+# n SQLite file copies of the default database, refreshed by the sync_replicas
+# command.
+DATABASE_ROUTERS = ["core.replicas.ReplicaRouter"]
+DATABASE_REPLICAS = []
+for number in range(1, int(os.getenv("SQLITE_REPLICAS", "0")) + 1):
+    DATABASES[f"replica{number}"] = {
+        **DATABASES["default"],
+        "NAME": BASE_DIR / f"db.replica{number}.sqlite3",
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica{number}")
+REPLICA_MAX_LAG_SECONDS = 30  # replicas not synced since are not read from
+
+# pragmas applied to every new SQLite connection, see core/sqlite.py. prod.py
+# enables the tuned profile.
+SQLITE_PRAGMAS = {}
+SQLITE_TUNED_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,  # milliseconds
+    "mmap_size": 256 * 1024 * 1024,  # bytes
+    "cache_size": -64000,  # negative is in KiB
+    "temp_store": "MEMORY",
+}
+
+
+# Caches
+# the default cache is the shared tier of the location and venue resolvers, see
+# core/resolvers.py, and holds token revocations and replica sync times, which
+# all processes must see. locmem is only accepted in DEBUG, see
+# core/sharedcache.py.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+
+# Query budgets
+# maximum number of queries per request by URL name, see core/querybudget.py
+QUERY_BUDGET_DEFAULT = 10
+QUERY_BUDGET_SAMPLE_RATE = 0.01  # share of requests reported when not in DEBUG
+QUERY_BUDGETS = {
+    # authentication
+    "register": 32,
+    "login": 2,
+    "refresh": 12,  # the first refresh of a process builds the revocation filter
+    "logout": 7,
+    # gigs, users are authenticated from their token, without a query
+    "gig-feed": 2,
+    "gig-facets": 3,
+    "gig-dashboard": 3,
+    "gig-nearby": 3,
+    "gig-recommendations": 5,
+    "gig-search": 3,
+    "gig-schedule-conflicts": 3,
+    "gig-create": 32,
+    "gig-bulk-create": 23,
+    "gig-client-review": 5,
+    "gig-update": 15,
+    "gig-publish": 10,
+    "gig-apply": 7,
+    "gig-applications": 2,
+    "agent-applications": 1,
+    "gig-application-accept": 15,
+    "async-gig-create": 32,
+    "async-gig-client-review": 2,
+    "async-gig-update": 15,
+    "async-gig-publish": 10,
+    # reference data
+    "timezones": 0,
+}
+
 
 # Custom User Model
 AUTH_USER_MODEL = "users.CustomUser"
@@ -119,7 +196,7 @@ REST_FRAMEWORK = {
         "no_underscore_before_number": True,
     },
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "authentication.authentication.StatelessJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
         "rest_framework.authentication.BasicAuthentication",
     ],
@@ -141,6 +218,7 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
     "TOKEN_OBTAIN_SERIALIZER": "authentication.serializers.CustomTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "authentication.serializers.CustomTokenRefreshSerializer",
 }
 
 # Password validation
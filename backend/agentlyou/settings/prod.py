@@ -1,3 +1,4 @@
+import os
 from datetime import timedelta
 
 from .base import *
@@ -8,3 +9,27 @@ ALLOWED_HOSTS = []
 # JWT token pair lifetime settings
 SIMPLE_JWT["ACCESS_TOKEN_LIFETIME"] = timedelta(minutes=15)
 SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"] = timedelta(days=1)
+
+# SQLite tuning, see core/sqlite.py
+SQLITE_PRAGMAS = SQLITE_TUNED_PRAGMAS
+for database in DATABASES.values():  # replicas included
+    database.update(
+        {
+            # keep connections, and their pragmas and page cache, across requests
+            "CONN_MAX_AGE": 600,
+            "CONN_HEALTH_CHECKS": True,
+            # take the write lock when a transaction starts, waiting busy_timeout
+            # for it, instead of failing to upgrade a read lock in the middle
+            "OPTIONS": {"transaction_mode": "IMMEDIATE"},
+        }
+    )
+
+# shared by all processes, see core/sharedcache.py. Revocation markers must
+# outlive restarts and never be evicted: persist the redis data and keep its
+# default noeviction policy.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ["REDIS_URL"],
+    }
+}
@@ -27,6 +27,7 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/auth/", include("authentication.urls")),
     path("api/gigs/", include("gigs.urls")),
+    path("api/", include("core.urls")),
     # drf_spectacular endpoints
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
     path(
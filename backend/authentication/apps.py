@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class AuthConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "authentication"
+
+    def ready(self):
+        # registers the OpenAPI extension of the authentication classes
+        from authentication import schema  # noqa: F401
+
+        # revokes the tokens of users on changes, see authentication/revocation.py
+        from authentication import revocation  # noqa: F401
+        # keeps the revocation filter of the blacklist up to date
+        from authentication import blacklist  # noqa: F401
@@ -0,0 +1,76 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from authentication import revocation
+
+# user fields carried by the tokens, see CustomTokenObtainPairSerializer
+TOKEN_USER_FIELDS = ("default_role", "is_client", "is_agent")
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication building the user from the claims of the token, without
+    querying the database.
+
+    The user is a model instance whose other fields are deferred: the first one
+    touched loads all of them, in one query, so views reading only the roles,
+    like the IsClient and IsAgent permissions, never load the user. Instead of
+    checking the loaded user, tokens are checked against their revocation, see
+    authentication/revocation.py.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        revocation.check_token(validated_token)
+
+        values = {
+            api_settings.USER_ID_FIELD: user_id,
+            **{
+                field: validated_token[field]
+                for field in TOKEN_USER_FIELDS
+                if field in validated_token
+            },
+        }
+        fields = [
+            field
+            for field in self.user_model._meta.concrete_fields
+            if field.attname in values
+        ]
+        return self.user_model.from_db(
+            None,
+            [field.attname for field in fields],
+            [field.to_python(values[field.attname]) for field in fields],
+        )
+
+
+class AsyncJWTAuthentication(StatelessJWTAuthentication):
+    """
+    JWT authentication for async views, see core/asyncviews.py.
+
+    Authenticating statelessly queries nothing, so it runs in the event loop. The
+    deferred fields of the user are loaded synchronously, async views must not
+    touch them in the loop. Users of tokens missing role claims are loaded with
+    the async ORM.
+    """
+
+    async def aauthenticate(self, request):
+        user_auth_tuple = self.authenticate(request)
+        if user_auth_tuple is not None:
+            user = user_auth_tuple[0]
+            deferred = user.get_deferred_fields()
+            if deferred & set(TOKEN_USER_FIELDS):
+                try:
+                    await user.arefresh_from_db(fields=list(deferred))
+                except self.user_model.DoesNotExist as e:
+                    raise AuthenticationFailed(
+                        _("User not found"), code="user_not_found"
+                    ) from e
+        return user_auth_tuple
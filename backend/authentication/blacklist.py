@@ -0,0 +1,173 @@
+"""
+Refresh token blacklist: pruning and an in-process revocation filter.
+
+With rotation, every refresh blacklists the refresh token it used and issues a
+new outstanding one, and so does every logout, so the blacklist only grows.
+Expired tokens are rejected on their expiry alone, `prune_expired_tokens` deletes
+their rows, in batches, each batch being its own short transaction. Run it
+periodically with the prune_tokens command.
+
+Every refresh also checks its token against the blacklist. `RevocationFilter`
+answers most checks without querying:
+
+- a bloom filter of the tokens blacklisted when it was built, on the first check
+  of the process, which may answer "maybe", then checked in the database,
+- the exact set of the tokens blacklisted by this process since,
+- the tokens blacklisted by other processes, which are marked in the cache
+  until they expire. The cache is shared by all processes, see
+  core/sharedcache.py, a token blacklisted in one is rejected by all of them.
+
+It is rebuilt, dropping expired tokens, once the exact set is full.
+"""
+
+import hashlib
+import math
+import threading
+
+from django.core.cache import cache
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.tokens import RefreshToken
+
+# share of the tokens not blacklisted the bloom filter answers "maybe" for
+FALSE_POSITIVE_RATE = 0.001
+MIN_CAPACITY = 10_000
+# tokens blacklisted since the build kept exactly, before rebuilding
+EXACT_SET_LIMIT = 10_000
+
+
+def blacklisted_key(jti):
+    return f"auth:blacklisted:{jti}"
+
+
+class BloomFilter:
+    """
+    Set membership with false positives and no false negatives, in
+    `capacity * 1.44 * log2(1 / error_rate)` bits.
+    """
+
+    def __init__(self, capacity, error_rate=FALSE_POSITIVE_RATE):
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(round(self.size / capacity * math.log(2)), 1)
+        self.bits = bytearray(math.ceil(self.size / 8))
+
+    def positions(self, item):
+        # double hashing, the k positions derived from two 64-bit hashes
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, item):
+        for position in self.positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item):
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self.positions(item)
+        )
+
+
+class RevocationFilter:
+    """
+    The blacklisted refresh tokens, by jti.
+    """
+
+    def __init__(self, exact_set_limit=EXACT_SET_LIMIT):
+        self.exact_set_limit = exact_set_limit
+        self.lock = threading.Lock()
+        self.bloom = None
+        self.exact = set()
+
+    def build(self):
+        jtis = list(
+            BlacklistedToken.objects.filter(
+                token__expires_at__gt=timezone.now()
+            ).values_list("token__jti", flat=True)
+        )
+        bloom = BloomFilter(max(len(jtis) * 2, MIN_CAPACITY))
+        for jti in jtis:
+            bloom.add(jti)
+        self.bloom, self.exact = bloom, set()
+
+    def add(self, jti):
+        """
+        Add a token this process blacklisted.
+        """
+        with self.lock:
+            if self.bloom is None:
+                return  # built from the database on the first check
+            self.exact.add(jti)
+            if len(self.exact) > self.exact_set_limit:
+                self.bloom = None
+
+    def is_blacklisted(self, jti):
+        with self.lock:
+            if self.bloom is None:
+                self.build()
+            if jti in self.exact:
+                return True
+            maybe = jti in self.bloom
+
+        if maybe:
+            return BlacklistedToken.objects.filter(token__jti=jti).exists()
+        return cache.get(blacklisted_key(jti), False)
+
+
+revocation_filter = RevocationFilter()
+
+
+class FilteredRefreshToken(RefreshToken):
+    """
+    Refresh token checked against the revocation filter.
+    """
+
+    def check_blacklist(self):
+        if revocation_filter.is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def add_to_revocation_filter(sender, instance, created, raw, **kwargs):
+    if not created or raw:
+        return
+    # added before the commit, a rolled back blacklisting only rejects a token
+    # that is still valid, never the reverse
+    jti, expires_at = instance.token.jti, instance.token.expires_at
+    revocation_filter.add(jti)
+    timeout = (expires_at - timezone.now()).total_seconds()
+    if timeout > 0:
+        cache.set(blacklisted_key(jti), True, timeout)
+
+
+def prune_expired_tokens(now=None, batch_size=1000):
+    """
+    Delete the outstanding tokens that expired before `now`, and their blacklist
+    entries. Returns the number of deleted rows per model.
+    """
+    now = now or timezone.now()
+    deleted = {OutstandingToken._meta.label: 0, BlacklistedToken._meta.label: 0}
+    last_id = 0
+    while True:
+        # walks the primary key, expires_at has no index
+        token_ids = list(
+            OutstandingToken.objects.filter(pk__gt=last_id, expires_at__lte=now)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not token_ids:
+            break
+        last_id = token_ids[-1]
+        per_model = OutstandingToken.objects.filter(pk__in=token_ids).delete()[1]
+        for label, count in per_model.items():
+            deleted[label] += count
+    return deleted
@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from authentication import blacklist
+
+
+class Command(BaseCommand):
+    help = "Delete expired outstanding refresh tokens and their blacklist entries."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of tokens deleted per transaction.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, pruning every --interval seconds.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=3600,
+            help="Seconds between prunes in loop mode.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            deleted = blacklist.prune_expired_tokens(batch_size=options["batch_size"])
+            outstanding = deleted["token_blacklist.OutstandingToken"]
+            blacklisted = deleted["token_blacklist.BlacklistedToken"]
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Deleted {outstanding} outstanding tokens, "
+                    f"{blacklisted} blacklisted tokens."
+                )
+            )
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
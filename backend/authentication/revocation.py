@@ -0,0 +1,82 @@
+"""
+Revocation of the tokens of a user.
+
+Requests are authenticated from the claims of their access token, without
+loading the user, see `StatelessJWTAuthentication`. So a user's tokens are
+revoked when what they vouch for changes: when the user is deactivated or
+deleted, changes password, or their roles, which are claims, change. The time of
+the change is kept in the cache, which all processes share, see core/sharedcache.py,
+as long as a token issued before it may live, and tokens issued before it are
+rejected, access and refresh tokens alike. Logging in again issues tokens with up
+to date claims.
+
+Changes made with `QuerySet.update()` send no signals, revoke the tokens of the
+users explicitly with `revoke_tokens`.
+"""
+
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, pre_save
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+# the user fields tokens depend on
+REVOKING_FIELDS = ("password", "is_active", "is_client", "is_agent", "default_role")
+
+
+def revocation_key(user_id):
+    return f"auth:revoked:{user_id}"
+
+
+def revoke_tokens(user_id):
+    """
+    Revoke the tokens issued to the user until now.
+    """
+    lifetime = max(
+        api_settings.ACCESS_TOKEN_LIFETIME, api_settings.REFRESH_TOKEN_LIFETIME
+    )
+    cache.set(revocation_key(user_id), time.time(), lifetime.total_seconds())
+
+
+def check_token(token):
+    """
+    Raise AuthenticationFailed if the token was revoked.
+    """
+    user_id = token.get(api_settings.USER_ID_CLAIM)
+    if user_id is None:
+        return
+    revoked_at = cache.get(revocation_key(user_id))
+    # iat is in whole seconds, tokens issued within the second are revoked too
+    if revoked_at is not None and token.get("iat", 0) < revoked_at:
+        raise AuthenticationFailed(_("Token has been revoked."), code="token_revoked")
+
+
+@receiver(pre_save, sender=get_user_model())
+def revoke_tokens_on_change(sender, instance, raw, using, update_fields, **kwargs):
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and not set(update_fields) & set(REVOKING_FIELDS):
+        return
+
+    saved = (
+        sender._base_manager.using(using)
+        .filter(pk=instance.pk)
+        .values(*REVOKING_FIELDS)
+        .first()
+    )
+    if saved is not None and any(
+        saved[field] != getattr(instance, field) for field in REVOKING_FIELDS
+    ):
+        transaction.on_commit(lambda: revoke_tokens(instance.pk), using=using)
+
+
+@receiver(post_delete, sender=get_user_model())
+def revoke_tokens_on_delete(sender, instance, using, **kwargs):
+    # the instance has no primary key anymore once deleted
+    user_id = instance.pk
+    transaction.on_commit(lambda: revoke_tokens(user_id), using=using)
@@ -0,0 +1,30 @@
+from drf_spectacular.contrib.rest_framework_simplejwt import (
+    SimpleJWTScheme,
+    TokenRefreshSerializerExtension,
+)
+
+
+class StatelessJWTScheme(SimpleJWTScheme):
+    """
+    Document StatelessJWTAuthentication like the JWTAuthentication it extends.
+    """
+
+    target_class = "authentication.authentication.StatelessJWTAuthentication"
+
+
+class AsyncJWTScheme(SimpleJWTScheme):
+    """
+    Document AsyncJWTAuthentication like the JWTAuthentication it extends.
+    """
+
+    target_class = "authentication.authentication.AsyncJWTAuthentication"
+    name = "asyncJwtAuth"
+
+
+class CustomTokenRefreshSerializerScheme(TokenRefreshSerializerExtension):
+    """
+    Document CustomTokenRefreshSerializer like the TokenRefreshSerializer it
+    extends.
+    """
+
+    target_class = "authentication.serializers.CustomTokenRefreshSerializer"
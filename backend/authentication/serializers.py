@@ -1,5 +1,11 @@
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+
+from authentication import revocation
+from authentication.blacklist import FilteredRefreshToken
 
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
@@ -22,6 +28,21 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         return token
 
 
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Token refresh serializer rejecting revoked refresh tokens, whose claims may
+    be out of date, see authentication/revocation.py, and checking the blacklist
+    through the revocation filter, see authentication/blacklist.py.
+    """
+
+    token_class = FilteredRefreshToken
+
+    def validate(self, attrs):
+        # super() verifies the token, checking the blacklist again is a query
+        revocation.check_token(self.token_class(attrs["refresh"], verify=False))
+        return super().validate(attrs)
+
+
 class LogoutSerializer(serializers.Serializer):
     """
     Serializer for logging out a user. Ensures that the refresh token is provided.
@@ -0,0 +1,130 @@
+import tempfile
+import time
+
+from django.core.cache import cache, caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+
+from authentication import revocation
+from authentication.authentication import StatelessJWTAuthentication
+from authentication.serializers import CustomTokenObtainPairSerializer
+from core.testing import file_based_caches
+from users.models import CustomUser
+from users.tests.factories import UserFactory
+
+
+def bearer(token):
+    return {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+
+class StatelessJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.user = UserFactory(default_role="client", is_client=True)
+        self.token = CustomTokenObtainPairSerializer.get_token(self.user).access_token
+
+    def authenticate(self, token=None):
+        request = APIRequestFactory().get("/", **bearer(token or self.token))
+        return StatelessJWTAuthentication().authenticate(request)[0]
+
+    def test_user_is_built_from_the_token(self):
+        with self.assertNumQueries(0):
+            user = self.authenticate()
+            self.assertIsInstance(user, CustomUser)
+            self.assertEqual(user.pk, self.user.pk)
+            self.assertTrue(user.is_authenticated)
+            self.assertTrue(user.is_client)
+            self.assertFalse(user.is_agent)
+            self.assertEqual(user.default_role, "client")
+
+    def test_other_fields_are_loaded_together(self):
+        user = self.authenticate()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(user.email, self.user.email)
+            self.assertEqual(user.full_name, self.user.full_name)
+            self.assertTrue(user.is_active)
+
+    def test_deactivating_revokes_tokens(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_role_changes_revoke_tokens(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_agent = True
+            self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_deleting_revokes_tokens(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_other_changes_keep_tokens(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.full_name = "Renamed User"
+            self.user.save()
+
+        self.assertEqual(self.authenticate().pk, self.user.pk)
+
+    def test_tokens_issued_after_revocation_are_accepted(self):
+        cache.set(revocation.revocation_key(self.user.pk), time.time() - 10)
+        self.assertEqual(self.authenticate().pk, self.user.pk)
+
+        revocation.revoke_tokens(self.user.pk)
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_revocations_are_seen_by_other_processes(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        shared = file_based_caches(directory.name)
+
+        # the user is deactivated in one process, and authenticates in another
+        with override_settings(CACHES=shared):
+            revoking_cache = caches["default"]
+            with self.captureOnCommitCallbacks(execute=True):
+                self.user.is_active = False
+                self.user.save()
+        with override_settings(CACHES=shared):
+            self.assertIsNot(caches["default"], revoking_cache)
+            with self.assertRaises(AuthenticationFailed):
+                self.authenticate()
+
+
+class StatelessJWTAuthenticationViewTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.user = UserFactory(default_role="agent", is_agent=True)
+        self.refresh = CustomTokenObtainPairSerializer.get_token(self.user)
+
+    def test_role_checks_do_not_load_the_user(self):
+        # the agent's applications, without authenticating the user
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse("agent-applications"), **bearer(self.refresh.access_token)
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_revoked_refresh_tokens_are_rejected(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_client = True
+            self.user.save()
+
+        response = self.client.post(reverse("refresh"), {"refresh": str(self.refresh)})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
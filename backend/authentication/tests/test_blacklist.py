@@ -0,0 +1,155 @@
+import tempfile
+import uuid
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from authentication import blacklist
+from authentication.serializers import CustomTokenObtainPairSerializer
+from core.testing import file_based_caches
+from users.tests.factories import UserFactory
+
+
+def outstanding_token(expires_in=timedelta(days=1), blacklisted=False):
+    token = OutstandingToken.objects.create(
+        jti=uuid.uuid4().hex, token="token", expires_at=timezone.now() + expires_in
+    )
+    if blacklisted:
+        BlacklistedToken.objects.create(token=token)
+    return token
+
+
+class BloomFilterTests(SimpleTestCase):
+    def test_added_items_are_contained(self):
+        bloom = blacklist.BloomFilter(1000)
+        items = [uuid.uuid4().hex for _ in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        self.assertTrue(all(item in bloom for item in items))
+
+    def test_false_positives_stay_rare(self):
+        bloom = blacklist.BloomFilter(1000, error_rate=0.01)
+        for _ in range(1000):
+            bloom.add(uuid.uuid4().hex)
+
+        false_positives = sum(uuid.uuid4().hex in bloom for _ in range(10_000))
+        self.assertLess(false_positives, 300)
+
+
+class RevocationFilterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.blacklisted = outstanding_token(blacklisted=True)
+        self.filter = blacklist.RevocationFilter()
+        self.filter.build()
+
+    def test_tokens_blacklisted_before_the_build_are_checked_in_the_database(self):
+        with self.assertNumQueries(1):
+            self.assertTrue(self.filter.is_blacklisted(self.blacklisted.jti))
+
+    def test_other_tokens_are_not_checked_in_the_database(self):
+        with self.assertNumQueries(0):
+            self.assertFalse(self.filter.is_blacklisted(uuid.uuid4().hex))
+
+    def test_tokens_blacklisted_since_the_build_are_known(self):
+        token = outstanding_token()
+        # the signal adds the token to the filter of the process
+        blacklist.revocation_filter, original = self.filter, blacklist.revocation_filter
+        try:
+            BlacklistedToken.objects.create(token=token)
+        finally:
+            blacklist.revocation_filter = original
+
+        cache.clear()
+        with self.assertNumQueries(0):
+            self.assertTrue(self.filter.is_blacklisted(token.jti))
+
+    def test_tokens_blacklisted_by_other_processes_are_known(self):
+        # blacklisted by the process-wide filter, not by this one
+        token = outstanding_token(blacklisted=True)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(self.filter.is_blacklisted(token.jti))
+
+    def test_blacklisting_is_seen_through_other_cache_instances(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        shared = file_based_caches(directory.name)
+        token = outstanding_token()
+
+        # rotated in one process, replayed against this one
+        with override_settings(CACHES=shared):
+            blacklisting_cache = caches["default"]
+            BlacklistedToken.objects.create(token=token)
+        with override_settings(CACHES=shared):
+            self.assertIsNot(caches["default"], blacklisting_cache)
+            with self.assertNumQueries(0):
+                self.assertTrue(self.filter.is_blacklisted(token.jti))
+
+    def test_full_exact_set_rebuilds(self):
+        self.filter.exact_set_limit = 1
+        self.filter.add(uuid.uuid4().hex)
+        self.filter.add(uuid.uuid4().hex)
+
+        with self.assertNumQueries(1):
+            self.filter.is_blacklisted(uuid.uuid4().hex)
+
+
+class RefreshBlacklistTests(APITestCase):
+    def setUp(self):
+        self.refresh = CustomTokenObtainPairSerializer.get_token(UserFactory())
+
+    def refresh_token(self, token):
+        return self.client.post(reverse("refresh"), {"refresh": str(token)})
+
+    def test_rotated_tokens_are_rejected(self):
+        self.assertEqual(
+            self.refresh_token(self.refresh).status_code, status.HTTP_200_OK
+        )
+
+        response = self.refresh_token(self.refresh)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.data["detail"], "Token is blacklisted")
+
+
+class PruneTokensTests(TestCase):
+    def test_expired_tokens_are_deleted_in_batches(self):
+        expired = [outstanding_token(timedelta(days=-1)) for _ in range(3)]
+        outstanding_token(timedelta(days=-1), blacklisted=True)
+        valid = outstanding_token(blacklisted=True)
+
+        deleted = blacklist.prune_expired_tokens(batch_size=2)
+
+        self.assertEqual(
+            deleted,
+            {
+                "token_blacklist.OutstandingToken": 4,
+                "token_blacklist.BlacklistedToken": 1,
+            },
+        )
+        self.assertFalse(OutstandingToken.objects.filter(pk=expired[0].pk).exists())
+        self.assertEqual(list(OutstandingToken.objects.all()), [valid])
+        self.assertEqual(BlacklistedToken.objects.get().token, valid)
+
+    def test_command(self):
+        outstanding_token(timedelta(days=-1), blacklisted=True)
+        out = StringIO()
+
+        call_command("prune_tokens", stdout=out)
+
+        self.assertIn(
+            "Deleted 1 outstanding tokens, 1 blacklisted tokens.", out.getvalue()
+        )
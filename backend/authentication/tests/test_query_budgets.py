@@ -0,0 +1,66 @@
+from authentication.serializers import CustomTokenObtainPairSerializer
+from core.testing import QueryBudgetTestMixin
+from core.tests.factories import LocationFactory
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from users.models import CustomUser
+
+
+class AuthenticationQueryBudgetTests(QueryBudgetTestMixin, APITestCase):
+    """
+    Check the authentication endpoints against their query budgets.
+    """
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            email="budget@example.com",
+            password="testpassword",
+            full_name="Budget User",
+            location=LocationFactory(),
+            default_role="client",
+            is_client=True,
+        )
+
+    def test_register(self):
+        data = {
+            "email": "new@example.com",
+            "password": "testpassword",
+            "confirm_password": "testpassword",
+            "full_name": "New User",
+            "location": {
+                "city": "Test City",
+                "state_region": "Test State",
+                "country": "Test Country",
+            },
+            "default_role": "agent",
+            "preferred_labels": ["wedding", "party"],
+        }
+        # taggit resolves and adds the preferred labels one by one
+        with self.assertWithinQueryBudget(
+            "register", allow_repeated=("taggit_tag", "gigs_uuidtaggeditem")
+        ):
+            response = self.client.post(reverse("register"), data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_login(self):
+        data = {"email": "budget@example.com", "password": "testpassword"}
+        with self.assertWithinQueryBudget("login"):
+            response = self.client.post(reverse("login"), data)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_refresh(self):
+        refresh = CustomTokenObtainPairSerializer.get_token(self.user)
+        # simplejwt loads the user and the outstanding token more than once
+        with self.assertWithinQueryBudget(
+            "refresh", allow_repeated=("users", "token_blacklist")
+        ):
+            response = self.client.post(reverse("refresh"), {"refresh": str(refresh)})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_logout(self):
+        refresh = CustomTokenObtainPairSerializer.get_token(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+        with self.assertWithinQueryBudget("logout", allow_repeated=("users",)):
+            response = self.client.post(reverse("logout"), {"refresh": str(refresh)})
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
@@ -1,10 +1,11 @@
+from authentication.blacklist import FilteredRefreshToken
 from authentication.serializers import CustomTokenObtainPairSerializer, LogoutSerializer
+from core import replicas
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.exceptions import TokenError
-from rest_framework_simplejwt.tokens import RefreshToken
 from users.serializers import UserSerializer
 
 
@@ -18,6 +19,8 @@ class RegisterUserView(APIView):
         serializer = UserSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.save()
+            # the user's next requests must find them, replicas may not yet
+            replicas.pin_user(user.pk)
 
             # log in user and return access and refresh tokens
             refresh = CustomTokenObtainPairSerializer.get_token(user)
@@ -56,7 +59,7 @@ class LogoutView(APIView):
         if serializer.is_valid(raise_exception=True):
             refresh_token = serializer.validated_data["refresh"]
             try:
-                token = RefreshToken(refresh_token)
+                token = FilteredRefreshToken(refresh_token)
                 token.blacklist()
 
                 return Response(status=status.HTTP_204_NO_CONTENT)
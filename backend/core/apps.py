@@ -4,3 +4,13 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        # records queries on connections opened from now on
+        from core import querybudget  # noqa: F401
+        # applies the SQLITE_PRAGMAS setting to new connections
+        from core import sqlite  # noqa: F401
+        # revocations and replica state must be seen by every process
+        from core.sharedcache import check_shared_cache
+
+        check_shared_cache()
@@ -0,0 +1,111 @@
+"""
+Async DRF views.
+
+DRF views are synchronous, so under ASGI Django runs each request's view in a
+thread, which is held for the whole request, database waits included. Views here
+are coroutines running on the event loop:
+
+- authentication classes with an `aauthenticate(request)` method, like
+  `AsyncJWTAuthentication`, load the user with the async ORM,
+- permissions and throttles are checked in the loop, so they must not query the
+  database,
+- responses are rendered in the loop, Django would render them in a thread.
+
+Django's async ORM runs each query in a thread as well, what is saved is the
+thread between queries. Code paths that are only synchronous, serializer saves
+and model methods with signals, are run in a single `sync_to_async` call each.
+"""
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from rest_framework import exceptions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose handlers are coroutines.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await self.ainitial(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if not isinstance(response, HttpResponse):
+                # handlers are coroutines, options() and errors are not
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.render_response(self.response)
+
+    async def ainitial(self, request, *args, **kwargs):
+        """
+        Async version of `initial()`.
+        """
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+
+        neg = self.perform_content_negotiation(request)
+        request.accepted_renderer, request.accepted_media_type = neg
+
+        version, scheme = self.determine_version(request, *args, **kwargs)
+        request.version, request.versioning_scheme = version, scheme
+
+        await self.aperform_authentication(request)
+        self.check_permissions(request)
+        self.check_throttles(request)
+
+    async def aperform_authentication(self, request):
+        """
+        Authenticate the request like `Request._authenticate()`, awaiting the
+        authenticators' `aauthenticate()` when they have one.
+        """
+        for authenticator in request.authenticators:
+            try:
+                if hasattr(authenticator, "aauthenticate"):
+                    user_auth_tuple = await authenticator.aauthenticate(request)
+                else:
+                    user_auth_tuple = await sync_to_async(authenticator.authenticate)(
+                        request
+                    )
+            except exceptions.APIException:
+                request._not_authenticated()
+                raise
+
+            if user_auth_tuple is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth_tuple
+                return
+
+        request._not_authenticated()
+
+    def render_response(self, response):
+        """
+        Render a DRF response into a plain HttpResponse.
+        """
+        if not isinstance(response, Response):
+            return response
+
+        response.render()
+        rendered = HttpResponse(response.content, status=response.status_code)
+        for header, value in response.items():
+            rendered[header] = value
+        rendered.cookies = response.cookies
+        return rendered
@@ -0,0 +1,352 @@
+"""
+End-to-end API benchmarks.
+
+Requests are sent to the real URL routes through Django's WSGI or ASGI handler
+in-process, with the test client, so every middleware, authentication class,
+serializer and query of a request is measured without network noise.
+
+`ApiBenchmark` times each endpoint on its own, one request at a time, in the order
+of a client's journey: register, log in, refresh the token, then create, review,
+edit and publish gigs. `ConcurrencyBenchmark` sends requests from many concurrent
+connections and measures throughput.
+"""
+
+import asyncio
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.db import connection, connections
+from django.db.backends.base.creation import TEST_DATABASE_PREFIX
+from django.test import AsyncClient, Client
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.urls import reverse
+from django.utils import timezone
+
+from core.querybudget import record_queries
+
+PASSWORD = "benchmark-password"
+
+ENDPOINTS = ("register", "login", "refresh", "create", "review", "edit", "publish")
+
+
+def percentile(values, percent):
+    """
+    Return the nearest-rank percentile of the values.
+    """
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(latencies, queries):
+    """
+    Return the statistics of an endpoint from its request latencies, in seconds,
+    and query counts.
+    """
+    total = sum(latencies)
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "throughput_rps": round(len(latencies) / total, 1) if total else None,
+        "queries": round(sum(queries) / len(queries), 1),
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Return the regressions of the results against a baseline: endpoints whose p95
+    latency grew by more than `threshold`, a fraction, or that run more queries.
+    """
+    regressions = []
+    for name, stats in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if stats["p95_ms"] > before["p95_ms"] * (1 + threshold):
+            regressions.append(
+                f"{name}: p95 {stats['p95_ms']} ms, baseline {before['p95_ms']} ms"
+            )
+        if stats["queries"] > before["queries"]:
+            regressions.append(
+                f"{name}: {stats['queries']} queries, baseline {before['queries']}"
+            )
+    return regressions
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+def is_test_database(connection):
+    """
+    Return whether the connection uses a test database: an in-memory database,
+    its TEST NAME or a name with the test prefix.
+    """
+    name = os.fspath(connection.settings_dict["NAME"])
+    return (
+        name == ":memory:"
+        or "mode=memory" in name
+        or name == connection.settings_dict["TEST"]["NAME"]
+        or os.path.basename(name).startswith(TEST_DATABASE_PREFIX)
+    )
+
+
+@contextmanager
+def benchmark_database(current_database=False):
+    """
+    Run the block on a throwaway test database, or on the configured database as
+    is with `current_database`. The benchmark data is never removed, so the
+    configured database must be a test database.
+    """
+    if current_database:
+        if not is_test_database(connection):
+            raise BenchmarkError(
+                f"{connection.settings_dict['NAME']} is not a test database, the "
+                "benchmark would leave its data there."
+            )
+        yield
+        return
+
+    setup_test_environment(debug=False)
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+class ApiBenchmark:
+    """
+    Drive the API endpoints and collect their latencies and query counts.
+
+    `login_email` is an existing client account with the benchmark password.
+    """
+
+    def __init__(self, login_email, requests, asgi=False):
+        self.login_email = login_email
+        self.requests = requests
+        self.asgi = asgi
+        self.client = AsyncClient() if asgi else Client()
+
+    def run(self):
+        """
+        Return the statistics of each endpoint, in journey order.
+        """
+        if self.asgi:
+            return asyncio.run(self._run_async())
+
+        results = {}
+        self.gig_ids = []
+        for name in ENDPOINTS:
+            latencies, queries = [], []
+            for index in range(self.requests):
+                method, path, data, expected_status = self.request(name, index)
+                with record_queries() as recorder:
+                    start = time.perf_counter()
+                    response = getattr(self.client, method)(
+                        path,
+                        data,
+                        content_type="application/json",
+                        headers=self.headers,
+                    )
+                    latencies.append(time.perf_counter() - start)
+                queries.append(recorder.count)
+                self.check(name, response, expected_status)
+            results[name] = summarize(latencies, queries)
+        return results
+
+    async def _run_async(self):
+        results = {}
+        self.gig_ids = []
+        for name in ENDPOINTS:
+            latencies, queries = [], []
+            for index in range(self.requests):
+                method, path, data, expected_status = self.request(name, index)
+                with record_queries() as recorder:
+                    start = time.perf_counter()
+                    response = await getattr(self.client, method)(
+                        path,
+                        data,
+                        content_type="application/json",
+                        headers=self.headers,
+                    )
+                    latencies.append(time.perf_counter() - start)
+                queries.append(recorder.count)
+                self.check(name, response, expected_status)
+            results[name] = summarize(latencies, queries)
+        return results
+
+    @property
+    def headers(self):
+        if getattr(self, "access", None):
+            return {"Authorization": f"Bearer {self.access}"}
+        return {}
+
+    def check(self, name, response, expected_status):
+        if response.status_code != expected_status:
+            raise BenchmarkError(
+                f"{name} returned {response.status_code}, expected "
+                f"{expected_status}: {response.content[:500]!r}"
+            )
+
+        data = response.json() if response.content else {}
+        if name == "login":
+            self.access, self.refresh = data["access"], data["refresh"]
+        elif name == "refresh":
+            # refresh tokens are rotated, the next refresh uses the new one
+            self.access, self.refresh = data["access"], data["refresh"]
+        elif name == "create":
+            self.gig_ids.append(data["id"])
+
+    def gig_data(self, index):
+        start = timezone.now() + timedelta(days=30, hours=index)
+        return {
+            "title": f"Benchmark gig {index}",
+            "description": "A benchmark gig description, long enough to be valid.",
+            "eventLabel": ["conference", "wedding", f"benchmark {index % 20}"],
+            "locationType": "physical",
+            "venue": {
+                "googlePlaceId": f"benchmark-place-{index % 50}",
+                "name": f"Benchmark venue {index % 50}",
+                "address": "1 Benchmark Street",
+                "location": {
+                    "city": "Nairobi",
+                    "stateRegion": "Nairobi",
+                    "country": "Kenya",
+                },
+            },
+            "startDatetime": start.isoformat(),
+            "endDatetime": (start + timedelta(hours=2)).isoformat(),
+            "compensation": "150.00",
+        }
+
+    def request(self, name, index):
+        """
+        Return the method, path, payload and expected status of a request.
+        """
+        if name == "register":
+            self.access = None
+            return (
+                "post",
+                reverse("register"),
+                {
+                    "email": f"benchmark-register-{index}@example.com",
+                    "password": PASSWORD,
+                    "confirmPassword": PASSWORD,
+                    "fullName": f"Registered {index}",
+                    "location": {
+                        "city": "Nairobi",
+                        "stateRegion": "Nairobi",
+                        "country": "Kenya",
+                    },
+                    "defaultRole": "agent" if index % 2 else "client",
+                },
+                201,
+            )
+        if name == "login":
+            return (
+                "post",
+                reverse("login"),
+                {"email": self.login_email, "password": PASSWORD},
+                200,
+            )
+        if name == "refresh":
+            return "post", reverse("refresh"), {"refresh": self.refresh}, 200
+        if name == "create":
+            return "post", reverse("gig-create"), self.gig_data(index), 201
+
+        gig_id = self.gig_ids[index]
+        if name == "review":
+            return "get", reverse("gig-client-review", args=[gig_id]), None, 200
+        if name == "edit":
+            data = {**self.gig_data(index), "title": f"Edited benchmark gig {index}"}
+            return "put", reverse("gig-update", args=[gig_id]), data, 200
+        return "post", reverse("gig-publish", args=[gig_id]), None, 200
+
+
+class ConcurrencyBenchmark:
+    """
+    Send GET requests to `paths` from `concurrency` concurrent connections and
+    measure the throughput.
+
+    Under WSGI each connection is served by its own thread, like a threaded WSGI
+    server. Under ASGI all connections are served concurrently on one event loop,
+    like uvicorn, without the sockets.
+    """
+
+    def __init__(self, paths, headers, requests, concurrency):
+        self.paths = paths
+        self.headers = headers
+        self.requests = requests
+        self.concurrency = concurrency
+
+    def path(self, index):
+        return self.paths[index % len(self.paths)]
+
+    def connection_requests(self, connection_index):
+        # requests are spread over the connections round robin
+        return range(connection_index, self.requests, self.concurrency)
+
+    def run_wsgi(self):
+        def serve(connection_index):
+            client = Client()
+            latencies = []
+            try:
+                for index in self.connection_requests(connection_index):
+                    start = time.perf_counter()
+                    response = client.get(self.path(index), headers=self.headers)
+                    latencies.append(time.perf_counter() - start)
+                    self.check(response)
+            finally:
+                connections.close_all()
+            return latencies
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            results = list(executor.map(serve, range(self.concurrency)))
+        return self.summarize(results, time.perf_counter() - start)
+
+    def run_asgi(self):
+        return asyncio.run(self._run_asgi())
+
+    async def _run_asgi(self):
+        async def serve(connection_index):
+            client = AsyncClient()
+            latencies = []
+            for index in self.connection_requests(connection_index):
+                start = time.perf_counter()
+                response = await client.get(self.path(index), headers=self.headers)
+                latencies.append(time.perf_counter() - start)
+                self.check(response)
+            return latencies
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(serve(index) for index in range(self.concurrency))
+        )
+        return self.summarize(results, time.perf_counter() - start)
+
+    def check(self, response):
+        if response.status_code != 200:
+            raise BenchmarkError(
+                f"GET returned {response.status_code}: {response.content[:500]!r}"
+            )
+
+    def summarize(self, results, elapsed):
+        latencies = [latency for latencies in results for latency in latencies]
+        return {
+            "requests": len(latencies),
+            "concurrency": self.concurrency,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+            "throughput_rps": round(len(latencies) / elapsed, 1),
+        }
@@ -0,0 +1,125 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core import benchmark
+from gigs.seeding import Seeder
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the API end to end: seed a dataset, send requests to the real "
+        "routes in-process and report latency percentiles, throughput and query "
+        "counts per endpoint. Runs on a throwaway test database by default."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--gigs", type=int, default=100_000)
+        parser.add_argument("--users", type=int, default=20_000)
+        parser.add_argument("--venues", type=int, default=5_000)
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=200,
+            help="Number of timed requests per endpoint.",
+        )
+        parser.add_argument(
+            "--asgi",
+            action="store_true",
+            help="Send requests through the ASGI handler instead of WSGI.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--output", help="Write the results to this JSON file, e.g. a baseline."
+        )
+        parser.add_argument(
+            "--baseline", help="Compare the results with this JSON baseline."
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="Allowed p95 latency growth over the baseline, as a fraction.",
+        )
+        parser.add_argument(
+            "--current-database",
+            action="store_true",
+            help=(
+                "Use the configured database as is instead of a throwaway one. "
+                "Only test databases are accepted, the data is left in place."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1:
+            raise CommandError("--requests must be at least 1.")
+
+        try:
+            with benchmark.benchmark_database(options["current_database"]):
+                login_email = self.seed(options)
+                results = benchmark.ApiBenchmark(
+                    login_email, options["requests"], asgi=options["asgi"]
+                ).run()
+        except benchmark.BenchmarkError as error:
+            raise CommandError(str(error))
+
+        self.report(results)
+        report = {
+            "configuration": {
+                "gigs": options["gigs"],
+                "users": options["users"],
+                "venues": options["venues"],
+                "requests": options["requests"],
+                "seed": options["seed"],
+                "interface": "asgi" if options["asgi"] else "wsgi",
+            },
+            "endpoints": results,
+        }
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                json.dump(report, file, indent=2)
+            self.stdout.write(f"Results written to {options['output']}.")
+
+        if options["baseline"]:
+            with open(options["baseline"]) as file:
+                baseline = json.load(file)
+            # caches warm up over the requests, counts depend on the configuration
+            if baseline["configuration"] != report["configuration"]:
+                raise CommandError(
+                    "The baseline was recorded with another configuration: "
+                    f"{baseline['configuration']}"
+                )
+            regressions = benchmark.compare(
+                results, baseline["endpoints"], options["threshold"]
+            )
+            if regressions:
+                raise CommandError(
+                    "Regressions against the baseline:\n" + "\n".join(regressions)
+                )
+            self.stdout.write(
+                self.style.SUCCESS("No regressions against the baseline.")
+            )
+
+    def report(self, results):
+        self.stdout.write(
+            f"{'endpoint':<10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+            f"{'req/s':>10}{'queries':>10}"
+        )
+        for name, stats in results.items():
+            self.stdout.write(
+                f"{name:<10}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}"
+                f"{stats['p99_ms']:>10.2f}{stats['throughput_rps']:>10.1f}"
+                f"{stats['queries']:>10.1f}"
+            )
+
+    def seed(self, options):
+        """
+        Seed the dataset. Returns the email of a client the requests are sent as.
+        """
+        users = Seeder(seed=options["seed"], password=benchmark.PASSWORD).seed(
+            users=options["users"],
+            locations=max(options["venues"] // 10, 1),
+            venues=options["venues"],
+            gigs=options["gigs"],
+        )
+        return next(user.email for user in users if user.is_client)
@@ -0,0 +1,111 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from authentication.serializers import CustomTokenObtainPairSerializer
+from core import benchmark
+from gigs.models import Gig
+from gigs.seeding import Seeder
+
+# the gig review under each interface, its sync view under WSGI and its async view
+# under ASGI
+INTERFACES = {
+    "wsgi": "gig-client-review",
+    "asgi": "async-gig-client-review",
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the throughput of gig reviews from many concurrent connections, "
+        "the sync view under WSGI against the async view under ASGI. Runs on a "
+        "throwaway test database by default."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--gigs", type=int, default=10_000)
+        parser.add_argument("--users", type=int, default=2_000)
+        parser.add_argument("--venues", type=int, default=500)
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=2_000,
+            help="Number of requests per interface.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=200,
+            help="Number of concurrent connections.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--output", help="Write the results to this JSON file.")
+        parser.add_argument(
+            "--current-database",
+            action="store_true",
+            help=(
+                "Use the configured database as is instead of a throwaway one. "
+                "Only test databases are accepted, the data is left in place."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if options["gigs"] < 1:
+            raise CommandError("--gigs must be at least 1.")
+        if options["requests"] < options["concurrency"]:
+            raise CommandError("--requests must be at least --concurrency.")
+
+        results = {}
+        try:
+            with benchmark.benchmark_database(options["current_database"]):
+                Seeder(seed=options["seed"], password=benchmark.PASSWORD).seed(
+                    users=options["users"],
+                    locations=max(options["venues"] // 10, 1),
+                    venues=options["venues"],
+                    gigs=options["gigs"],
+                )
+                client = Gig.objects.order_by("pk").first().client
+                gig_ids = list(
+                    Gig.objects.filter(client=client).values_list("pk", flat=True)
+                )
+                token = CustomTokenObtainPairSerializer.get_token(client).access_token
+                headers = {"Authorization": f"Bearer {token}"}
+
+                for interface, url_name in INTERFACES.items():
+                    concurrency = benchmark.ConcurrencyBenchmark(
+                        [reverse(url_name, args=[gig_id]) for gig_id in gig_ids],
+                        headers,
+                        options["requests"],
+                        options["concurrency"],
+                    )
+                    run = getattr(concurrency, f"run_{interface}")
+                    results[interface] = run()
+        except benchmark.BenchmarkError as error:
+            raise CommandError(str(error))
+
+        self.stdout.write(
+            f"{'interface':<10}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        )
+        for interface, stats in results.items():
+            self.stdout.write(
+                f"{interface:<10}{stats['throughput_rps']:>10.1f}"
+                f"{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}"
+                f"{stats['p99_ms']:>10.2f}"
+            )
+
+        if options["output"]:
+            report = {
+                "configuration": {
+                    "gigs": options["gigs"],
+                    "users": options["users"],
+                    "venues": options["venues"],
+                    "requests": options["requests"],
+                    "concurrency": options["concurrency"],
+                    "seed": options["seed"],
+                },
+                "interfaces": results,
+            }
+            with open(options["output"], "w") as file:
+                json.dump(report, file, indent=2)
+            self.stdout.write(f"Results written to {options['output']}.")
@@ -0,0 +1,75 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core import sqlite
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark SQLite write throughput with concurrent readers, under the "
+        "default and the tuned profile, on a throwaway database file."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10_000)
+        parser.add_argument(
+            "--readers",
+            type=int,
+            default=4,
+            help="Number of reading connections.",
+        )
+        parser.add_argument(
+            "--writers",
+            type=int,
+            default=4,
+            help="Number of writing connections.",
+        )
+        parser.add_argument(
+            "--transactions",
+            type=int,
+            default=100,
+            help="Number of write transactions per writer.",
+        )
+        parser.add_argument(
+            "--think",
+            type=float,
+            default=0.001,
+            help="Seconds spent between a transaction's read and its writes.",
+        )
+        parser.add_argument("--output", help="Write the results to this JSON file.")
+
+    def handle(self, *args, **options):
+        if options["writers"] < 1 or options["transactions"] < 1:
+            raise CommandError("--writers and --transactions must be at least 1.")
+
+        results = sqlite.WriteBenchmark(
+            options["rows"],
+            options["readers"],
+            options["writers"],
+            options["transactions"],
+            think=options["think"],
+        ).run()
+
+        self.stdout.write(
+            f"{'profile':<10}{'writes/s':>10}{'committed':>11}{'locked':>10}"
+            f"{'reads/s':>10}"
+        )
+        for profile, stats in results.items():
+            self.stdout.write(
+                f"{profile:<10}{stats['writes_per_second']:>10.1f}"
+                f"{stats['committed']:>11}{stats['locked']:>10}"
+                f"{stats['reads_per_second']:>10.1f}"
+            )
+
+        if options["output"]:
+            report = {
+                "configuration": {
+                    name: options[name]
+                    for name in ("rows", "readers", "writers", "transactions", "think")
+                },
+                "profiles": results,
+            }
+            with open(options["output"], "w") as file:
+                json.dump(report, file, indent=2)
+            self.stdout.write(f"Results written to {options['output']}.")
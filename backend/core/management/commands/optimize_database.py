@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from core import sqlite
+
+
+class Command(BaseCommand):
+    help = (
+        "Refresh the query planner statistics of a SQLite database with "
+        "PRAGMA optimize."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to optimize.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, optimizing every --interval seconds.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=3600,
+            help="Seconds between optimizations in loop mode.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            if not sqlite.optimize(options["database"]):
+                raise CommandError(f"{options['database']} is not a SQLite database.")
+            self.stdout.write(
+                self.style.SUCCESS(f"Optimized the {options['database']} database.")
+            )
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core import startup
+
+DEFAULT_PACKAGES = ["gigs", "users", "drf_spectacular", "taggit"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Report the import time of packages during a worker's startup, Django's "
+        "setup and the URLconf, measured in a fresh interpreter."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "packages",
+            nargs="*",
+            default=DEFAULT_PACKAGES,
+            help="Top-level packages to report.",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=10,
+            help="Number of slowest modules to list.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            times = startup.profile_imports()
+        except startup.StartupError as error:
+            raise CommandError(f"Startup failed:\n{error}")
+
+        packages = startup.package_times(times)
+        total = sum(packages.values())
+
+        self.stdout.write(f"{'package':<30}{'ms':>10}{'share':>10}")
+        for package in options["packages"]:
+            self.stdout.write(self.row(package, packages[package], total))
+        self.stdout.write(self.row("total", total, total))
+
+        if options["top"] > 0:
+            self.stdout.write("")
+            self.stdout.write(f"{'slowest modules, self time':<30}{'ms':>10}")
+            slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)
+            for name, (self_time, _) in slowest[: options["top"]]:
+                self.stdout.write(f"{name:<30}{self_time / 1000:>10.1f}")
+
+    def row(self, name, microseconds, total):
+        share = microseconds / total if total else 0
+        return f"{name:<30}{microseconds / 1000:>10.1f}{share:>10.1%}"
@@ -0,0 +1,42 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core import replicas
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy the default SQLite database into its replicas with the online "
+        "backup API."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, syncing every --interval seconds.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Seconds between syncs in loop mode.",
+        )
+
+    def handle(self, *args, **options):
+        if not settings.DATABASE_REPLICAS:
+            raise CommandError("No replicas are configured in DATABASE_REPLICAS.")
+
+        while True:
+            for alias in settings.DATABASE_REPLICAS:
+                replicas.sync_replica(alias)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Synced {len(settings.DATABASE_REPLICAS)} replicas."
+                )
+            )
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,34 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import underscoreize
+
+
+class CamelCaseQueryMiddleware:
+    """
+    Turn camelCase query parameters into snake_case, like
+    `djangorestframework_camel_case.middleware.CamelCaseMiddleWare`.
+
+    That middleware is sync only, so under ASGI every request, async views
+    included, would be run in a thread. This one runs natively under both.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        self.underscoreize_query(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        self.underscoreize_query(request)
+        return await self.get_response(request)
+
+    def underscoreize_query(self, request):
+        request.GET = underscoreize(request.GET, **api_settings.JSON_UNDERSCOREIZE)
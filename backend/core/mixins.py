@@ -0,0 +1,120 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def make_validators(version, last_modified):
+    """
+    Return the ETag and Last-Modified timestamp, or None, of a resource version.
+    """
+    digest = hashlib.md5(
+        "|".join(str(value) for value in version).encode(), usedforsecurity=False
+    ).hexdigest()
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    return quote_etag(digest), timestamp
+
+
+def set_validator_headers(response, etag, timestamp):
+    response.headers["ETag"] = etag
+    if timestamp is not None:
+        response.headers["Last-Modified"] = http_date(timestamp)
+
+
+class ConditionalGetMixin:
+    """
+    Answer conditional GET requests (If-None-Match, If-Modified-Since) with
+    304 Not Modified, without building the response body.
+
+    Views implement `get_validators()` returning the values identifying the current
+    version of the resource and its last modification datetime, which should come
+    from a cheap indexed lookup. Full responses carry the matching ETag and
+    Last-Modified headers.
+    """
+
+    def get_validators(self):
+        """
+        Return (version values, last modified datetime or None).
+        """
+        raise NotImplementedError("Subclasses must implement get_validators()")
+
+    def get(self, request, *args, **kwargs):
+        etag, timestamp = make_validators(*self.get_validators())
+
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+
+        set_validator_headers(response, etag, timestamp)
+        return response
+
+
+class ListConditionalGetMixin:
+    """
+    Conditional GET for paginated list views, answered from the page the response
+    returns.
+
+    The version of a list response is the primary key and `updated_at` of each row
+    of its page, the next page link, and the data the response carries besides the
+    page, see `get_extra_data()`. Edits, additions and removals within the page
+    all change it, and it costs no query of its own: the page is fetched as for a
+    full response and only represented when the client's copy is outdated. List
+    responses carry no Last-Modified, removing a row would not make it later.
+    """
+
+    pk_field = "id"
+    updated_at_field = "updated_at"
+
+    def get_page_queryset(self):
+        """
+        Return the queryset the page is taken from.
+        """
+        return self.filter_queryset(self.get_queryset())
+
+    def represent_page(self, page, queryset):
+        """
+        Return the response data of the page's rows.
+        """
+        return self.get_serializer(page, many=True).data
+
+    def get_extra_data(self):
+        """
+        Return the data the response carries besides the page, e.g. counts.
+        """
+        return {}
+
+    def get_page_version(self, page):
+        """
+        Return the primary key and `updated_at` of each row of the page.
+        """
+        version = []
+        for row in page:
+            # rows are model instances, or dicts when paginating `.values()`
+            if isinstance(row, dict):
+                version += [row[self.pk_field], row[self.updated_at_field]]
+            else:
+                version += [
+                    getattr(row, self.pk_field),
+                    getattr(row, self.updated_at_field),
+                ]
+        return version
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.get_page_queryset()
+        page = self.paginate_queryset(queryset)
+        extra_data = self.get_extra_data()
+
+        version = [
+            *self.get_page_version(page),
+            self.paginator.get_next_link(),
+            *extra_data.items(),
+        ]
+        etag, timestamp = make_validators(version, None)
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = self.get_paginated_response(self.represent_page(page, queryset))
+            response.data.update(extra_data)
+
+        set_validator_headers(response, etag, timestamp)
+        return response
@@ -10,3 +10,14 @@ class IsClient(BasePermission):
 
     def has_permission(self, request, view):
         return request.user.is_client
+
+
+class IsAgent(BasePermission):
+    """
+    Custom permission to only allow agents to access certain views.
+    """
+
+    message = "You must be an agent to perform this action."
+
+    def has_permission(self, request, view):
+        return request.user.is_agent
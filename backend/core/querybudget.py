@@ -0,0 +1,177 @@
+"""
+Per-request query budgets and N+1 detection.
+
+Every request's queries are recorded through database execute wrappers, which
+work with DEBUG off. The query count is checked against the budget declared for
+the URL name in the `QUERY_BUDGETS` setting, and queries are grouped by shape,
+their SQL with the parameters left out and IN lists collapsed, so the same query
+run once per row, the N+1 signature, shows up as a repeated shape.
+
+In DEBUG the results are reported in response headers. Otherwise a sample of
+requests, set by `QUERY_BUDGET_SAMPLE_RATE`, is logged, as warnings when over
+budget or repeating queries.
+
+The active recorders are held in a context variable, which `sync_to_async`
+copies into the thread running the queries, and queries are dispatched to them by
+an execute wrapper installed once on every connection. Under ASGI the queries of
+concurrent requests run on the same thread and connection, each is counted for
+its own request only.
+"""
+
+import logging
+import random
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+PARAMETER_LIST = re.compile(r"\(%s(?:\s*,\s*%s)*\)")
+# savepoint names are unique per call, their statements are not N+1 queries
+SAVEPOINT = re.compile(r"^(?:SAVEPOINT|RELEASE SAVEPOINT|ROLLBACK TO SAVEPOINT)\b")
+
+
+def query_shape(sql):
+    """
+    Return the shape of a query, its SQL with parameter lists of any length
+    collapsed.
+    Parameters are passed separately from the SQL, so they are not part of it.
+    """
+    return PARAMETER_LIST.sub("(%s, ...)", " ".join(sql.split()))
+
+
+_recorders = ContextVar("query_recorders", default=())
+
+
+class QueryRecorder:
+    """
+    Count queries and their shapes, on all databases or on the given one.
+    """
+
+    def __init__(self, using=None):
+        self.using = using
+        self.count = 0
+        self.shapes = Counter()
+
+    def record(self, sql, alias):
+        if self.using and alias != self.using:
+            return
+        self.count += 1
+        if not SAVEPOINT.match(sql):
+            self.shapes[query_shape(sql)] += 1
+
+    def repeated(self):
+        """
+        Return a mapping of shape to count for shapes run more than once.
+        """
+        return {shape: count for shape, count in self.shapes.items() if count > 1}
+
+
+def _record(execute, sql, params, many, context):
+    for recorder in _recorders.get():
+        recorder.record(sql, context["connection"].alias)
+    return execute(sql, params, many, context)
+
+
+def install_recording(connection):
+    """
+    Add the execute wrapper dispatching queries to the active recorders to the
+    connection, once.
+    """
+    if _record not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record)
+
+
+@receiver(connection_created)
+def install_recording_on_connect(sender, connection, **kwargs):
+    install_recording(connection)
+
+
+@contextmanager
+def record_queries(using=None):
+    """
+    Record the queries run on all databases, or on the given one, in the block.
+    """
+    recorder = QueryRecorder(using)
+    for alias in [using] if using else connections:
+        install_recording(connections[alias])
+    token = _recorders.set((*_recorders.get(), recorder))
+    try:
+        yield recorder
+    finally:
+        _recorders.reset(token)
+
+
+def get_budget(url_name):
+    """
+    Return the query budget declared for a URL name, or the default budget.
+    """
+    return settings.QUERY_BUDGETS.get(url_name, settings.QUERY_BUDGET_DEFAULT)
+
+
+class QueryBudgetMiddleware:
+    """
+    Check the queries of each request against the budget of its URL name.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.should_report():
+            return self.get_response(request)
+
+        with record_queries() as recorder:
+            response = self.get_response(request)
+        self.report(request, response, recorder)
+        return response
+
+    async def __acall__(self, request):
+        if not self.should_report():
+            return await self.get_response(request)
+
+        with record_queries() as recorder:
+            response = await self.get_response(request)
+        self.report(request, response, recorder)
+        return response
+
+    def should_report(self):
+        return settings.DEBUG or random.random() < settings.QUERY_BUDGET_SAMPLE_RATE
+
+    def report(self, request, response, recorder):
+        match = request.resolver_match
+        url_name = match.view_name if match else None
+        budget = get_budget(url_name)
+        repeated = recorder.repeated()
+
+        if settings.DEBUG:
+            response.headers["X-Query-Count"] = str(recorder.count)
+            response.headers["X-Query-Budget"] = str(budget)
+            response.headers["X-Query-Repeated"] = str(len(repeated))
+        else:
+            over_budget = recorder.count > budget
+            logger.log(
+                logging.WARNING if over_budget or repeated else logging.INFO,
+                "%s %s (%s): %d queries, budget %d, %d repeated shapes",
+                request.method,
+                request.path,
+                url_name,
+                recorder.count,
+                budget,
+                len(repeated),
+                extra={"repeated_queries": repeated},
+            )
@@ -0,0 +1,211 @@
+"""
+Read replicas.
+
+Reads outnumber writes by far, so `ReplicaRouter` sends the reads of requests to
+the replicas, the aliases of the `DATABASE_REPLICAS` setting, and every write to
+the primary, `default`. `ReplicaPinMiddleware` picks the database each request
+reads from, once, so a request reads from a single database:
+
+- requests with unsafe methods read from the primary, their reads feed their
+  writes,
+- other requests read from a random replica synced within the last
+  `REPLICA_MAX_LAG_SECONDS`, or from the primary when there is none,
+- a user who wrote is pinned: until a replica sync started after the write, their
+  requests read from the primary, so they read their own writes although the
+  replicas lag behind. Replicas fresh enough to be read all started syncing
+  after writes older than `REPLICA_MAX_LAG_SECONDS`, pins expire then.
+
+Pins and sync times are kept in the cache, which all processes share, see
+core/sharedcache.py: the sync_replicas command and the web workers run in
+different processes, and a user's next request may reach another worker. The
+user of a request is taken from its access token, without querying, as the view
+only authenticates it later. Outside requests, e.g. in management commands,
+everything runs on the primary.
+
+Replicas of a SQLite database are copies of its file, refreshed with SQLite's
+online backup API by the sync_replicas command, which records the sync times.
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+PRIMARY = DEFAULT_DB_ALIAS
+
+# the database reads go to, None for the primary
+_read_database = ContextVar("read_database", default=None)
+
+
+def pin_key(user_id):
+    return f"replicas:pin:{user_id}"
+
+
+def synced_key(alias):
+    return f"replicas:synced:{alias}"
+
+
+@contextmanager
+def read_from(alias):
+    """
+    Send the reads of the block to the given database, None for the primary.
+    """
+    token = _read_database.set(alias)
+    try:
+        yield
+    finally:
+        _read_database.reset(token)
+
+
+def read_database():
+    """
+    Return the alias of the database reads currently go to.
+    """
+    return _read_database.get() or PRIMARY
+
+
+def pin_user(user_id):
+    """
+    Send the user's reads to the primary until a replica sync started after now,
+    once their writes are committed.
+    """
+    if settings.DATABASE_REPLICAS:
+        cache.set(pin_key(user_id), time.time(), settings.REPLICA_MAX_LAG_SECONDS)
+
+
+def sync_replica(alias, source=PRIMARY):
+    """
+    Copy the source SQLite database into the replica with the online backup API,
+    and record the time the copy started, which the replica is current as of.
+    """
+    started = time.time()
+    connections[source].ensure_connection()
+    connections[alias].ensure_connection()
+    connections[source].connection.backup(connections[alias].connection)
+    cache.set(synced_key(alias), started, None)
+
+
+def choose_database(unsafe, user_id):
+    """
+    Return the replica a request should read from, or None for the primary.
+    """
+    if unsafe:
+        return None
+
+    replicas = settings.DATABASE_REPLICAS
+    keys = [synced_key(alias) for alias in replicas]
+    if user_id is not None:
+        keys.append(pin_key(user_id))
+    values = cache.get_many(keys)
+
+    oldest = time.time() - settings.REPLICA_MAX_LAG_SECONDS
+    if user_id is not None:
+        # replicas synced since the user's last write include it
+        oldest = max(oldest, values.get(pin_key(user_id), oldest))
+    fresh = [alias for alias in replicas if values.get(synced_key(alias), 0) >= oldest]
+    return random.choice(fresh) if fresh else None
+
+
+def token_user_id(request):
+    """
+    Return the user id of the request's access token, or None.
+    """
+    authentication = JWTAuthentication()
+    header = authentication.get_header(request)
+    if header is None:
+        return None
+    raw_token = authentication.get_raw_token(header)
+    if raw_token is None:
+        return None
+    try:
+        return authentication.get_validated_token(raw_token).get(
+            api_settings.USER_ID_CLAIM
+        )
+    except InvalidToken:
+        return None
+
+
+class ReplicaRouter:
+    """
+    Send reads to the database picked for the current request, writes to the
+    primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        return _read_database.get() or PRIMARY
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {PRIMARY, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # replicas are copies of the primary, schema included
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
+
+
+class ReplicaPinMiddleware:
+    """
+    Pick the database each request reads from, and pin the users of successful
+    unsafe requests to the primary.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with self.route(request) as user_id:
+            response = self.get_response(request)
+        self.pin(request, response, user_id)
+        return response
+
+    async def __acall__(self, request):
+        with self.route(request) as user_id:
+            response = await self.get_response(request)
+        self.pin(request, response, user_id)
+        return response
+
+    @contextmanager
+    def route(self, request):
+        if not settings.DATABASE_REPLICAS:
+            yield None
+            return
+
+        user_id = token_user_id(request)
+        alias = choose_database(request.method not in SAFE_METHODS, user_id)
+        with read_from(alias):
+            yield user_id
+
+    def pin(self, request, response, user_id):
+        if not settings.DATABASE_REPLICAS or request.method in SAFE_METHODS:
+            return
+        if response.status_code >= 400:
+            return
+        # DRF sets the authenticated user on the underlying request as well
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            user_id = user.pk
+        if user_id is not None:
+            pin_user(user_id)
@@ -0,0 +1,207 @@
+"""
+Cached resolution of natural keys to model instances.
+
+Locations and venues are looked up by their natural key on every gig write and
+signup, and the same few thousand of them come back over and over. A `Resolver`
+answers these lookups from two tiers before going to the database:
+
+- a bounded in-process LRU, whose entries expire after `local_timeout` seconds so
+  invalidations in other processes are picked up,
+- the shared Django cache, which all processes see.
+
+Instances are only cached once the transaction that read or created them has
+committed, so a rolled back row is never cached. Saving or deleting an instance
+invalidates its key in both tiers through model signals.
+"""
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+from django.db import IntegrityError, router, transaction
+from django.db.models.signals import post_delete, post_save
+
+from core.models import Location
+
+
+class Resolver:
+    """
+    Resolve natural keys, tuples of `key_fields` values, to instances of `model`,
+    creating the missing ones.
+    """
+
+    def __init__(
+        self,
+        name,
+        model,
+        key_fields,
+        maxsize=4096,
+        local_timeout=60,
+        timeout=60 * 60,
+        cache_alias="default",
+    ):
+        self.name = name
+        self.model = model
+        self.key_fields = tuple(key_fields)
+        self.maxsize = maxsize
+        self.local_timeout = local_timeout
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+
+        self._local = OrderedDict()  # key -> (instance, expires at)
+        self._lock = threading.Lock()
+        self._invalidations = 0
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+        post_save.connect(
+            self._invalidate_instance,
+            sender=model,
+            weak=False,
+            dispatch_uid=f"resolver-{name}-save",
+        )
+        post_delete.connect(
+            self._invalidate_instance,
+            sender=model,
+            weak=False,
+            dispatch_uid=f"resolver-{name}-delete",
+        )
+
+    @property
+    def shared(self):
+        return caches[self.cache_alias]
+
+    def key_for(self, instance):
+        return tuple(getattr(instance, field) for field in self.key_fields)
+
+    def cache_key(self, key):
+        digest = hashlib.md5(repr(key).encode(), usedforsecurity=False).hexdigest()
+        return f"resolver:{self.name}:{digest}"
+
+    def resolve(self, key, defaults=None):
+        """
+        Return the instance for `key`, creating it if it does not exist.
+
+        `defaults` are the other field values of a created instance, or a callable
+        returning them, which is only called on creation.
+        Returned instances are copies, callers may modify them freely.
+        """
+        key = tuple(key)
+        instance = self._get_local(key)
+        if instance is None:
+            instance = self.shared.get(self.cache_key(key))
+            if instance is not None:
+                with self._lock:
+                    self.shared_hits += 1
+                self._set_local(key, instance)
+        if instance is not None:
+            return copy.copy(instance)
+
+        with self._lock:
+            self.misses += 1
+        instance = self._fetch(key, defaults)
+        # read after the fetch, so the save signal of a created row does not count
+        invalidations = self._invalidations
+
+        # the row may still be rolled back, only cache it once committed
+        cached = copy.copy(instance)
+        transaction.on_commit(
+            lambda: self._store(key, cached, invalidations),
+            using=router.db_for_write(self.model),
+        )
+        return instance
+
+    def _fetch(self, key, defaults):
+        lookup = dict(zip(self.key_fields, key))
+        try:
+            return self.model.objects.get(**lookup)
+        except self.model.DoesNotExist:
+            pass
+
+        if callable(defaults):
+            defaults = defaults()
+        # get_or_create would look the row up again first
+        try:
+            with transaction.atomic(using=router.db_for_write(self.model)):
+                return self.model.objects.create(**lookup, **(defaults or {}))
+        except IntegrityError:
+            # created concurrently
+            return self.model.objects.get(**lookup)
+
+    def _get_local(self, key):
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            instance, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            self.hits += 1
+            return instance
+
+    def _set_local(self, key, instance):
+        with self._lock:
+            self._local[key] = (instance, time.monotonic() + self.local_timeout)
+            self._local.move_to_end(key)
+            while len(self._local) > self.maxsize:
+                self._local.popitem(last=False)
+
+    def _store(self, key, instance, invalidations):
+        # an invalidation since the read may have made the instance stale
+        if invalidations != self._invalidations:
+            return
+        self._set_local(key, instance)
+        self.shared.set(self.cache_key(key), instance, self.timeout)
+
+    def invalidate(self, key):
+        """
+        Drop the key from both tiers.
+        """
+        key = tuple(key)
+        with self._lock:
+            self._local.pop(key, None)
+            self._invalidations += 1
+        self.shared.delete(self.cache_key(key))
+
+    def _invalidate_instance(self, sender, instance, **kwargs):
+        self.invalidate(self.key_for(instance))
+
+    def clear(self):
+        """
+        Drop the in-process entries and reset the counters. Shared entries are left
+        to expire.
+        """
+        with self._lock:
+            self._local.clear()
+            self.hits = self.shared_hits = self.misses = 0
+
+    def stats(self):
+        """
+        Return the hit and miss counters of this process.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "size": len(self._local),
+                "maxsize": self.maxsize,
+            }
+
+
+locations = Resolver("location", Location, ("city", "state_region", "country"))
+
+
+def resolve_location(location_data):
+    """
+    Return the Location for nested location data, creating it if needed.
+    """
+    return locations.resolve(
+        tuple(location_data[field] for field in locations.key_fields)
+    )
@@ -0,0 +1,40 @@
+"""
+The shared cache.
+
+The default cache holds state every process must see, and keep until it
+expires: the token revocations and blacklisted tokens of authentication/, and
+the sync times and pins of the read replicas, see core/replicas.py. A
+process-local backend, like locmem, hides this state from the other processes
+and evicts it, so revoked tokens would stay valid there. It is only accepted in
+DEBUG, where runserver serves every request from one process; prod.py configures
+redis.
+"""
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS
+from django.core.exceptions import ImproperlyConfigured
+
+PROCESS_LOCAL_BACKENDS = {
+    "django.core.cache.backends.dummy.DummyCache",
+    "django.core.cache.backends.locmem.LocMemCache",
+}
+
+
+def is_shared(alias=DEFAULT_CACHE_ALIAS):
+    """
+    Return whether every process sees the entries of the cache.
+    """
+    return settings.CACHES[alias]["BACKEND"] not in PROCESS_LOCAL_BACKENDS
+
+
+def check_shared_cache():
+    """
+    Raise ImproperlyConfigured if the default cache is process-local outside
+    DEBUG.
+    """
+    if not settings.DEBUG and not is_shared():
+        raise ImproperlyConfigured(
+            "The default cache must be shared by all processes, e.g. redis, "
+            f"not {settings.CACHES[DEFAULT_CACHE_ALIAS]['BACKEND']}, see "
+            "core/sharedcache.py."
+        )
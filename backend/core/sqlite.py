@@ -0,0 +1,218 @@
+"""
+SQLite tuning.
+
+With SQLite's defaults a write locks the whole database file against readers, and
+a transaction that reads before writing, like most `atomic()` blocks, fails with
+"database is locked" at once when another connection is writing, whatever the
+busy timeout. The tuned profile, enabled by prod.py:
+
+- `journal_mode=WAL`: readers and the writer no longer block each other,
+- `synchronous=NORMAL`: in WAL mode commits stay durable across application
+  crashes, the WAL is synced at checkpoints only,
+- `busy_timeout`: how long a writer waits for the write lock before failing,
+- `mmap_size`, `cache_size`, `temp_store`: reads served from memory,
+- the IMMEDIATE transaction mode of the database settings: transactions take
+  the write lock when they begin, so they wait for it instead of failing to
+  upgrade their read lock.
+
+The pragmas of the SQLITE_PRAGMAS setting are applied to each new connection.
+`PRAGMA optimize` refreshes the query planner statistics, run it periodically
+with the optimize_database command.
+
+`WriteBenchmark` measures write throughput with concurrent readers, on a
+throwaway database file, under the default and the tuned profile.
+"""
+
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+# rows examined per index by ANALYZE, keeps optimizing large tables cheap
+ANALYSIS_LIMIT = 1000
+
+
+def apply_pragmas(connection, pragmas):
+    """
+    Apply the pragmas to a DB-API SQLite connection.
+    """
+    for name, value in pragmas.items():
+        connection.execute(f"PRAGMA {name} = {value}")
+
+
+@receiver(connection_created)
+def apply_pragmas_on_connect(sender, connection, **kwargs):
+    if connection.vendor == "sqlite" and settings.SQLITE_PRAGMAS:
+        # on the underlying connection, these are not the application's queries
+        apply_pragmas(connection.connection, settings.SQLITE_PRAGMAS)
+
+
+def optimize(using=DEFAULT_DB_ALIAS):
+    """
+    Refresh the query planner statistics of the database where they are stale.
+    Return whether the database is a SQLite one.
+    """
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}")
+        if sqlite3.sqlite_version_info >= (3, 46):
+            # checks every table, not only those queried by this connection
+            cursor.execute("PRAGMA optimize = 0x10002")
+        else:
+            # older versions only optimize what this fresh connection queried,
+            # nothing, so analyze everything, bounded by analysis_limit
+            cursor.execute("ANALYZE")
+    return True
+
+
+class WriteBenchmark:
+    """
+    Writers update and insert rows in short transactions, reading before writing
+    like the application's `atomic()` blocks, while readers run read transactions
+    in a loop. Writers spend `think` seconds between their read and their writes,
+    the application's work, serializing and validating. Each connection is opened
+    like Django opens them, in autocommit with the sqlite3 module's default
+    timeout, starting transactions explicitly. A failed transaction is rolled back
+    and counted, not retried.
+    """
+
+    PROFILES = {
+        "default": ({}, "BEGIN"),
+        "tuned": (None, "BEGIN IMMEDIATE"),  # SQLITE_TUNED_PRAGMAS
+    }
+
+    def __init__(self, rows, readers, writers, transactions, think=0.001):
+        self.rows = rows
+        self.readers = readers
+        self.writers = writers
+        self.transactions = transactions
+        self.think = think
+
+    def run(self):
+        return {profile: self.run_profile(profile) for profile in self.PROFILES}
+
+    def run_profile(self, profile):
+        pragmas, begin = self.PROFILES[profile]
+        if pragmas is None:
+            pragmas = settings.SQLITE_TUNED_PRAGMAS
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "benchmark.sqlite3"
+            self.create(path, pragmas)
+
+            stop = threading.Event()
+            reads = [0] * self.readers
+            reader_threads = [
+                threading.Thread(
+                    target=self.read, args=(path, pragmas, stop, reads, index)
+                )
+                for index in range(self.readers)
+            ]
+            results = [None] * self.writers
+            writer_threads = [
+                threading.Thread(
+                    target=self.write, args=(path, pragmas, begin, results, index)
+                )
+                for index in range(self.writers)
+            ]
+
+            for thread in reader_threads:
+                thread.start()
+            start = time.perf_counter()
+            for thread in writer_threads:
+                thread.start()
+            for thread in writer_threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            stop.set()
+            for thread in reader_threads:
+                thread.join()
+
+        committed = sum(result[0] for result in results)
+        return {
+            "transactions": self.writers * self.transactions,
+            "committed": committed,
+            "locked": sum(result[1] for result in results),
+            "writes_per_second": round(committed / elapsed, 1),
+            "reads_per_second": round(sum(reads) / elapsed, 1),
+        }
+
+    def connect(self, path, pragmas):
+        connection = sqlite3.connect(path, isolation_level=None)
+        apply_pragmas(connection, pragmas)
+        return connection
+
+    def create(self, path, pragmas):
+        connection = self.connect(path, pragmas)
+        connection.execute(
+            "CREATE TABLE gig (id INTEGER PRIMARY KEY, client INTEGER, "
+            "title TEXT, compensation REAL)"
+        )
+        connection.execute("CREATE INDEX gig_client ON gig (client)")
+        connection.executemany(
+            "INSERT INTO gig (client, title, compensation) VALUES (?, ?, ?)",
+            ((row % 100, f"Gig {row}", row % 500) for row in range(self.rows)),
+        )
+        connection.close()
+
+    def read(self, path, pragmas, stop, reads, index):
+        connection = self.connect(path, pragmas)
+        client = index
+        while not stop.is_set():
+            client = (client + 1) % 100
+            try:
+                connection.execute("BEGIN")
+                connection.execute(
+                    "SELECT count(*), avg(compensation) FROM gig WHERE client = ?",
+                    (client,),
+                ).fetchall()
+                connection.execute(
+                    "SELECT * FROM gig ORDER BY compensation DESC LIMIT 50"
+                ).fetchall()
+                connection.execute("COMMIT")
+                reads[index] += 1
+            except sqlite3.OperationalError as error:
+                if "locked" not in str(error):
+                    raise
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+        connection.close()
+
+    def write(self, path, pragmas, begin, results, index):
+        connection = self.connect(path, pragmas)
+        committed = locked = 0
+        for transaction in range(self.transactions):
+            client = (index * self.transactions + transaction) % 100
+            try:
+                connection.execute(begin)
+                [gig_id] = connection.execute(
+                    "SELECT max(id) FROM gig WHERE client = ?", (client,)
+                ).fetchone()
+                time.sleep(self.think)
+                connection.execute(
+                    "UPDATE gig SET title = ? WHERE id = ?",
+                    (f"Gig {transaction}", gig_id),
+                )
+                connection.execute(
+                    "INSERT INTO gig (client, title, compensation) VALUES (?, ?, ?)",
+                    (client, f"Gig {transaction}", transaction % 500),
+                )
+                connection.execute("COMMIT")
+                committed += 1
+            except sqlite3.OperationalError as error:
+                if "locked" not in str(error):
+                    raise
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                locked += 1
+        connection.close()
+        results[index] = (committed, locked)
@@ -0,0 +1,73 @@
+"""
+Startup profiling.
+
+A worker's boot time is mostly imports: Django's setup imports every installed
+app's models, and the first request imports the URLconf, and with it the views,
+serializers and schema generation. Python's `-X importtime` reports the time
+spent in each module; this runs the startup in a fresh interpreter with it, as
+modules already imported by the current process would not be measured, and sums
+the times per top-level package.
+"""
+
+import os
+import subprocess
+import sys
+from collections import Counter
+
+from django.conf import settings
+
+# what a worker runs before serving its first request
+STARTUP_CODE = (
+    "import django; django.setup(); "
+    "from django.urls import get_resolver; get_resolver().url_patterns"
+)
+
+
+class StartupError(Exception):
+    pass
+
+
+def parse_importtime(output):
+    """
+    Parse `-X importtime` output into a mapping of module name to
+    (self, cumulative) times, in microseconds.
+    """
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, cumulative, name = line[len("import time:") :].split("|")
+        if not self_time.strip().isdigit():
+            # the header line
+            continue
+        times[name.strip()] = (int(self_time), int(cumulative))
+    return times
+
+
+def profile_imports(code=STARTUP_CODE):
+    """
+    Run `code` in a fresh interpreter with the current settings and return the
+    import times of its modules, see `parse_importtime`.
+    """
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        cwd=settings.BASE_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise StartupError(result.stderr[-2000:])
+    return parse_importtime(result.stderr)
+
+
+def package_times(times):
+    """
+    Return the import time of each top-level package, the sum of the self times
+    of its modules, in microseconds.
+    """
+    packages = Counter()
+    for name, (self_time, _) in times.items():
+        packages[name.split(".")[0]] += self_time
+    return packages
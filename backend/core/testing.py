@@ -0,0 +1,46 @@
+from contextlib import contextmanager
+
+from core.querybudget import get_budget, record_queries
+
+
+class QueryBudgetTestMixin:
+    """
+    Test case mixin asserting requests stay within the query budget of their URL
+    name and run no query once per row.
+    """
+
+    @contextmanager
+    def assertWithinQueryBudget(self, url_name, allow_repeated=()):
+        """
+        Assert the queries of the block fit the budget of `url_name` and that no
+        query shape repeats, except shapes containing one of `allow_repeated`.
+        """
+        with record_queries() as recorder:
+            yield recorder
+
+        budget = get_budget(url_name)
+        self.assertLessEqual(
+            recorder.count,
+            budget,
+            f"{url_name} ran {recorder.count} queries, over its budget of {budget}",
+        )
+        repeated = {
+            shape: count
+            for shape, count in recorder.repeated().items()
+            if not any(fragment in shape for fragment in allow_repeated)
+        }
+        self.assertEqual(repeated, {}, f"{url_name} repeated queries, likely N+1")
+
+
+def file_based_caches(location):
+    """
+    CACHES setting of a cache shared through files in `location`, as processes
+    share redis. Each override of the setting creates new cache instances, which
+    keep nothing in memory.
+    """
+    return {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": location,
+        }
+    }
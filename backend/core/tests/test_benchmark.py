@@ -0,0 +1,177 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+
+from core import benchmark
+from gigs.models import Gig
+
+
+class BenchmarkStatisticsTests(SimpleTestCase):
+    def test_percentile_is_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual(benchmark.percentile(values, 50), 50)
+        self.assertEqual(benchmark.percentile(values, 95), 95)
+        self.assertEqual(benchmark.percentile(values, 99), 99)
+        self.assertEqual(benchmark.percentile([3], 99), 3)
+
+    def test_summary(self):
+        stats = benchmark.summarize([0.01, 0.02, 0.03, 0.04], [2, 2, 3, 3])
+        self.assertEqual(stats["requests"], 4)
+        self.assertEqual(stats["p50_ms"], 20)
+        self.assertEqual(stats["p99_ms"], 40)
+        self.assertEqual(stats["throughput_rps"], 40)
+        self.assertEqual(stats["queries"], 2.5)
+
+    def test_regressions_over_threshold_are_reported(self):
+        baseline = {
+            "login": {"p95_ms": 10, "queries": 2},
+            "create": {"p95_ms": 10, "queries": 30},
+        }
+        results = {
+            "login": {"p95_ms": 11.5, "queries": 2},
+            "create": {"p95_ms": 13, "queries": 31},
+            "review": {"p95_ms": 100, "queries": 5},
+        }
+        self.assertEqual(
+            benchmark.compare(results, baseline, threshold=0.2),
+            [
+                "create: p95 13 ms, baseline 10 ms",
+                "create: 31 queries, baseline 30",
+            ],
+        )
+
+
+class TestDatabaseTests(SimpleTestCase):
+    def database(self, name, test_name=None):
+        return mock.Mock(settings_dict={"NAME": name, "TEST": {"NAME": test_name}})
+
+    def test_test_databases_are_recognized(self):
+        for database in (
+            self.database("file:memorydb_default?mode=memory&cache=shared"),
+            self.database(":memory:"),
+            self.database("/srv/test_db.sqlite3"),
+            self.database("/srv/bench.sqlite3", test_name="/srv/bench.sqlite3"),
+        ):
+            self.assertTrue(benchmark.is_test_database(database))
+
+    def test_other_databases_are_not_test_databases(self):
+        self.assertFalse(benchmark.is_test_database(self.database("/srv/db.sqlite3")))
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class BenchmarkApiCommandTests(TestCase):
+    def call(self, *args):
+        out = StringIO()
+        call_command(
+            "benchmark_api",
+            "--current-database",
+            "--gigs=20",
+            "--users=6",
+            "--venues=3",
+            "--requests=2",
+            *args,
+            stdout=out,
+            stderr=StringIO(),
+        )
+        return out.getvalue()
+
+    def test_every_endpoint_is_reported(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            output = self.call(f"--output={path}")
+            with open(path) as file:
+                report = json.load(file)
+
+        self.assertEqual(list(report["endpoints"]), list(benchmark.ENDPOINTS))
+        for name in benchmark.ENDPOINTS:
+            self.assertIn(name, output)
+            self.assertEqual(report["endpoints"][name]["requests"], 2)
+        # seeded gigs and the two benchmark gigs, published by the last endpoint
+        self.assertEqual(Gig.objects.count(), 22)
+        self.assertEqual(
+            Gig.objects.filter(title__startswith="Edited", status="published").count(),
+            2,
+        )
+
+    def test_databases_other_than_test_databases_are_refused(self):
+        with mock.patch.dict(connection.settings_dict, NAME="/srv/db.sqlite3"):
+            with self.assertRaisesMessage(CommandError, "not a test database"):
+                self.call()
+        self.assertFalse(Gig.objects.exists())
+
+    def test_baseline_regressions_fail(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            with open(path, "w") as file:
+                json.dump(
+                    {
+                        "configuration": {
+                            "gigs": 20,
+                            "users": 6,
+                            "venues": 3,
+                            "requests": 2,
+                            "seed": 0,
+                            "interface": "wsgi",
+                        },
+                        "endpoints": {"review": {"p95_ms": 0.001, "queries": 1}},
+                    },
+                    file,
+                )
+            with self.assertRaisesMessage(CommandError, "review: p95"):
+                self.call(f"--baseline={path}")
+
+    def test_baseline_of_another_configuration_is_refused(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            with open(path, "w") as file:
+                json.dump({"configuration": {"gigs": 1}, "endpoints": {}}, file)
+            with self.assertRaisesMessage(CommandError, "another configuration"):
+                self.call(f"--baseline={path}")
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class BenchmarkConcurrencyCommandTests(TransactionTestCase):
+    # committed data, the WSGI connections are served from other threads
+    def test_both_interfaces_are_reported(self):
+        out = StringIO()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.json")
+            call_command(
+                "benchmark_concurrency",
+                "--current-database",
+                "--gigs=10",
+                "--users=4",
+                "--venues=2",
+                "--requests=6",
+                "--concurrency=3",
+                f"--output={path}",
+                stdout=out,
+            )
+            with open(path) as file:
+                report = json.load(file)
+
+        self.assertEqual(list(report["interfaces"]), ["wsgi", "asgi"])
+        for stats in report["interfaces"].values():
+            self.assertEqual(stats["requests"], 6)
+            self.assertEqual(stats["concurrency"], 3)
+        self.assertIn("asgi", out.getvalue())
+
+    def test_requests_below_concurrency_are_refused(self):
+        with self.assertRaisesMessage(CommandError, "--requests"):
+            call_command(
+                "benchmark_concurrency",
+                "--current-database",
+                "--requests=2",
+                "--concurrency=3",
+            )
@@ -0,0 +1,39 @@
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+from django.utils.module_loading import import_string
+
+from core.middleware import CamelCaseQueryMiddleware
+
+
+class MiddlewareTests(SimpleTestCase):
+    def test_every_middleware_runs_natively_under_asgi(self):
+        # a sync only middleware would run every request in a thread
+        for path in settings.MIDDLEWARE:
+            with self.subTest(path):
+                self.assertTrue(getattr(import_string(path), "async_capable", False))
+
+    def test_camel_case_query_parameters_are_underscoreized(self):
+        received = []
+
+        def view(request):
+            received.append(request.GET.dict())
+            return HttpResponse()
+
+        CamelCaseQueryMiddleware(view)(RequestFactory().get("/?locationType=virtual"))
+
+        self.assertEqual(received, [{"location_type": "virtual"}])
+
+    async def test_async_chain(self):
+        received = []
+
+        async def view(request):
+            received.append(request.GET.dict())
+            return HttpResponse()
+
+        middleware = CamelCaseQueryMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        await middleware(RequestFactory().get("/?startDatetime=x"))
+
+        self.assertEqual(received, [{"start_datetime": "x"}])
@@ -0,0 +1,123 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.test import AsyncClient, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from authentication.serializers import CustomTokenObtainPairSerializer
+from authentication.urls import urlpatterns as authentication_urlpatterns
+from core.querybudget import query_shape, record_queries
+from core.urls import urlpatterns as core_urlpatterns
+from core.models import Location
+from gigs.models import Gig
+from gigs.tests.factories import GigFactory
+from gigs.urls import urlpatterns as gig_urlpatterns
+from users.tests.factories import UserFactory
+
+
+class QueryShapeTests(TestCase):
+    def test_parameter_lists_of_any_length_have_the_same_shape(self):
+        self.assertEqual(
+            query_shape("SELECT * FROM gigs WHERE id IN (%s, %s, %s)"),
+            query_shape("SELECT * FROM gigs WHERE id IN (%s)"),
+        )
+
+    def test_whitespace_is_normalized(self):
+        self.assertEqual(
+            query_shape("SELECT *\n  FROM gigs"), query_shape("SELECT * FROM gigs")
+        )
+
+    def test_repeated_queries_are_reported(self):
+        with record_queries() as recorder:
+            for pk in range(3):
+                Location.objects.filter(pk=pk).first()
+            Location.objects.count()
+
+        self.assertEqual(recorder.count, 4)
+        self.assertEqual(list(recorder.repeated().values()), [3])
+
+    async def test_concurrent_recordings_count_their_own_queries(self):
+        async def run(queries):
+            with record_queries() as recorder:
+                for _ in range(queries):
+                    await Location.objects.acount()
+                    # let the other recording run a query in between
+                    await asyncio.sleep(0)
+            return recorder.count
+
+        self.assertEqual(await asyncio.gather(run(2), run(5)), [2, 5])
+
+    def test_nested_recordings_both_count(self):
+        with record_queries() as outer:
+            Location.objects.count()
+            with record_queries() as inner:
+                Location.objects.count()
+
+        self.assertEqual((outer.count, inner.count), (2, 1))
+
+
+class QueryBudgetDeclarationTests(TestCase):
+    def test_every_url_name_has_a_budget(self):
+        url_names = {
+            pattern.name
+            for pattern in [
+                *gig_urlpatterns,
+                *authentication_urlpatterns,
+                *core_urlpatterns,
+            ]
+        }
+        self.assertEqual(url_names - settings.QUERY_BUDGETS.keys(), set())
+
+
+class QueryBudgetMiddlewareTests(APITestCase):
+    def setUp(self):
+        GigFactory.create_batch(2, status="published")
+        self.client.force_authenticate(user=UserFactory())
+
+    @override_settings(DEBUG=True)
+    def test_debug_responses_report_queries(self):
+        response = self.client.get(reverse("gig-feed"))
+
+        self.assertEqual(response.headers["X-Query-Budget"], "2")
+        self.assertEqual(int(response.headers["X-Query-Count"]), 2)
+        self.assertEqual(response.headers["X-Query-Repeated"], "0")
+
+    @override_settings(DEBUG=False, QUERY_BUDGET_SAMPLE_RATE=1)
+    def test_sampled_requests_are_logged(self):
+        with self.assertLogs("core.querybudget", "INFO") as logs:
+            response = self.client.get(reverse("gig-feed"))
+
+        self.assertNotIn("X-Query-Count", response.headers)
+        self.assertIn("gig-feed", logs.output[0])
+        self.assertTrue(logs.output[0].startswith("INFO"))
+
+    @override_settings(DEBUG=False, QUERY_BUDGET_SAMPLE_RATE=1, QUERY_BUDGETS={})
+    def test_requests_over_budget_are_warned_about(self):
+        with self.settings(QUERY_BUDGET_DEFAULT=1):
+            with self.assertLogs("core.querybudget", "INFO") as logs:
+                self.client.get(reverse("gig-feed"))
+
+        self.assertTrue(logs.output[0].startswith("WARNING"))
+
+    @override_settings(DEBUG=True)
+    async def test_async_views_are_reported_under_asgi(self):
+        gig = await Gig.objects.select_related("client").afirst()
+        refresh = await sync_to_async(CustomTokenObtainPairSerializer.get_token)(
+            gig.client
+        )
+        response = await AsyncClient().get(
+            reverse("async-gig-client-review", args=[gig.pk]),
+            headers={"Authorization": f"Bearer {refresh.access_token}"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        # gig and its labels, the user is authenticated from the token
+        self.assertEqual(response.headers["X-Query-Count"], "2")
+        self.assertEqual(response.headers["X-Query-Repeated"], "0")
+
+    @override_settings(DEBUG=False, QUERY_BUDGET_SAMPLE_RATE=0)
+    def test_unsampled_requests_are_not_reported(self):
+        with self.assertNoLogs("core.querybudget"):
+            self.client.get(reverse("gig-feed"))
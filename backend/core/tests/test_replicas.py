@@ -0,0 +1,205 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.db import connections
+from django.test import RequestFactory, SimpleTestCase, TransactionTestCase
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core import replicas
+from core.testing import file_based_caches
+from gigs.models import Gig
+from gigs.tests.factories import GigFactory
+from users.tests.factories import UserFactory
+
+
+class ReplicaRouterTests(SimpleTestCase):
+    router = replicas.ReplicaRouter()
+
+    def test_reads_go_to_the_primary_by_default(self):
+        self.assertEqual(self.router.db_for_read(Gig), "default")
+
+    def test_reads_go_to_the_chosen_database(self):
+        with replicas.read_from("replica"):
+            self.assertEqual(self.router.db_for_read(Gig), "replica")
+            self.assertEqual(self.router.db_for_write(Gig), "default")
+        self.assertEqual(self.router.db_for_read(Gig), "default")
+
+    @override_settings(DATABASE_REPLICAS=["replica"])
+    def test_replicas_are_not_migrated(self):
+        self.assertFalse(self.router.allow_migrate("replica", "gigs"))
+        self.assertIsNone(self.router.allow_migrate("default", "gigs"))
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class ReplicaPinMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.factory = RequestFactory()
+        self.middleware = replicas.ReplicaPinMiddleware(self.get_response)
+        self.status_code = 200
+
+    def get_response(self, request):
+        self.database = replicas.read_database()
+        return type("Response", (), {"status_code": self.status_code})()
+
+    def request(self, method, user_id=None):
+        headers = {}
+        if user_id is not None:
+            token = AccessToken()
+            token["user_id"] = str(user_id)
+            headers["HTTP_AUTHORIZATION"] = f"Bearer {token}"
+        self.middleware(getattr(self.factory, method)("/api/gigs/", **headers))
+        return self.database
+
+    def mark_synced(self, seconds_ago=0):
+        cache.set(replicas.synced_key("replica"), replicas.time.time() - seconds_ago)
+
+    def test_reads_go_to_synced_replicas(self):
+        self.assertEqual(self.request("get"), "default")
+
+        self.mark_synced()
+        self.assertEqual(self.request("get"), "replica")
+
+    def test_lagging_replicas_are_not_read(self):
+        self.mark_synced(seconds_ago=60)
+
+        self.assertEqual(self.request("get"), "default")
+
+    def test_writes_pin_their_user_to_the_primary(self):
+        self.mark_synced()
+
+        self.assertEqual(self.request("post", user_id=1), "default")
+        self.assertEqual(self.request("get", user_id=1), "default")
+        self.assertEqual(self.request("get", user_id=2), "replica")
+
+    def test_failed_writes_do_not_pin(self):
+        self.mark_synced()
+        self.status_code = 400
+
+        self.request("put", user_id=1)
+        self.assertEqual(self.request("get", user_id=1), "replica")
+
+    def test_pins_are_seen_by_other_processes(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        shared = file_based_caches(directory.name)
+
+        # the write and the next read reach different workers
+        with override_settings(CACHES=shared):
+            self.mark_synced()
+            self.request("post", user_id=1)
+        with override_settings(CACHES=shared):
+            self.assertEqual(self.request("get", user_id=1), "default")
+            self.assertEqual(self.request("get", user_id=2), "replica")
+
+    def test_pins_last_until_a_sync_starts_after_the_write(self):
+        self.mark_synced()
+        self.request("post", user_id=1)
+        self.assertEqual(self.request("get", user_id=1), "default")
+
+        self.mark_synced()
+        self.assertEqual(self.request("get", user_id=1), "replica")
+
+    def test_replicas_synced_before_an_old_write_are_not_read(self):
+        # written 20 seconds ago, to a replica synced 25 seconds ago
+        cache.set(replicas.pin_key(1), replicas.time.time() - 20)
+        self.mark_synced(seconds_ago=25)
+
+        self.assertEqual(self.request("get", user_id=1), "default")
+        self.assertEqual(self.request("get", user_id=2), "replica")
+
+
+class SqliteReplicaTests(TransactionTestCase):
+    """
+    Requests served with a SQLite file replica, synced by the backup API.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # the replica is added once the test runner has set up its databases
+        cls.directory = tempfile.TemporaryDirectory()
+        connections.settings["replica"] = {
+            **connections["default"].settings_dict,
+            "NAME": str(Path(cls.directory.name) / "replica.sqlite3"),
+        }
+        cls.databases = {"default", "replica"}
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.databases
+        super().tearDownClass()
+        connections["replica"].close()
+        del connections["replica"]
+        del connections.settings["replica"]
+        cls.directory.cleanup()
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        settings = self.settings(DATABASE_REPLICAS=["replica"])
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.user = UserFactory(default_role="client")
+        self.client = APIClient()
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}"
+        )
+
+    def review(self, gig):
+        return self.client.get(reverse("gig-client-review", kwargs={"pk": gig.pk}))
+
+    def test_reads_are_served_by_the_replica(self):
+        call_command("sync_replicas", stdout=StringIO())
+        gig = GigFactory(client=self.user)
+
+        # not synced yet
+        self.assertEqual(self.review(gig).status_code, status.HTTP_404_NOT_FOUND)
+
+        replicas.sync_replica("replica")
+        self.assertEqual(self.review(gig).status_code, status.HTTP_200_OK)
+        self.assertEqual(Gig.objects.using("replica").count(), 1)
+
+    def test_sync_times_are_seen_by_other_processes(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        shared = file_based_caches(directory.name)
+
+        # sync_replicas runs in its own process, with its own cache instance
+        with override_settings(CACHES=shared):
+            syncing_cache = caches["default"]
+            call_command("sync_replicas", stdout=StringIO())
+        with override_settings(CACHES=shared):
+            self.assertIsNot(caches["default"], syncing_cache)
+            self.assertEqual(replicas.choose_database(False, None), "replica")
+
+    def test_users_read_their_writes(self):
+        gig = GigFactory(client=self.user, status="draft")
+        replicas.sync_replica("replica")
+
+        response = self.client.post(
+            reverse("gig-publish", kwargs={"pk": gig.pk}), format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(self.review(gig).json()["status"], "published")
+        self.assertEqual(Gig.objects.using("replica").get().status, "draft")
+
+    def test_publishing_with_get_reads_and_pins_the_primary(self):
+        replicas.sync_replica("replica")
+        # not on the replica yet
+        gig = GigFactory(client=self.user, status="draft")
+
+        response = self.client.get(reverse("gig-publish", kwargs={"pk": gig.pk}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(self.review(gig).json()["status"], "published")
@@ -0,0 +1,74 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.models import Location
+from core.resolvers import locations, resolve_location
+from core.tests.factories import LocationFactory
+
+LOCATION_DATA = {"city": "Nairobi", "state_region": "Nairobi", "country": "Kenya"}
+
+
+class LocationResolverTests(TestCase):
+    def setUp(self):
+        locations.clear()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.addCleanup(locations.clear)
+
+    def resolve(self):
+        # caching happens on commit, which test transactions never reach
+        with self.captureOnCommitCallbacks(execute=True):
+            return resolve_location(LOCATION_DATA)
+
+    def test_creates_missing_location(self):
+        location = self.resolve()
+
+        self.assertEqual(Location.objects.get(**LOCATION_DATA).pk, location.pk)
+        self.assertEqual(locations.stats()["misses"], 1)
+
+    def test_known_location_skips_database(self):
+        location = self.resolve()
+
+        with self.assertNumQueries(0):
+            resolved = self.resolve()
+
+        self.assertEqual(resolved.pk, location.pk)
+        self.assertEqual(locations.stats()["hits"], 1)
+
+    def test_shared_tier_is_used_when_local_entry_is_gone(self):
+        location = self.resolve()
+        locations.clear()
+
+        with self.assertNumQueries(0):
+            resolved = self.resolve()
+
+        self.assertEqual(resolved.pk, location.pk)
+        self.assertEqual(locations.stats()["shared_hits"], 1)
+
+    def test_rolled_back_location_is_not_cached(self):
+        resolve_location(LOCATION_DATA)
+
+        self.assertEqual(locations.stats()["size"], 0)
+        self.assertIsNone(cache.get(locations.cache_key(tuple(LOCATION_DATA.values()))))
+
+    def test_deleted_location_is_invalidated(self):
+        self.resolve().delete()
+
+        location = self.resolve()
+
+        self.assertTrue(Location.objects.filter(pk=location.pk).exists())
+        self.assertEqual(locations.stats()["misses"], 2)
+
+    def test_returned_instances_are_copies(self):
+        self.resolve().city = "Changed"
+
+        self.assertEqual(self.resolve().city, "Nairobi")
+
+    def test_local_tier_is_bounded(self):
+        self.addCleanup(setattr, locations, "maxsize", locations.maxsize)
+        locations.maxsize = 2
+        for location in LocationFactory.create_batch(3):
+            with self.captureOnCommitCallbacks(execute=True):
+                locations.resolve(locations.key_for(location))
+
+        self.assertEqual(locations.stats()["size"], 2)
@@ -0,0 +1,29 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+
+from core import sharedcache
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+REDIS = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": "redis://localhost:6379",
+    }
+}
+
+
+class SharedCacheTests(SimpleTestCase):
+    @override_settings(DEBUG=False, CACHES=LOCMEM)
+    def test_process_local_caches_are_refused(self):
+        self.assertFalse(sharedcache.is_shared())
+        with self.assertRaises(ImproperlyConfigured):
+            sharedcache.check_shared_cache()
+
+    @override_settings(DEBUG=True, CACHES=LOCMEM)
+    def test_process_local_caches_are_accepted_in_debug(self):
+        sharedcache.check_shared_cache()
+
+    @override_settings(DEBUG=False, CACHES=REDIS)
+    def test_shared_caches_are_accepted(self):
+        self.assertTrue(sharedcache.is_shared())
+        sharedcache.check_shared_cache()
@@ -0,0 +1,89 @@
+import json
+import sqlite3
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from core import sqlite
+
+
+class PragmaTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "test.sqlite3"
+
+    def pragma(self, database, name):
+        return database.execute(f"PRAGMA {name}").fetchone()[0]
+
+    def open_database(self):
+        database = DatabaseWrapper(
+            {**connection.settings_dict, "NAME": self.path}, alias="pragmas"
+        )
+        database.ensure_connection()
+        self.addCleanup(database.close)
+        return database.connection
+
+    def test_pragmas_are_applied(self):
+        database = sqlite3.connect(self.path)
+        self.addCleanup(database.close)
+
+        sqlite.apply_pragmas(database, {"journal_mode": "WAL", "cache_size": -1234})
+
+        self.assertEqual(self.pragma(database, "journal_mode"), "wal")
+        self.assertEqual(self.pragma(database, "cache_size"), -1234)
+
+    @override_settings(SQLITE_PRAGMAS={"journal_mode": "WAL", "synchronous": "NORMAL"})
+    def test_setting_is_applied_to_new_connections(self):
+        database = self.open_database()
+
+        self.assertEqual(self.pragma(database, "journal_mode"), "wal")
+        self.assertEqual(self.pragma(database, "synchronous"), 1)
+
+    @override_settings(SQLITE_PRAGMAS={})
+    def test_defaults_are_kept_without_setting(self):
+        database = self.open_database()
+
+        self.assertEqual(self.pragma(database, "journal_mode"), "delete")
+
+
+class OptimizeDatabaseCommandTests(TestCase):
+    def test_optimizes(self):
+        out = StringIO()
+        call_command("optimize_database", stdout=out)
+
+        self.assertIn("Optimized the default database.", out.getvalue())
+
+
+class WriteBenchmarkTests(SimpleTestCase):
+    def test_tuned_profile_never_fails_on_locks(self):
+        results = sqlite.WriteBenchmark(
+            rows=100, readers=2, writers=2, transactions=10
+        ).run()
+
+        self.assertEqual(set(results), {"default", "tuned"})
+        self.assertEqual(results["tuned"]["committed"], 20)
+        self.assertEqual(results["tuned"]["locked"], 0)
+        for stats in results.values():
+            self.assertEqual(stats["committed"] + stats["locked"], 20)
+
+    def test_command_writes_report(self):
+        with tempfile.NamedTemporaryFile(suffix=".json") as output:
+            call_command(
+                "benchmark_sqlite",
+                "--rows=100",
+                "--readers=1",
+                "--writers=1",
+                "--transactions=5",
+                f"--output={output.name}",
+                stdout=StringIO(),
+            )
+            report = json.load(output)
+
+        self.assertEqual(report["configuration"]["transactions"], 5)
+        self.assertEqual(report["profiles"]["tuned"]["committed"], 5)
@@ -0,0 +1,43 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from core import startup
+
+OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   taggit.utils
+import time:       300 |        420 | taggit
+import time:        80 |         80 |     gigs.geo
+import time:      1500 |       1580 |   gigs.models
+"""
+
+
+class ImportTimeTests(SimpleTestCase):
+    def test_output_is_parsed(self):
+        self.assertEqual(
+            startup.parse_importtime(OUTPUT),
+            {
+                "taggit.utils": (120, 120),
+                "taggit": (300, 420),
+                "gigs.geo": (80, 80),
+                "gigs.models": (1500, 1580),
+            },
+        )
+
+    def test_times_are_summed_per_package(self):
+        packages = startup.package_times(startup.parse_importtime(OUTPUT))
+        self.assertEqual(packages, {"taggit": 420, "gigs": 1580})
+
+
+class ProfileStartupCommandTests(SimpleTestCase):
+    def test_reports_requested_packages(self):
+        out = StringIO()
+        call_command("profile_startup", "gigs", "taggit", "--top=3", stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[1].split()[0], "gigs")
+        self.assertEqual(lines[2].split()[0], "taggit")
+        self.assertEqual(lines[3].split()[0], "total")
+        self.assertEqual(len(lines), 9)
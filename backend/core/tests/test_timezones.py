@@ -0,0 +1,36 @@
+import zoneinfo
+
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from core.timezones import timezone_names, timezone_set, validate_timezone
+
+
+class TimezoneCatalogTests(SimpleTestCase):
+    def test_catalog_matches_zoneinfo(self):
+        self.assertEqual(timezone_set(), zoneinfo.available_timezones())
+        self.assertIsInstance(timezone_set(), frozenset)
+        self.assertEqual(list(timezone_names()), sorted(timezone_set()))
+
+    def test_catalog_is_built_once(self):
+        self.assertIs(timezone_set(), timezone_set())
+        self.assertIs(timezone_names(), timezone_names())
+
+    def test_validation(self):
+        validate_timezone("Africa/Nairobi")
+        validate_timezone("UTC")
+        with self.assertRaisesMessage(ValidationError, "not a valid time zone"):
+            validate_timezone("Africa/Atlantis")
+
+
+class TimezoneListViewTests(APITestCase):
+    def test_lists_the_catalog_without_authentication_or_queries(self):
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("timezones"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), list(timezone_names()))
+        self.assertIn("max-age=86400", response.headers["Cache-Control"])
+        self.assertIn("public", response.headers["Cache-Control"])
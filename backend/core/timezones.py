@@ -0,0 +1,37 @@
+"""
+Catalog of the IANA time zones gigs can be scheduled in.
+
+`zoneinfo.available_timezones()` walks the tzdata files on every call, which used
+to happen at import time of the gig models, on every process start. The catalog
+is built on first use instead and kept for the life of the process, as a frozenset
+for O(1) validation and a sorted tuple for listings.
+"""
+
+import functools
+import zoneinfo
+
+from django.core.exceptions import ValidationError
+
+
+@functools.cache
+def timezone_set():
+    """
+    Return the names of the available time zones, as a frozenset.
+    """
+    return frozenset(zoneinfo.available_timezones())
+
+
+@functools.cache
+def timezone_names():
+    """
+    Return the names of the available time zones, sorted.
+    """
+    return tuple(sorted(timezone_set()))
+
+
+def validate_timezone(value):
+    """
+    Validate that the value is the name of an available time zone.
+    """
+    if value not in timezone_set():
+        raise ValidationError(f"{value} is not a valid time zone.")
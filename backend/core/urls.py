@@ -0,0 +1,7 @@
+from django.urls import path
+
+from core.views import TimezoneListView
+
+urlpatterns = [
+    path("timezones/", TimezoneListView.as_view(), name="timezones"),
+]
@@ -1,3 +1,27 @@
-from django.shortcuts import render
+from django.utils.cache import patch_cache_control
+from drf_spectacular.utils import extend_schema
+from rest_framework import serializers
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from core.timezones import timezone_names
+
+
+class TimezoneListView(APIView):
+    """
+    List the names of the time zones gigs can be scheduled in, sorted.
+
+    The catalog only changes with tzdata upgrades, so clients may cache it for a
+    day. It is public and needs no authentication.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    max_age = 60 * 60 * 24
+
+    @extend_schema(responses=serializers.ListSerializer(child=serializers.CharField()))
+    def get(self, request):
+        response = Response(timezone_names())
+        patch_cache_control(response, public=True, max_age=self.max_age)
+        return response
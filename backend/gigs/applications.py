@@ -0,0 +1,120 @@
+"""
+Agent applications to published gigs.
+
+Popular gigs receive many applications at once, so applying never reads and
+rewrites the gig row: the unique (gig, agent) constraint rejects duplicates and
+the gig's denormalized `application_count` is adjusted in place with an F()
+expression.
+
+Accepting an application confirms its agent on the gig with a single conditional
+UPDATE guarded on the gig being published and without an agent, so when clients
+race to confirm agents on the same gig exactly one of them wins.
+"""
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, router, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from gigs import scheduling, transitions
+from gigs.models import Gig, GigApplication
+
+
+def _adjust_application_count(gig_id, delta):
+    Gig.objects.filter(pk=gig_id).update(
+        application_count=F("application_count") + delta,
+        updated_at=timezone.now(),
+    )
+
+
+def apply(gig, agent, message=""):
+    """
+    Apply to a published gig as an agent, or re-apply after withdrawing.
+    Returns the application, raises a ValidationError if the agent cannot apply.
+    """
+    if gig.status != "published" or gig.agent_id is not None:
+        raise ValidationError({"gig": "Only published gigs can be applied to."})
+    if gig.client_id == agent.pk:
+        raise ValidationError({"gig": "You cannot apply to your own gig."})
+
+    using = router.db_for_write(GigApplication)
+    with transaction.atomic(using=using):
+        try:
+            with transaction.atomic(using=using):
+                application = GigApplication.objects.create(
+                    gig=gig, agent=agent, message=message
+                )
+        except IntegrityError:
+            # only a withdrawn application can be made pending again
+            reapplied = GigApplication.objects.filter(
+                gig=gig, agent=agent, status="withdrawn"
+            ).update(status="pending", message=message, updated_at=timezone.now())
+            if not reapplied:
+                raise ValidationError({"gig": "You have already applied to this gig."})
+            application = GigApplication.objects.get(gig=gig, agent=agent)
+
+        _adjust_application_count(gig.pk, 1)
+    return application
+
+
+def withdraw(gig, agent):
+    """
+    Withdraw the agent's pending application to the gig.
+    Returns True if a pending application was withdrawn.
+    """
+    using = router.db_for_write(GigApplication)
+    with transaction.atomic(using=using):
+        withdrawn = GigApplication.objects.filter(
+            gig=gig, agent=agent, status="pending"
+        ).update(status="withdrawn", updated_at=timezone.now())
+        if withdrawn:
+            _adjust_application_count(gig.pk, -1)
+    return bool(withdrawn)
+
+
+def accept(application):
+    """
+    Confirm the application's agent on its gig and reject the other pending
+    applications. Raises a ValidationError, leaving everything unchanged, if the
+    gig already has an agent, the application is no longer pending or the agent is
+    booked on an overlapping gig.
+    """
+    gig = application.gig
+    using = router.db_for_write(Gig)
+    with transaction.atomic(using=using):
+        # the contended write goes first, a losing request fails on it straight away
+        confirmed = transitions.transition_gigs(
+            [gig.pk],
+            "confirm_agent",
+            values={"agent_id": application.agent_id},
+            conditions={"agent_id": None},
+        )
+        if not confirmed:
+            raise ValidationError({"gig": "This gig already has a confirmed agent."})
+
+        now = timezone.now()
+        accepted = GigApplication.objects.filter(
+            pk=application.pk, status="pending"
+        ).update(status="accepted", updated_at=now)
+        if not accepted:
+            raise ValidationError(
+                {"application": "Only pending applications can be accepted."}
+            )
+
+        # checked after the gig is locked by the update, so confirmations of the
+        # same agent on other gigs cannot slip in between
+        scheduling.ensure_agent_available(
+            application.agent_id,
+            gig.start_datetime,
+            gig.end_datetime,
+            exclude=gig.pk,
+        )
+
+        GigApplication.objects.filter(gig_id=gig.pk, status="pending").update(
+            status="rejected", updated_at=now
+        )
+
+    gig.status = "agent_confirmed"
+    gig.agent_id = application.agent_id
+    gig._loaded_status = gig.status
+    application.status = "accepted"
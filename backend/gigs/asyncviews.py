@@ -0,0 +1,141 @@
+"""
+Async variants of the gig create, review, update and publish endpoints, for the
+ASGI application, see core/asyncviews.py.
+
+They answer like their synchronous counterparts in gigs/views.py. Gigs are looked
+up and reviewed with the async ORM, the review being built with the compiled
+representation, see gigs/representations.py. Creating, updating and publishing go
+through GigSerializer and Gig.publish(), which are synchronous, each in a single
+`sync_to_async` call.
+"""
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import Http404
+from django.utils.cache import get_conditional_response
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from authentication.authentication import AsyncJWTAuthentication
+from core.asyncviews import AsyncAPIView
+from core.mixins import make_validators, set_validator_headers
+from core.permissions import IsClient
+from gigs import representations
+from gigs.models import Gig
+from gigs.permissions import IsEditableGigStatus, IsGigOwner
+from gigs.serializers import GigSerializer
+
+
+class AsyncGigView(AsyncAPIView):
+    authentication_classes = [AsyncJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsClient, IsGigOwner]
+    serializer_class = GigSerializer
+
+    def not_found(self):
+        return Http404(f"No {Gig._meta.object_name} matches the given query.")
+
+    async def aget_object(self):
+        try:
+            gig = await Gig.objects.aget(pk=self.kwargs["pk"])
+        except Gig.DoesNotExist:
+            raise self.not_found()
+        self.check_object_permissions(self.request, gig)
+        return gig
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault(
+            "context",
+            {"request": self.request, "format": self.format_kwarg, "view": self},
+        )
+        return self.serializer_class(*args, **kwargs)
+
+
+class AsyncGigCreateView(AsyncGigView):
+    """
+    Create a new gig.
+
+    Only clients can create gigs.
+    """
+
+    permission_classes = [IsAuthenticated, IsClient]
+
+    async def post(self, request, format=None):
+        data = await sync_to_async(self.create)(request.data)
+        return Response(data, status=status.HTTP_201_CREATED)
+
+    def create(self, data):
+        serializer = self.get_serializer(data=data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save(client=self.request.user)
+        return serializer.data
+
+
+class AsyncGigClientReviewView(AsyncGigView):
+    """
+    Retrieve a gig for client review.
+    Clients can only access their own gigs.
+
+    Supports conditional requests, unchanged gigs are answered with 304 Not Modified.
+    """
+
+    async def get(self, request, pk, format=None):
+        row = await representations.values(Gig.objects.filter(pk=pk)).afirst()
+        if row is None:
+            raise self.not_found()
+        # the fields the permissions look at
+        self.check_object_permissions(
+            request, Gig(id=row["id"], client_id=row["client_id"], status=row["status"])
+        )
+
+        [gig] = await representations.arepresent_rows([row])
+        etag, timestamp = make_validators(
+            *representations.gig_version(row["updated_at"], gig["event_label"])
+        )
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = Response(gig)
+        set_validator_headers(response, etag, timestamp)
+        return response
+
+
+class AsyncGigUpdateView(AsyncGigView):
+    """
+    Update an existing gig, with PUT only.
+    Clients can update their gigs if they are in 'draft' or 'published' status.
+    Status updates through this endpoint will be ignored.
+    """
+
+    permission_classes = [IsAuthenticated, IsClient, IsGigOwner, IsEditableGigStatus]
+    http_method_names = ["put"]
+
+    async def put(self, request, pk, format=None):
+        gig = await self.aget_object()
+        data = await sync_to_async(self.update)(gig, request.data)
+        return Response(data)
+
+    def update(self, gig, data):
+        serializer = self.get_serializer(gig, data=data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return serializer.data
+
+
+class AsyncPublishGig(AsyncGigView):
+    """
+    Move gig from draft to published.
+    Only draft gigs can be published.
+    """
+
+    @extend_schema(request=None, responses=OpenApiTypes.OBJECT)
+    async def post(self, request, pk, format=None):
+        gig = await self.aget_object()
+
+        try:
+            await sync_to_async(gig.publish)()
+        except DjangoValidationError as e:
+            return Response(e.message_dict, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({"detail": "Gig published successfully"})
@@ -0,0 +1,198 @@
+"""
+Bulk creation of gigs from validated `GigSerializer` data.
+
+Creating gigs one by one costs a location and a venue lookup, an insert and one
+insert per event label for every gig. Here the distinct locations, venues and
+labels of the whole batch are resolved with a few set based queries and the gigs
+and their tagged items are inserted with `bulk_create`.
+
+Bulk inserts do not send model signals, so the search index and the event label
+counts are updated explicitly.
+"""
+
+from collections import Counter
+from functools import reduce
+from operator import or_
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import router, transaction
+from django.db.models import Q
+from taggit.models import Tag
+
+from core.models import Location
+from gigs import facets, geo, search
+from gigs.models import Gig, UUIDTaggedItem, Venue
+
+LOCATION_FIELDS = ("city", "state_region", "country")
+
+
+def _location_key(location_data):
+    return tuple(location_data[field] for field in LOCATION_FIELDS)
+
+
+def resolve_locations(locations_data, using):
+    """
+    Return a mapping of (city, state_region, country) to Location, creating the
+    locations that do not exist yet.
+    """
+    keys = {_location_key(location_data) for location_data in locations_data}
+    if not keys:
+        return {}
+
+    def fetch():
+        # narrow down on the individual fields, then match exact combinations
+        candidates = Location.objects.using(using).filter(
+            **{
+                f"{field}__in": {key[index] for key in keys}
+                for index, field in enumerate(LOCATION_FIELDS)
+            }
+        )
+        locations = {}
+        for location in candidates:
+            key = (location.city, location.state_region, location.country)
+            if key in keys:
+                locations[key] = location
+        return locations
+
+    locations = fetch()
+    missing = keys - locations.keys()
+    if missing:
+        Location.objects.using(using).bulk_create(
+            [Location(**dict(zip(LOCATION_FIELDS, key))) for key in missing],
+            ignore_conflicts=True,
+        )
+        locations = fetch()
+    return locations
+
+
+def resolve_venues(venues_data, using):
+    """
+    Return a mapping of google place id to Venue, creating the venues that do not
+    exist yet. Venues are identified by their google place id, existing venues are
+    reused as is and the first occurrence of a new venue in the batch wins.
+    """
+    venues_data = {
+        venue_data["google_place_id"]: venue_data
+        for venue_data in reversed(venues_data)
+    }
+    if not venues_data:
+        return {}
+
+    def fetch():
+        return Venue.objects.using(using).in_bulk(
+            venues_data.keys(), field_name="google_place_id"
+        )
+
+    venues = fetch()
+    missing = [
+        venue_data
+        for place_id, venue_data in venues_data.items()
+        if place_id not in venues
+    ]
+    if missing:
+        locations = resolve_locations(
+            [venue_data["location"] for venue_data in missing], using
+        )
+        new_venues = []
+        for venue_data in missing:
+            venue_data = dict(venue_data)
+            venue = Venue(
+                location=locations[_location_key(venue_data.pop("location"))],
+                **venue_data,
+            )
+            # bulk inserts skip save(), which keeps the grid cell up to date
+            venue.geo_cell = geo.cell_for(venue.latitude, venue.longitude)
+            new_venues.append(venue)
+        Venue.objects.using(using).bulk_create(new_venues, ignore_conflicts=True)
+        venues = fetch()
+    return venues
+
+
+def resolve_tags(names, using):
+    """
+    Return a mapping of lowercased name to Tag, creating the tags that do not exist
+    yet. Names are matched case insensitively, like taggit does with
+    TAGGIT_CASE_INSENSITIVE, and the first spelling of a new tag wins.
+    """
+    names = {name.lower(): name for name in reversed(names)}
+    if not names:
+        return {}
+
+    def fetch():
+        tags = {}
+        matching = Tag.objects.using(using).filter(
+            reduce(or_, (Q(name__iexact=name) for name in names))
+        )
+        for tag in matching.order_by("pk"):
+            tags.setdefault(tag.name.lower(), tag)
+        return tags
+
+    tags = fetch()
+    missing = [name for key, name in names.items() if key not in tags]
+    if missing:
+        Tag.objects.using(using).bulk_create(
+            [Tag(name=name, slug=Tag().slugify(name)) for name in missing],
+            ignore_conflicts=True,
+        )
+        tags = fetch()
+
+        # names whose slug was taken, taggit finds them a free slug one by one
+        for name in missing:
+            if name.lower() not in tags:
+                tag = Tag(name=name)
+                tag.save(using=using)
+                tags[name.lower()] = tag
+    return tags
+
+
+def create_gigs(gigs_data):
+    """
+    Create gigs from a list of validated `GigSerializer` data, in one transaction.
+    The data holds the saved fields as well, such as the client.
+    Returns the created gigs, in the same order.
+    """
+    gigs_data = [dict(gig_data) for gig_data in gigs_data]
+    using = router.db_for_write(Gig)
+
+    with transaction.atomic(using=using):
+        venues = resolve_venues(
+            [gig_data["venue"] for gig_data in gigs_data if gig_data.get("venue")],
+            using,
+        )
+        tags = resolve_tags(
+            [name for gig_data in gigs_data for name in gig_data["event_label"]],
+            using,
+        )
+
+        gigs = []
+        gig_tags = []
+        for gig_data in gigs_data:
+            names = gig_data.pop("event_label")
+            venue_data = gig_data.pop("venue", None)
+            gig = Gig(
+                **gig_data,
+                venue=venues[venue_data["google_place_id"]] if venue_data else None,
+            )
+            gig._loaded_status = gig.status
+            gigs.append(gig)
+            gig_tags.append({tags[name.lower()] for name in names})
+
+        Gig.objects.using(using).bulk_create(gigs)
+
+        content_type = ContentType.objects.db_manager(using).get_for_model(Gig)
+        UUIDTaggedItem.objects.using(using).bulk_create(
+            UUIDTaggedItem(content_type=content_type, object_id=gig.pk, tag=tag)
+            for gig, labels in zip(gigs, gig_tags)
+            for tag in labels
+        )
+
+        search.index_gigs([gig.pk for gig in gigs])
+        facets.adjust_counts(
+            Counter(
+                (tag.pk, gig.status)
+                for gig, labels in zip(gigs, gig_tags)
+                for tag in labels
+            )
+        )
+
+    return gigs
@@ -0,0 +1,132 @@
+"""
+Materialized event label counts used for faceted gig filtering.
+
+`EventLabelCount` holds one row per (label, gig status). Rows are adjusted
+incrementally from signals when a gig's labels or status change, so reading the
+facets is a single indexed query instead of a GROUP BY over the tagged items.
+"""
+
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import router, transaction
+from django.db.models import Count, F
+
+from gigs.models import EventLabelCount, Gig, UUIDTaggedItem
+
+
+def adjust_counts(deltas):
+    """
+    Apply count changes given as a mapping of (tag_id, status) -> delta.
+
+    Missing rows are created first and every row is then incremented in place with
+    an F() expression, so concurrent adjustments never overwrite each other.
+    """
+    grouped = defaultdict(list)
+    for (tag_id, status), delta in deltas.items():
+        if delta:
+            grouped[(status, delta)].append(tag_id)
+    if not grouped:
+        return
+
+    using = router.db_for_write(EventLabelCount)
+    with transaction.atomic(using=using):
+        EventLabelCount.objects.using(using).bulk_create(
+            [
+                EventLabelCount(tag_id=tag_id, status=status)
+                for (status, _), tag_ids in grouped.items()
+                for tag_id in tag_ids
+            ],
+            ignore_conflicts=True,
+        )
+        for (status, delta), tag_ids in grouped.items():
+            EventLabelCount.objects.using(using).filter(
+                status=status, tag_id__in=tag_ids
+            ).update(count=F("count") + delta)
+
+
+def add_labels(status, tag_ids):
+    adjust_counts({(tag_id, status): 1 for tag_id in tag_ids})
+
+
+def remove_labels(status, tag_ids):
+    adjust_counts({(tag_id, status): -1 for tag_id in tag_ids})
+
+
+def move_gigs(gig_ids, from_status, to_status):
+    """
+    Move the label counts of the given gigs from one status to another.
+    """
+    if from_status == to_status:
+        return
+
+    tag_counts = (
+        UUIDTaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(Gig),
+            object_id__in=gig_ids,
+        )
+        .values("tag_id")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+
+    deltas = defaultdict(int)
+    for row in tag_counts:
+        deltas[(row["tag_id"], from_status)] -= row["count"]
+        deltas[(row["tag_id"], to_status)] += row["count"]
+    adjust_counts(deltas)
+
+
+def label_counts(status="published", limit=50):
+    """
+    Return the most used event labels among gigs with the given status.
+    """
+    rows = (
+        EventLabelCount.objects.filter(status=status, count__gt=0)
+        .order_by("-count", "tag__name")
+        .values_list("tag__name", "count")[:limit]
+    )
+    return [{"label": name, "count": count} for name, count in rows]
+
+
+def gig_label_counts(queryset, limit=50):
+    """
+    Return the most used event labels among the gigs of the queryset, grouping
+    their tagged items. For filtered listings, the materialized counts only cover
+    whole statuses.
+    """
+    rows = (
+        UUIDTaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(Gig),
+            object_id__in=queryset.order_by().values("id"),
+        )
+        .values("tag__name")
+        .annotate(count=Count("id"))
+        .order_by("-count", "tag__name")
+        .values_list("tag__name", "count")[:limit]
+    )
+    return [{"label": name, "count": count} for name, count in rows]
+
+
+def rebuild_counts():
+    """
+    Recompute every count from the tagged items.
+    Returns the number of (label, status) rows written.
+    """
+    rows = (
+        Gig.objects.filter(event_label__isnull=False)
+        .values("event_label", "status")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+
+    using = router.db_for_write(EventLabelCount)
+    with transaction.atomic(using=using):
+        EventLabelCount.objects.using(using).all().delete()
+        created = EventLabelCount.objects.using(using).bulk_create(
+            EventLabelCount(
+                tag_id=row["event_label"], status=row["status"], count=row["count"]
+            )
+            for row in rows
+        )
+    return len(created)
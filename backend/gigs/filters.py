@@ -0,0 +1,49 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
+
+from gigs.models import Gig, UUIDTaggedItem
+from gigs.serializers import GigFilterSerializer
+
+
+def filter_gigs(queryset, query_params):
+    """
+    Apply the common gig listing filters from the request query parameters.
+
+    Supported filters:
+    - location_type: 'virtual' or 'physical'.
+    - country: country of the gig's venue.
+    - start_after / start_before: bounds on the gig's start datetime.
+    - labels: comma separated event labels, gigs with any of them match.
+
+    Raises a DRF ValidationError for invalid filter values.
+    """
+    serializer = GigFilterSerializer(data=query_params)
+    serializer.is_valid(raise_exception=True)
+    filters = serializer.validated_data
+
+    if "location_type" in filters:
+        queryset = queryset.filter(location_type=filters["location_type"])
+    if "country" in filters:
+        queryset = queryset.filter(venue__location__country=filters["country"])
+    if "start_after" in filters:
+        queryset = queryset.filter(start_datetime__gte=filters["start_after"])
+    if "start_before" in filters:
+        queryset = queryset.filter(start_datetime__lt=filters["start_before"])
+    if "labels" in filters:
+        label_filter = Q()
+        for name in filters["labels"].split(","):
+            if name.strip():
+                label_filter |= Q(tag__name__iexact=name.strip())
+        tagged_gigs = UUIDTaggedItem.objects.filter(
+            label_filter, content_type=ContentType.objects.get_for_model(Gig)
+        ).values("object_id")
+        queryset = queryset.filter(id__in=tagged_gigs)
+
+    return queryset
+
+
+def has_filters(query_params):
+    """
+    Return whether the query parameters set any of the gig listing filters.
+    """
+    return any(query_params.get(name) for name in GigFilterSerializer().fields)
@@ -0,0 +1,142 @@
+"""
+Radius search for physical gigs on a plain SQLite database.
+
+Venues are bucketed into fixed size latitude/longitude grid cells stored in the
+indexed `Venue.geo_cell` column. A nearby search first selects the cells covering
+the search circle's bounding box, which prunes candidates with an index lookup,
+then computes the exact haversine distance over the remaining candidates in a
+single vectorized pass.
+
+NumPy is imported lazily since this module is imported by the models on startup.
+"""
+
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+# cells are a tenth of a degree wide, about 11 km of latitude
+CELLS_PER_DEGREE = 10
+LATITUDE_CELLS = 180 * CELLS_PER_DEGREE
+LONGITUDE_CELLS = 360 * CELLS_PER_DEGREE
+
+# past this many cells the IN list costs more than it prunes, a bounding box
+# filter on the coordinates is used instead
+MAX_SEARCH_CELLS = 400
+
+
+def _latitude_index(latitude):
+    return min(math.floor((latitude + 90) * CELLS_PER_DEGREE), LATITUDE_CELLS - 1)
+
+
+def _longitude_index(longitude):
+    return math.floor((longitude + 180) * CELLS_PER_DEGREE) % LONGITUDE_CELLS
+
+
+def cell_for(latitude, longitude):
+    """
+    Return the grid cell key of a coordinate, or an empty string if unknown.
+    """
+    if latitude is None or longitude is None:
+        return ""
+    return f"{_latitude_index(latitude)}:{_longitude_index(longitude)}"
+
+
+def bounding_box(latitude, longitude, radius_km):
+    """
+    Return (min_lat, max_lat, min_lon, max_lon) of a box containing the circle.
+    Longitudes may fall outside [-180, 180] when the circle crosses the antimeridian.
+    """
+    delta_latitude = radius_km / KM_PER_DEGREE
+    min_latitude = max(latitude - delta_latitude, -90.0)
+    max_latitude = min(latitude + delta_latitude, 90.0)
+
+    # the widest parallel inside the box decides the longitude span
+    widest = max(abs(min_latitude), abs(max_latitude))
+    cos_latitude = math.cos(math.radians(widest))
+    if widest >= 90 or radius_km / KM_PER_DEGREE / cos_latitude >= 180:
+        return min_latitude, max_latitude, -180.0, 180.0
+
+    delta_longitude = radius_km / (KM_PER_DEGREE * cos_latitude)
+    return (
+        min_latitude,
+        max_latitude,
+        longitude - delta_longitude,
+        longitude + delta_longitude,
+    )
+
+
+def cells_covering(latitude, longitude, radius_km):
+    """
+    Return the grid cells covering the bounding box of the search circle,
+    or None if there are more than MAX_SEARCH_CELLS of them.
+    """
+    min_latitude, max_latitude, min_longitude, max_longitude = bounding_box(
+        latitude, longitude, radius_km
+    )
+    latitude_indexes = range(
+        _latitude_index(min_latitude), _latitude_index(max_latitude) + 1
+    )
+
+    if max_longitude - min_longitude >= 360:
+        longitude_indexes = range(LONGITUDE_CELLS)
+    else:
+        first = math.floor((min_longitude + 180) * CELLS_PER_DEGREE)
+        last = math.floor((max_longitude + 180) * CELLS_PER_DEGREE)
+        longitude_indexes = {
+            index % LONGITUDE_CELLS for index in range(first, last + 1)
+        }
+
+    if len(latitude_indexes) * len(longitude_indexes) > MAX_SEARCH_CELLS:
+        return None
+    return [f"{i}:{j}" for i in latitude_indexes for j in longitude_indexes]
+
+
+def haversine_km(latitude, longitude, latitudes, longitudes):
+    """
+    Vectorized great circle distance in km from one point to arrays of points.
+    """
+    import numpy as np
+
+    latitude = np.radians(latitude)
+    latitudes = np.radians(latitudes)
+    delta_latitude = latitudes - latitude
+    delta_longitude = np.radians(longitudes) - np.radians(longitude)
+
+    a = (
+        np.sin(delta_latitude / 2) ** 2
+        + np.cos(latitude) * np.cos(latitudes) * np.sin(delta_longitude / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def nearby_gigs(queryset, latitude, longitude, radius_km):
+    """
+    Return (gig_id, distance_km) pairs of gigs in `queryset` whose venue is within
+    `radius_km` of the given point, nearest first.
+    """
+    cells = cells_covering(latitude, longitude, radius_km)
+    if cells is not None:
+        queryset = queryset.filter(venue__geo_cell__in=cells)
+    else:
+        min_latitude, max_latitude, _, _ = bounding_box(latitude, longitude, radius_km)
+        queryset = queryset.filter(
+            venue__latitude__gte=min_latitude, venue__latitude__lte=max_latitude
+        )
+
+    candidates = list(
+        queryset.filter(
+            venue__latitude__isnull=False, venue__longitude__isnull=False
+        ).values_list("id", "venue__latitude", "venue__longitude")
+    )
+    if not candidates:
+        return []
+
+    import numpy as np
+
+    coordinates = np.array([candidate[1:] for candidate in candidates], dtype=float)
+    distances = haversine_km(latitude, longitude, coordinates[:, 0], coordinates[:, 1])
+
+    within = np.flatnonzero(distances <= radius_km)
+    nearest_first = within[np.argsort(distances[within], kind="stable")]
+    return [(candidates[i][0], float(distances[i])) for i in nearest_first]
@@ -0,0 +1,126 @@
+import random
+import time
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from gigs import bulk, representations
+from gigs.models import Gig
+from gigs.serializers import GigSerializer
+
+LABELS = ["conference", "workshop", "meetup", "corporate", "party", "wedding"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the time taken to represent gigs with GigSerializer and with the "
+        "compiled read representation. Benchmark gigs are rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=1000, help="Number of gigs to represent."
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of timed runs, the fastest one is reported.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.create_gigs(options["rows"])
+            queryset = Gig.objects.order_by("start_datetime", "id")
+
+            serializer_time, expected = self.time(
+                lambda: GigSerializer(
+                    queryset.select_related("venue__location").prefetch_related(
+                        "event_label"
+                    ),
+                    many=True,
+                ).data,
+                options["repeat"],
+            )
+            compiled_time, compiled = self.time(
+                lambda: representations.represent_gigs(queryset), options["repeat"]
+            )
+
+            renderer = JSONRenderer()
+            if renderer.render(compiled) != renderer.render(expected):
+                raise CommandError("Compiled output differs from GigSerializer.")
+
+            transaction.set_rollback(True)
+
+        rows = options["rows"]
+        self.stdout.write(
+            f"GigSerializer: {serializer_time * 1000:.1f} ms, "
+            f"{serializer_time / rows * 1e6:.1f} us per gig"
+        )
+        self.stdout.write(
+            f"Compiled:      {compiled_time * 1000:.1f} ms, "
+            f"{compiled_time / rows * 1e6:.1f} us per gig"
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Compiled representation is {serializer_time / compiled_time:.1f}x "
+                f"faster over {rows} gigs, output identical."
+            )
+        )
+
+    def time(self, represent, repeat):
+        """
+        Return the fastest run time and the output of the last run.
+        """
+        best = None
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            output = represent()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, output
+
+    def create_gigs(self, rows):
+        client = get_user_model().objects.create_user(
+            email="benchmark-client@example.com",
+            password=None,
+            full_name="Benchmark Client",
+            is_client=True,
+        )
+        randomizer = random.Random(0)
+        start = timezone.now() + timezone.timedelta(days=1)
+        gigs_data = []
+        for i in range(rows):
+            gig_start = start + timezone.timedelta(hours=i)
+            gig_data = {
+                "title": f"Benchmark gig {i}",
+                "description": "A benchmark gig description, long enough to be valid.",
+                "event_label": randomizer.sample(LABELS, 3),
+                "location_type": "virtual",
+                "start_datetime": gig_start,
+                "end_datetime": gig_start + timezone.timedelta(hours=2),
+                "timezone": "UTC",
+                "compensation": Decimal(randomizer.randint(50, 5000)),
+                "status": "published",
+                "client": client,
+            }
+            if i % 2:
+                gig_data["location_type"] = "physical"
+                gig_data["venue"] = {
+                    "google_place_id": f"benchmark-place-{i % 50}",
+                    "name": f"Benchmark venue {i % 50}",
+                    "address": "1 Benchmark Street",
+                    "location": {
+                        "city": "Nairobi",
+                        "state_region": "Nairobi",
+                        "country": "Kenya",
+                    },
+                    "latitude": -1.28,
+                    "longitude": 36.82,
+                }
+            gigs_data.append(gig_data)
+        bulk.create_gigs(gigs_data)
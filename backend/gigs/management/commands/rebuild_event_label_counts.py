@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from gigs import facets
+
+
+class Command(BaseCommand):
+    help = "Recompute the materialized gig counts per event label and status."
+
+    def handle(self, *args, **options):
+        rows = facets.rebuild_counts()
+        self.stdout.write(self.style.SUCCESS(f"Wrote {rows} event label counts."))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from gigs import search
+
+
+class Command(BaseCommand):
+    help = "Rebuild the gig full text search index from scratch."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of gigs indexed per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        indexed = search.rebuild_index(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} gigs."))
@@ -0,0 +1,56 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from gigs.seeding import Seeder
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a large dataset of users, locations, venues and gigs with their "
+        "event labels, using bulk inserts. The same seed gives the same data."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--gigs", type=int, default=100_000)
+        parser.add_argument("--users", type=int, default=20_000)
+        parser.add_argument("--locations", type=int, default=1_000)
+        parser.add_argument("--venues", type=int, default=5_000)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10_000,
+            help="Number of rows inserted per transaction.",
+        )
+        parser.add_argument(
+            "--password",
+            default="password",
+            help="Password of every generated user.",
+        )
+        parser.add_argument(
+            "--skip-index",
+            action="store_true",
+            help="Do not rebuild the search index and event label counts.",
+        )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        Seeder(
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            password=options["password"],
+        ).seed(
+            users=options["users"],
+            locations=options["locations"],
+            venues=options["venues"],
+            gigs=options["gigs"],
+            index=not options["skip_index"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {options['users']} users, {options['locations']} locations, "
+                f"{options['venues']} venues and {options['gigs']} gigs in "
+                f"{time.perf_counter() - start:.1f} s."
+            )
+        )
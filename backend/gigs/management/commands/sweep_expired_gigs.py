@@ -0,0 +1,44 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from gigs import sweeper
+
+
+class Command(BaseCommand):
+    help = (
+        "Complete agent confirmed gigs and cancel published gigs whose end date "
+        "and time has passed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of gigs moved per transaction.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, sweeping every --interval seconds.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=300,
+            help="Seconds between sweeps in loop mode.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            moved = sweeper.sweep_expired_gigs(batch_size=options["batch_size"])
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Completed {moved['completed']} gigs, "
+                    f"cancelled {moved['cancelled']} gigs."
+                )
+            )
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.12 on 2026-10-18 13:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gigs', '0015_alter_gig_timezone_alter_venue_address_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='gig',
+            index=models.Index(fields=['status', 'start_datetime', 'id'], name='gigs_status_start_id_idx'),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.12 on 2026-10-18 13:20
+
+from django.db import migrations
+
+
+def populate_search_index(apps, schema_editor):
+    Gig = apps.get_model("gigs", "Gig")
+    UUIDTaggedItem = apps.get_model("gigs", "UUIDTaggedItem")
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    using = schema_editor.connection.alias
+
+    labels = {}
+    content_type = ContentType.objects.using(using).filter(
+        app_label="gigs", model="gig"
+    ).first()
+    if content_type is not None:
+        tagged_items = UUIDTaggedItem.objects.using(using).filter(
+            content_type=content_type
+        ).values_list("object_id", "tag__name")
+        for gig_id, name in tagged_items:
+            labels.setdefault(gig_id, []).append(name)
+
+    rows = [
+        (
+            int.from_bytes(gig_id.bytes[:8], "big", signed=True),
+            gig_id.hex,
+            title,
+            description,
+            " ".join(labels.get(gig_id, [])),
+        )
+        for gig_id, title, description in Gig.objects.using(using).values_list(
+            "id", "title", "description"
+        )
+    ]
+    with schema_editor.connection.cursor() as cursor:
+        cursor.executemany(
+            "INSERT INTO gigs_search (rowid, gig_id, title, description, event_labels) "
+            "VALUES (%s, %s, %s, %s, %s)",
+            rows,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('gigs', '0016_gig_status_start_id_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE VIRTUAL TABLE gigs_search USING fts5("
+                "gig_id UNINDEXED, title, description, event_labels, "
+                "tokenize = 'porter unicode61')"
+            ),
+            reverse_sql="DROP TABLE gigs_search",
+        ),
+        migrations.RunPython(populate_search_index, migrations.RunPython.noop),
+    ]
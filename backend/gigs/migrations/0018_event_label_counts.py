@@ -0,0 +1,101 @@
+# Generated by Django 5.2.12 on 2026-10-18 13:04
+
+from collections import Counter
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_event_label_counts(apps, schema_editor):
+    Gig = apps.get_model("gigs", "Gig")
+    UUIDTaggedItem = apps.get_model("gigs", "UUIDTaggedItem")
+    EventLabelCount = apps.get_model("gigs", "EventLabelCount")
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    using = schema_editor.connection.alias
+
+    content_type = (
+        ContentType.objects.using(using).filter(app_label="gigs", model="gig").first()
+    )
+    if content_type is None:
+        return
+
+    statuses = dict(Gig.objects.using(using).values_list("id", "status"))
+    counts = Counter()
+    tagged_items = (
+        UUIDTaggedItem.objects.using(using)
+        .filter(content_type=content_type)
+        .values_list("object_id", "tag_id")
+    )
+    for gig_id, tag_id in tagged_items:
+        if gig_id in statuses:
+            counts[(tag_id, statuses[gig_id])] += 1
+
+    EventLabelCount.objects.using(using).bulk_create(
+        EventLabelCount(tag_id=tag_id, status=status, count=count)
+        for (tag_id, status), count in counts.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("gigs", "0017_gig_search_index"),
+        (
+            "taggit",
+            "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx",
+        ),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventLabelCount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("draft", "Draft"),
+                            ("published", "Published"),
+                            ("agent_confirmed", "Agent Confirmed"),
+                            ("completed", "Completed"),
+                            ("cancelled", "Cancelled"),
+                        ],
+                        max_length=30,
+                    ),
+                ),
+                ("count", models.IntegerField(default=0)),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="gig_counts",
+                        to="taggit.tag",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "event_label_counts",
+                "indexes": [
+                    models.Index(
+                        fields=["status", "-count"], name="label_counts_status_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("tag", "status"), name="unique_event_label_count"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_event_label_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.12 on 2026-10-18 13:06
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gigs", "0018_event_label_counts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="venue",
+            name="geo_cell",
+            field=models.CharField(
+                blank=True, db_index=True, default="", editable=False, max_length=16
+            ),
+        ),
+        migrations.AddField(
+            model_name="venue",
+            name="latitude",
+            field=models.FloatField(
+                blank=True,
+                null=True,
+                validators=[
+                    django.core.validators.MinValueValidator(-90),
+                    django.core.validators.MaxValueValidator(90),
+                ],
+            ),
+        ),
+        migrations.AddField(
+            model_name="venue",
+            name="longitude",
+            field=models.FloatField(
+                blank=True,
+                null=True,
+                validators=[
+                    django.core.validators.MinValueValidator(-180),
+                    django.core.validators.MaxValueValidator(180),
+                ],
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.12 on 2026-10-18 13:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gigs", "0020_agent_schedule_index"),
+        (
+            "taggit",
+            "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="gig",
+            index=models.Index(
+                fields=["status", "end_datetime"], name="gigs_status_end_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.12 on 2026-10-18 13:58
+
+import core.timezones
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gigs", "0023_gig_applications"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="gig",
+            name="timezone",
+            field=models.CharField(
+                default="UTC",
+                max_length=50,
+                validators=[core.timezones.validate_timezone],
+            ),
+        ),
+    ]
@@ -1,13 +1,18 @@
 import uuid
-import zoneinfo
 from decimal import Decimal
 
 from django.core.exceptions import ValidationError
-from django.core.validators import MinLengthValidator, MinValueValidator
+from django.core.validators import (
+    MaxValueValidator,
+    MinLengthValidator,
+    MinValueValidator,
+)
 from django.db import models
 from taggit.managers import TaggableManager
 from taggit.models import GenericUUIDTaggedItemBase, TaggedItemBase
 
+from core.timezones import validate_timezone
+from gigs import geo
 from gigs.validators import (
     validate_client,
     validate_agent,
@@ -42,8 +47,6 @@ class Gig(models.Model):
         ),  # possibly replace this with paused? deleting vs pausing
     ]
 
-    TIMEZONES_CHOICES = [(tz, tz) for tz in zoneinfo.available_timezones()]
-
     # gig details
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=100, validators=[MinLengthValidator(3)])
@@ -67,7 +70,7 @@ class Gig(models.Model):
     end_datetime = models.DateTimeField()
     timezone = models.CharField(
         max_length=50,
-        choices=TIMEZONES_CHOICES,
+        validators=[validate_timezone],
         default="UTC",
     )  # the original timezone while creating the gig
 
@@ -97,11 +100,51 @@ class Gig(models.Model):
         validators=[validate_agent],
     )
 
+    # number of applications not withdrawn, kept up to date with F()
+    # expressions, see gigs/applications.py
+    application_count = models.PositiveIntegerField(default=0, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = "gigs"
+        indexes = [
+            # serves the published gig feed, which is keyset paginated on
+            # (start_datetime, id) within a status
+            models.Index(
+                fields=["status", "start_datetime", "id"],
+                name="gigs_status_start_id_idx",
+            ),
+            # serves the agent schedule, which scans an agent's booked gigs
+            # in start datetime order
+            models.Index(
+                fields=["agent", "status", "start_datetime"],
+                name="gigs_agent_status_start_idx",
+            ),
+            # serves the sweeper, which looks for gigs past their end datetime
+            # within a status
+            models.Index(
+                fields=["status", "end_datetime"],
+                name="gigs_status_end_idx",
+            ),
+            # serves the client dashboard, listing a client's gigs in start
+            # datetime order, optionally within a status
+            models.Index(
+                fields=["client", "status", "start_datetime"],
+                name="gigs_client_status_start_idx",
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the status loaded from the database so status changes can be
+        detected on save without querying the old row.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_status = instance.__dict__.get("status")
+        return instance
 
     def publish(self):
         """
@@ -116,8 +159,15 @@ class Gig(models.Model):
 
         validate_start_end_datetime(self.start_datetime, self.end_datetime)
 
-        self.status = "published"
-        self.save()
+        # imported here as the transitions module depends on this one
+        from gigs.transitions import transition_gig
+
+        # the status is checked again by the update, in case the gig changed since
+        # it was loaded
+        if not transition_gig(self, "publish"):
+            raise ValidationError(
+                {"status": "Only gigs with status 'draft' can be published"}
+            )
 
     def clean(self):
         """
@@ -126,12 +176,21 @@ class Gig(models.Model):
         - Start datetime is in the future.
         - End datetime is after start datetime.
         - Location fields are valid based on location type.
+        - The agent, if any, is not booked on another gig during this time.
         """
         super().clean()
 
         validate_start_end_datetime(self.start_datetime, self.end_datetime)
         validate_location_fields(self.location_type, self.venue)
 
+        if self.agent_id is not None:
+            # imported here as the scheduling module depends on this one
+            from gigs.scheduling import ensure_agent_available
+
+            ensure_agent_available(
+                self.agent_id, self.start_datetime, self.end_datetime, exclude=self.pk
+            )
+
     def __str__(self):
         return self.title
 
@@ -144,8 +203,112 @@ class Venue(models.Model):
         "core.Location", on_delete=models.CASCADE, related_name="venues"
     )
 
+    # coordinates, used for radius searches
+    latitude = models.FloatField(
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-90), MaxValueValidator(90)],
+    )
+    longitude = models.FloatField(
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-180), MaxValueValidator(180)],
+    )
+    geo_cell = models.CharField(
+        max_length=16, blank=True, default="", db_index=True, editable=False
+    )  # grid cell of the coordinates, see gigs/geo.py
+
     class Meta:
         db_table = "venues"
 
+    def save(self, *args, **kwargs):
+        """
+        Keep the grid cell in step with the coordinates.
+        """
+        self.geo_cell = geo.cell_for(self.latitude, self.longitude)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"latitude", "longitude"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "geo_cell"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.name
+
+
+class EventLabelCount(models.Model):
+    """
+    Materialized number of gigs per event label and gig status.
+
+    Counting gigs per label at query time needs a GROUP BY over the generic tagged
+    item join, these rows are instead updated incrementally as labels and statuses
+    change. See gigs/facets.py.
+    """
+
+    tag = models.ForeignKey(
+        "taggit.Tag", on_delete=models.CASCADE, related_name="gig_counts"
+    )
+    status = models.CharField(max_length=30, choices=Gig.STATUS_CHOICES)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "event_label_counts"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tag", "status"], name="unique_event_label_count"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["status", "-count"], name="label_counts_status_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.tag}: {self.count} {self.status}"
+
+
+class GigApplication(models.Model):
+    """
+    An agent's application to work on a published gig.
+    """
+
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("accepted", "Accepted"),
+        ("rejected", "Rejected"),
+        ("withdrawn", "Withdrawn"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    gig = models.ForeignKey(Gig, on_delete=models.CASCADE, related_name="applications")
+    agent = models.ForeignKey(
+        "users.CustomUser",
+        on_delete=models.CASCADE,
+        related_name="gig_applications",
+    )
+    message = models.TextField(blank=True, default="")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "gig_applications"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["gig", "agent"], name="unique_gig_application"
+            ),
+        ]
+        indexes = [
+            # serve the per gig and per agent lists, keyset paginated on
+            # (created_at, id)
+            models.Index(
+                fields=["gig", "created_at", "id"],
+                name="gig_applications_gig_idx",
+            ),
+            models.Index(
+                fields=["agent", "created_at", "id"],
+                name="gig_applications_agent_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.agent} on {self.gig}"
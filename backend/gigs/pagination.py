@@ -0,0 +1,158 @@
+import base64
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Forward-only keyset (cursor) pagination.
+
+    Pages are fetched with `WHERE (a, b) > (last_a, last_b) ORDER BY a, b LIMIT n`
+    instead of OFFSET, so the cost of a page does not grow with its depth as long
+    as an index covers the ordering fields.
+    The ordering must be unique, hence the primary key is used as the last field.
+    """
+
+    ordering = ("start_datetime", "id")
+    page_size = 20
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        position = self.decode_cursor(request, queryset.model)
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(position))
+
+        # fetch one extra row to know whether there is a next page
+        results = list(queryset.order_by(*self.ordering)[: self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_position_filter(self, position):
+        """
+        Build the lexicographic `(a, b, ...) > (va, vb, ...)` condition.
+        """
+        condition = Q()
+        for index, field in enumerate(self.ordering):
+            equal_prefix = {
+                prefix: position[prefix] for prefix in self.ordering[:index]
+            }
+            condition |= Q(**equal_prefix, **{f"{field}__gt": position[field]})
+        return condition
+
+    def get_position(self, item):
+        # items are model instances, or dicts when paginating `.values()`
+        if isinstance(item, dict):
+            return {field: item[field] for field in self.ordering}
+        return {field: getattr(item, field) for field in self.ordering}
+
+    def encode_cursor(self, position):
+        values = [
+            value.isoformat() if hasattr(value, "isoformat") else str(value)
+            for value in (position[field] for field in self.ordering)
+        ]
+        payload = json.dumps(values, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(payload).decode("ascii")
+
+    def decode_cursor(self, request, model):
+        """
+        Decode the cursor into a position, converting each value with its model field
+        so malformed cursors are rejected before hitting the database.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+            position = {
+                field: model._meta.get_field(field).to_python(value)
+                for field, value in zip(self.ordering, values)
+            }
+        except (TypeError, ValueError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return position
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+
+        cursor = self.encode_cursor(self.get_position(self.page[-1]))
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                },
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page.",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
+class ApplicationPagination(KeysetPagination):
+    """
+    Keyset pagination over gig applications, oldest first.
+    """
+
+    ordering = ("created_at", "id")
@@ -9,7 +9,8 @@ class IsGigOwner(BasePermission):
     message = "You do not have permission to perform this action on this gig"
 
     def has_object_permission(self, request, view, obj):
-        return obj.client == request.user
+        # compare keys, so the gig's client is not loaded
+        return obj.client_id == request.user.pk
 
 
 class IsEditableGigStatus(BasePermission):
@@ -0,0 +1,198 @@
+"""
+Ranking of published gigs for an agent.
+
+Candidates are loaded once into compact NumPy arrays, the database computing the
+location match level of each gig, which needs joins. The number of preferred
+labels per gig comes from a single grouped query over the tagged items of those
+labels, merged into the arrays: as a correlated subquery per gig, SQLite plans it
+through the content type index when the tables were not analyzed, quadratically.
+Scoring and top-k selection are then vectorized over the whole pool, so
+a pool of tens of thousands of gigs is ranked without per-gig Python.
+"""
+
+import numpy as np
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Case, Count, IntegerField, When
+from django.utils import timezone
+
+from gigs.models import Gig, UUIDTaggedItem
+
+MAX_CANDIDATES = 50_000
+
+WEIGHTS = {
+    "location": 0.35,
+    "labels": 0.35,
+    "compensation": 0.15,
+    "start_time": 0.15,
+}
+
+# location match levels, computed by the database
+NO_MATCH, SAME_COUNTRY, SAME_REGION, SAME_CITY, VIRTUAL = range(5)
+LOCATION_SCORES = (0.0, 0.3, 0.6, 1.0, 0.5)
+
+# gigs starting sooner than this cannot be planned for
+MIN_LEAD_HOURS = 12
+# gigs starting within this window score fully, later ones decay
+IDEAL_LEAD_HOURS = 72
+LEAD_DECAY_HOURS = 14 * 24
+
+
+class CandidatePool:
+    """
+    Compact column arrays describing the gigs that can be recommended to an agent.
+    """
+
+    def __init__(
+        self,
+        ids,
+        location_levels,
+        label_matches,
+        compensations,
+        start_timestamps,
+        preferred_label_count,
+    ):
+        self.ids = ids
+        self.location_levels = np.asarray(location_levels, dtype=np.int8)
+        self.label_matches = np.asarray(label_matches, dtype=np.int16)
+        self.compensations = np.asarray(compensations, dtype=np.float64)
+        self.start_timestamps = np.asarray(start_timestamps, dtype=np.float64)
+        self.preferred_label_count = preferred_label_count
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def for_agent(cls, agent, now=None, limit=MAX_CANDIDATES):
+        """
+        Load the published, unassigned and upcoming gigs the agent could take on.
+        """
+        now = now or timezone.now()
+        preferred_label_ids = list(agent.preferred_labels.values_list("id", flat=True))
+
+        rows = (
+            Gig.objects.filter(
+                status="published", start_datetime__gt=now, agent__isnull=True
+            )
+            .exclude(client_id=agent.pk)
+            .annotate(
+                location_level=location_level(agent.location),
+            )
+            .order_by("start_datetime", "id")
+            .values_list(
+                "id",
+                "location_level",
+                "compensation",
+                "start_datetime",
+            )[:limit]
+        )
+
+        columns = list(zip(*rows)) or [(), (), (), ()]
+        ids, levels, compensations, starts = columns
+        matches = label_matches(preferred_label_ids)
+        return cls(
+            ids=list(ids),
+            location_levels=levels,
+            label_matches=[matches.get(gig_id, 0) for gig_id in ids],
+            compensations=[float(compensation) for compensation in compensations],
+            start_timestamps=[start.timestamp() for start in starts],
+            preferred_label_count=len(preferred_label_ids),
+        )
+
+
+def location_level(location):
+    """
+    Expression ranking how close a gig's venue is to the agent's location.
+    """
+    whens = [When(location_type="virtual", then=VIRTUAL)]
+    if location is not None:
+        whens += [
+            When(venue__location_id=location.pk, then=SAME_CITY),
+            When(
+                venue__location__state_region=location.state_region,
+                venue__location__country=location.country,
+                then=SAME_REGION,
+            ),
+            When(venue__location__country=location.country, then=SAME_COUNTRY),
+        ]
+    return Case(*whens, default=NO_MATCH, output_field=IntegerField())
+
+
+def label_matches(tag_ids):
+    """
+    Return a mapping of gig id to how many of the given labels the gig has, for
+    the gigs having any, in one query through the tag index.
+    """
+    if not tag_ids:
+        return {}
+
+    return dict(
+        UUIDTaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(Gig),
+            tag_id__in=tag_ids,
+        )
+        .order_by()
+        .values("object_id")
+        .annotate(count=Count("id"))
+        .values_list("object_id", "count")
+    )
+
+
+def score(pool, now=None):
+    """
+    Score every gig in the pool, higher is a better match. Scores are in [0, 1].
+    """
+    if not len(pool):
+        return np.zeros(0)
+
+    now = (now or timezone.now()).timestamp()
+
+    location_scores = np.asarray(LOCATION_SCORES)[pool.location_levels]
+
+    label_scores = np.minimum(
+        pool.label_matches / max(pool.preferred_label_count, 1), 1.0
+    )
+
+    # compensation relative to the pool, on a log scale so outliers do not
+    # flatten everybody else
+    log_compensations = np.log1p(pool.compensations)
+    spread = log_compensations.max() - log_compensations.min()
+    if spread > 0:
+        compensation_scores = (log_compensations - log_compensations.min()) / spread
+    else:
+        compensation_scores = np.ones(len(pool))
+
+    lead_hours = (pool.start_timestamps - now) / 3600
+    start_time_scores = np.where(
+        lead_hours < MIN_LEAD_HOURS,
+        0.0,
+        np.exp(-np.maximum(lead_hours - IDEAL_LEAD_HOURS, 0) / LEAD_DECAY_HOURS),
+    )
+
+    return (
+        WEIGHTS["location"] * location_scores
+        + WEIGHTS["labels"] * label_scores
+        + WEIGHTS["compensation"] * compensation_scores
+        + WEIGHTS["start_time"] * start_time_scores
+    )
+
+
+def top_matches(pool, scores, limit):
+    """
+    Return (gig_id, score) pairs of the best scoring gigs, best first.
+    Ties keep the pool's start datetime order.
+    """
+    if limit < len(pool):
+        best = np.argpartition(-scores, limit - 1)[:limit]
+    else:
+        best = np.arange(len(pool))
+    best = best[np.lexsort((best, -scores[best]))]
+    return [(pool.ids[i], float(scores[i])) for i in best]
+
+
+def recommend(agent, limit=20, now=None):
+    """
+    Return (gig_id, score) pairs of the gigs best matching the agent, best first.
+    """
+    now = now or timezone.now()
+    pool = CandidatePool.for_agent(agent, now=now)
+    return top_matches(pool, score(pool, now=now), limit)
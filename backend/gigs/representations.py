@@ -0,0 +1,208 @@
+"""
+Compiled read representation of gigs for list endpoints.
+
+`GigSerializer` builds every gig through DRF's field machinery, along with nested
+venue and location serializers and the taggit list field, which costs far more
+CPU than the queries behind a page. Here gigs are read as `.values()` rows, with
+the event labels of the whole page fetched and grouped in one query, and turned
+into plain dicts by straight line code.
+
+The output renders to exactly the same JSON as `GigSerializer(many=True).data`,
+see `test_representations.py`. Any field added to `GigSerializer` must be added
+here as well.
+"""
+
+from decimal import Decimal
+
+from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
+
+from gigs.models import Gig, UUIDTaggedItem
+
+GIG_VALUES = (
+    "id",
+    "title",
+    "description",
+    "location_type",
+    "venue_id",
+    "venue__google_place_id",
+    "venue__name",
+    "venue__address",
+    "venue__location_id",
+    "venue__location__city",
+    "venue__location__state_region",
+    "venue__location__country",
+    "venue__latitude",
+    "venue__longitude",
+    "start_datetime",
+    "end_datetime",
+    "timezone",
+    "compensation",
+    "status",
+    "client_id",
+    "agent_id",
+    "application_count",
+    "created_at",
+    "updated_at",
+)
+
+COMPENSATION_QUANTUM = Decimal(1).scaleb(
+    -Gig._meta.get_field("compensation").decimal_places
+)
+
+
+def _datetime_formatter():
+    """
+    Return a function formatting datetimes like DRF's ISO 8601 DateTimeField,
+    in the current time zone.
+    """
+    current_timezone = timezone.get_current_timezone()
+
+    def format_datetime(value):
+        value = value.astimezone(current_timezone).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return format_datetime
+
+
+def _group_labels(tagged_items):
+    labels = {}
+    for gig_id, name in tagged_items:
+        labels.setdefault(gig_id, []).append(name)
+    for names in labels.values():
+        names.sort()
+    return labels
+
+
+def event_labels_by_gig(gig_ids, using=None):
+    """
+    Return a mapping of gig id to its event label names, sorted like
+    `EventLabelListField` sorts them.
+    """
+    tagged_items = (
+        UUIDTaggedItem.objects.using(using)
+        .filter(
+            content_type=ContentType.objects.db_manager(using).get_for_model(Gig),
+            object_id__in=gig_ids,
+        )
+        .values_list("object_id", "tag__name")
+    )
+    return _group_labels(tagged_items)
+
+
+async def aevent_labels_by_gig(gig_ids, using=None):
+    """
+    Async version of `event_labels_by_gig`. The content type is matched with a
+    join, looking it up may query the database outside the async ORM.
+    """
+    tagged_items = (
+        UUIDTaggedItem.objects.using(using)
+        .filter(
+            content_type__app_label=Gig._meta.app_label,
+            content_type__model=Gig._meta.model_name,
+            object_id__in=gig_ids,
+        )
+        .values_list("object_id", "tag__name")
+    )
+    return _group_labels([item async for item in tagged_items])
+
+
+def represent_rows(rows, using=None):
+    """
+    Turn `.values(*GIG_VALUES)` rows into gig representations, in the same order.
+    """
+    labels = event_labels_by_gig([row["id"] for row in rows], using)
+    return _represent(rows, labels)
+
+
+async def arepresent_rows(rows, using=None):
+    """
+    Async version of `represent_rows`.
+    """
+    labels = await aevent_labels_by_gig([row["id"] for row in rows], using)
+    return _represent(rows, labels)
+
+
+def _represent(rows, labels):
+    format_datetime = _datetime_formatter()
+
+    representations = []
+    for row in rows:
+        venue = None
+        if row["venue_id"] is not None:
+            venue = {
+                "id": row["venue_id"],
+                "google_place_id": row["venue__google_place_id"],
+                "name": row["venue__name"],
+                "address": row["venue__address"],
+                "location": {
+                    "id": row["venue__location_id"],
+                    "city": row["venue__location__city"],
+                    "state_region": row["venue__location__state_region"],
+                    "country": row["venue__location__country"],
+                },
+                "latitude": row["venue__latitude"],
+                "longitude": row["venue__longitude"],
+            }
+
+        representations.append(
+            {
+                "id": str(row["id"]),
+                "title": row["title"],
+                "event_label": labels.get(row["id"], []),
+                "description": row["description"],
+                "location_type": row["location_type"],
+                "venue": venue,
+                "start_datetime": format_datetime(row["start_datetime"]),
+                "end_datetime": format_datetime(row["end_datetime"]),
+                "timezone": row["timezone"],
+                "compensation": "{:f}".format(
+                    row["compensation"].quantize(COMPENSATION_QUANTUM)
+                ),
+                "status": row["status"],
+                "client": row["client_id"],
+                "agent": row["agent_id"],
+                "application_count": row["application_count"],
+                "created_at": format_datetime(row["created_at"]),
+                "updated_at": format_datetime(row["updated_at"]),
+            }
+        )
+    return representations
+
+
+def values(queryset):
+    """
+    Return the queryset as rows ready for `represent_rows`.
+    """
+    return queryset.prefetch_related(None).values(*GIG_VALUES)
+
+
+def represent_gigs(queryset):
+    """
+    Return the representations of the gigs in the queryset, in its order.
+    """
+    return represent_rows(list(values(queryset)), using=queryset.db)
+
+
+def represent_gigs_by_id(gig_ids):
+    """
+    Return a mapping of gig id to representation for the given gigs.
+    """
+    queryset = Gig.objects.filter(id__in=gig_ids)
+    rows = list(values(queryset))
+    return {
+        row["id"]: representation
+        for row, representation in zip(rows, represent_rows(rows, queryset.db))
+    }
+
+
+def gig_version(updated_at, event_labels):
+    """
+    Return the version values and last modified datetime of a gig's
+    representation, see `ConditionalGetMixin`, from its `updated_at` and event
+    label names. Shared by the sync and async review views, so a gig has the same
+    ETag whichever serves it.
+    """
+    return (updated_at.isoformat(), *sorted(event_labels)), updated_at
@@ -0,0 +1,25 @@
+"""
+Cached venue resolution, see `core/resolvers.py`.
+"""
+
+from core.resolvers import Resolver, resolve_location
+from gigs.models import Venue
+
+venues = Resolver("venue", Venue, ("google_place_id",))
+
+
+def resolve_venue(venue_data):
+    """
+    Return the Venue for nested venue data, creating it along with its location if
+    needed. Like `bulk.resolve_venues`, venues are identified by their google place
+    id and existing venues are reused as is: a venue is shared by the gigs of every
+    client, submitted data never rewrites it.
+    """
+    venue_data = dict(venue_data)
+    place_id = venue_data.pop("google_place_id")
+
+    def defaults():
+        location_data = venue_data.pop("location")
+        return {**venue_data, "location": resolve_location(location_data)}
+
+    return venues.resolve((place_id,), defaults)
@@ -0,0 +1,100 @@
+"""
+Interval index over an agent's booked gigs, used to detect double bookings.
+"""
+
+from bisect import bisect_left
+from itertools import accumulate
+
+from django.core.exceptions import ValidationError
+
+from gigs.models import Gig
+
+# statuses in which a gig holds a slot in its agent's schedule
+BOOKED_STATUSES = ("agent_confirmed",)
+
+
+class AgentSchedule:
+    """
+    Booked gigs of an agent as parallel arrays sorted by start datetime.
+
+    Along with the sorted starts, a running maximum of the end datetimes is kept,
+    so whether an interval overlaps any gig is answered with a binary search and
+    overlapping gigs are found without comparing every pair.
+    Intervals are half open, a gig ending when another starts does not overlap it.
+    """
+
+    def __init__(self, gigs):
+        gigs = sorted(gigs, key=lambda gig: (gig[1], gig[0]))
+        self.ids = [gig_id for gig_id, _, _ in gigs]
+        self.starts = [start for _, start, _ in gigs]
+        self.ends = [end for _, _, end in gigs]
+        self.max_ends = list(accumulate(self.ends, max))
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def for_agent(cls, agent_id, ending_after=None, exclude=None):
+        """
+        Load the agent's booked gigs, optionally only those ending after a datetime.
+        """
+        gigs = Gig.objects.filter(agent_id=agent_id, status__in=BOOKED_STATUSES)
+        if ending_after is not None:
+            gigs = gigs.filter(end_datetime__gt=ending_after)
+        if exclude is not None:
+            gigs = gigs.exclude(pk=exclude)
+        return cls(gigs.values_list("id", "start_datetime", "end_datetime"))
+
+    def is_free(self, start, end):
+        """
+        Return True if no booked gig overlaps [start, end).
+        """
+        before_end = bisect_left(self.starts, end)
+        return before_end == 0 or self.max_ends[before_end - 1] <= start
+
+    def overlapping(self, start, end):
+        """
+        Return ids of booked gigs overlapping [start, end), in start order.
+        """
+        overlapping = []
+        index = bisect_left(self.starts, end) - 1
+        # the running maximum tells when no earlier gig can reach past `start`
+        while index >= 0 and self.max_ends[index] > start:
+            if self.ends[index] > start:
+                overlapping.append(self.ids[index])
+            index -= 1
+        return overlapping[::-1]
+
+    def conflicts(self):
+        """
+        Return every pair of overlapping gigs as (first_id, second_id, overlap_start,
+        overlap_end) tuples, the first gig starting no later than the second.
+        """
+        conflicts = []
+        for index, (gig_id, end) in enumerate(zip(self.ids, self.ends)):
+            # gigs starting after this one and before it ends overlap it
+            last = bisect_left(self.starts, end, lo=index + 1)
+            for other in range(index + 1, last):
+                conflicts.append(
+                    (
+                        gig_id,
+                        self.ids[other],
+                        self.starts[other],
+                        min(end, self.ends[other]),
+                    )
+                )
+        return conflicts
+
+
+def ensure_agent_available(agent_id, start_datetime, end_datetime, exclude=None):
+    """
+    Raise a ValidationError if the agent is booked on a gig overlapping the period.
+    `exclude` is the gig being assigned, so it does not conflict with itself.
+    """
+    schedule = AgentSchedule.for_agent(
+        agent_id, ending_after=start_datetime, exclude=exclude
+    )
+    if not schedule.is_free(start_datetime, end_datetime):
+        raise ValidationError(
+            {"agent": "Agent is already booked on another gig during this time."}
+        )
@@ -0,0 +1,190 @@
+"""
+Full text search over gigs backed by an SQLite FTS5 virtual table.
+
+The `gigs_search` table mirrors each gig's title, description and event labels.
+FTS5 tables are keyed by an integer rowid, so the rowid is derived from the first
+8 bytes of the gig's UUID which keeps updates and deletes index lookups instead of
+scans over the unindexed `gig_id` column.
+"""
+
+import re
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, router, transaction
+
+from gigs.models import Gig, UUIDTaggedItem
+
+SEARCH_TABLE = "gigs_search"
+
+# bm25 column weights: gig_id (unindexed), title, description, event_labels
+BM25_WEIGHTS = (0.0, 5.0, 1.0, 3.0)
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def search_rowid(gig_id):
+    """
+    Derive the FTS5 rowid for a gig from its UUID.
+    """
+    return int.from_bytes(gig_id.bytes[:8], "big", signed=True)
+
+
+def build_match_expression(query):
+    """
+    Convert free text into a safe FTS5 MATCH expression.
+
+    Every word is quoted, so FTS5 syntax in user input is never interpreted, and
+    prefix matched so results show up while the user is still typing.
+    Returns None if the query has no searchable words.
+    """
+    tokens = TOKEN_PATTERN.findall(query)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def _get_documents(gig_ids, using):
+    """
+    Return (gig_id, title, description, event_labels) rows for the given gigs.
+    """
+    gigs = (
+        Gig.objects.using(using)
+        .filter(id__in=gig_ids)
+        .values_list("id", "title", "description")
+    )
+
+    labels = {}
+    tagged_items = (
+        UUIDTaggedItem.objects.using(using)
+        .filter(
+            content_type=ContentType.objects.db_manager(using).get_for_model(Gig),
+            object_id__in=gig_ids,
+        )
+        .values_list("object_id", "tag__name")
+    )
+    for gig_id, name in tagged_items:
+        labels.setdefault(gig_id, []).append(name)
+
+    return [
+        (gig_id, title, description, " ".join(labels.get(gig_id, [])))
+        for gig_id, title, description in gigs
+    ]
+
+
+def _write_documents(cursor, documents, using):
+    pk_field = Gig._meta.pk
+    connection = connections[using]
+    cursor.executemany(
+        f"INSERT INTO {SEARCH_TABLE} "
+        "(rowid, gig_id, title, description, event_labels) VALUES (%s, %s, %s, %s, %s)",
+        [
+            (
+                search_rowid(gig_id),
+                pk_field.get_db_prep_value(gig_id, connection),
+                title,
+                description,
+                event_labels,
+            )
+            for gig_id, title, description, event_labels in documents
+        ],
+    )
+
+
+def _delete_documents(cursor, gig_ids):
+    cursor.executemany(
+        f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s",
+        [(search_rowid(gig_id),) for gig_id in gig_ids],
+    )
+
+
+def index_gigs(gig_ids):
+    """
+    Insert or refresh the search entries of the given gigs.
+    """
+    gig_ids = list(gig_ids)
+    if not gig_ids:
+        return
+
+    using = router.db_for_write(Gig)
+    with transaction.atomic(using=using):
+        documents = _get_documents(gig_ids, using)
+        with connections[using].cursor() as cursor:
+            _delete_documents(cursor, gig_ids)
+            _write_documents(cursor, documents, using)
+
+
+def remove_gigs(gig_ids):
+    """
+    Remove the search entries of the given gigs.
+    """
+    gig_ids = list(gig_ids)
+    if not gig_ids:
+        return
+
+    using = router.db_for_write(Gig)
+    with connections[using].cursor() as cursor:
+        _delete_documents(cursor, gig_ids)
+
+
+def rebuild_index(batch_size=1000):
+    """
+    Rebuild the search index from scratch.
+
+    Gigs are read in primary key order, one batch per transaction, so the gigs table
+    is never locked for the whole rebuild.
+    Returns the number of gigs indexed.
+    """
+    using = router.db_for_write(Gig)
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+
+    indexed = 0
+    last_id = None
+    while True:
+        batch = Gig.objects.using(using).order_by("id")
+        if last_id is not None:
+            batch = batch.filter(id__gt=last_id)
+        gig_ids = list(batch.values_list("id", flat=True)[:batch_size])
+        if not gig_ids:
+            break
+
+        with transaction.atomic(using=using):
+            documents = _get_documents(gig_ids, using)
+            with connections[using].cursor() as cursor:
+                _write_documents(cursor, documents, using)
+
+        indexed += len(gig_ids)
+        last_id = gig_ids[-1]
+
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('optimize')"
+        )
+
+    return indexed
+
+
+def search_gig_ids(match_expression, queryset, limit, offset=0):
+    """
+    Return ids of gigs in `queryset` matching the FTS5 expression, best match first.
+
+    The queryset carries the listing filters, it is compiled into a subquery so the
+    FTS5 match and the filters run in a single statement.
+    """
+    subquery, params = (
+        queryset.values("id").query.get_compiler(using=queryset.db).as_sql()
+    )
+    weights = ", ".join(str(weight) for weight in BM25_WEIGHTS)
+
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(
+            f"SELECT gig_id FROM {SEARCH_TABLE} "
+            f"WHERE {SEARCH_TABLE} MATCH %s AND gig_id IN ({subquery}) "
+            f"ORDER BY bm25({SEARCH_TABLE}, {weights}), rowid "
+            "LIMIT %s OFFSET %s",
+            [match_expression, *params, limit, offset],
+        )
+        rows = cursor.fetchall()
+
+    pk_field = Gig._meta.pk
+    return [pk_field.to_python(gig_id) for (gig_id,) in rows]
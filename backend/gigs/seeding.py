@@ -0,0 +1,289 @@
+"""
+Fast generation of large, realistic datasets.
+
+The test factories create one row at a time, with a Faker call per field and a
+nested factory per relation, which takes hours for a million gigs. Here rows are
+built from pools of Faker text generated once, with a single seeded random
+generator, and inserted in large batches, one transaction per batch. Locations,
+users and venues go through `bulk_create`. Gigs and their labels, the bulk of the
+rows, skip model instances and the per batch SQL compilation of `bulk_create`,
+which take most of its time, and are inserted with `executemany`. The
+distributions follow the factories:
+
+- users alternate between agents and clients,
+- gigs cycle through the statuses, location types and time zones, start within
+  the next 30 days and last two hours, pay up to 999.99 and carry three distinct
+  event labels; agent confirmed and completed gigs have an agent.
+
+Unlike the factories, users, venues and gigs share pools of locations, venues
+and clients, and venues get coordinates so radius searches find them. The same
+seed gives the same rows, primary keys included, dates being relative to the
+time of seeding.
+
+Bulk inserts send no signals, the search index and event label counts are
+rebuilt at the end.
+"""
+
+import random
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, router, transaction
+from django.utils import timezone
+from faker import Faker
+from taggit.models import Tag
+
+from core.models import Location
+from core.timezones import timezone_names
+from gigs import facets, geo, search
+from gigs.models import Gig, UUIDTaggedItem, Venue
+
+EVENT_LABELS = [
+    "conference",
+    "workshop",
+    "meetup",
+    "corporate",
+    "party",
+    "wedding",
+]
+LABELS_PER_GIG = 3
+
+# number of distinct Faker values drawn for each kind of text
+TEXT_POOL_SIZE = 2000
+
+# coordinates of seeded venues, around Kenya
+LATITUDE_RANGE = (-4.5, 4.5)
+LONGITUDE_RANGE = (34.0, 41.5)
+
+
+class Seeder:
+    """
+    Generate rows deterministically from a seed and insert them in batches.
+    """
+
+    def __init__(
+        self, seed=0, batch_size=10_000, password="password", pool_size=TEXT_POOL_SIZE
+    ):
+        self.random = random.Random(seed)
+        self.batch_size = batch_size
+        self.password = password
+        self.using = router.db_for_write(Gig)
+
+        faker = Faker()
+        faker.seed_instance(seed)
+        self.cities = [faker.city() for _ in range(pool_size)]
+        self.regions = [faker.state() for _ in range(pool_size)]
+        self.countries = [faker.country() for _ in range(pool_size)]
+        self.names = [faker.name() for _ in range(pool_size)]
+        self.companies = [faker.company() for _ in range(pool_size)]
+        self.addresses = [faker.address() for _ in range(pool_size)]
+        self.titles = [faker.sentence(nb_words=4) for _ in range(pool_size)]
+        self.descriptions = [faker.paragraph(nb_sentences=5) for _ in range(pool_size)]
+
+    def uuid(self):
+        return uuid.UUID(int=self.random.getrandbits(128), version=4)
+
+    def batches(self, count):
+        """
+        Yield (start, stop) index ranges of at most `batch_size` rows.
+        """
+        for start in range(0, count, self.batch_size):
+            yield start, min(start + self.batch_size, count)
+
+    def insert(self, model, rows):
+        """
+        Insert rows, dicts of field attribute names to values, with a single
+        `executemany`. Fields missing from the rows get their default, evaluated
+        once. Like `bulk_create`, save() is not called and no signals are sent.
+        """
+        if not rows:
+            return
+        connection = connections[self.using]
+        quote = connection.ops.quote_name
+        fields = [
+            field
+            for field in model._meta.concrete_fields
+            if field.attname in rows[0] or field.has_default()
+        ]
+        defaults = {field.attname: field.get_default() for field in fields}
+        sql = "INSERT INTO {} ({}) VALUES ({})".format(
+            quote(model._meta.db_table),
+            ", ".join(quote(field.column) for field in fields),
+            ", ".join(["%s"] * len(fields)),
+        )
+        params = [
+            [
+                field.get_db_prep_save(
+                    row.get(field.attname, defaults[field.attname]), connection
+                )
+                for field in fields
+            ]
+            for row in rows
+        ]
+        with connection.cursor() as cursor:
+            cursor.executemany(sql, params)
+
+    def seed_locations(self, count):
+        locations = []
+        seen = set()
+        for index in range(count):
+            key = (
+                self.random.choice(self.cities),
+                self.random.choice(self.regions),
+                self.random.choice(self.countries),
+            )
+            if key in seen:
+                # locations are unique per (city, state_region, country)
+                key = (f"{key[0]} {index}", key[1], key[2])
+            seen.add(key)
+            locations.append(Location(city=key[0], state_region=key[1], country=key[2]))
+        return Location.objects.using(self.using).bulk_create(
+            locations, batch_size=self.batch_size
+        )
+
+    def seed_users(self, count, locations):
+        """
+        Create users, alternating agents and clients like `UserFactory`. All users
+        share the same password, hashed once.
+        """
+        User = get_user_model()
+        password = make_password(self.password)
+        users = []
+        for start, stop in self.batches(count):
+            batch = []
+            for index in range(start, stop):
+                role = "agent" if index % 2 == 0 else "client"
+                batch.append(
+                    User(
+                        id=self.uuid(),
+                        email=f"user{index}@example.com",
+                        full_name=self.random.choice(self.names),
+                        password=password,
+                        location=self.random.choice(locations),
+                        default_role=role,
+                        is_agent=role == "agent",
+                        is_client=role == "client",
+                    )
+                )
+            with transaction.atomic(using=self.using):
+                users += User.objects.using(self.using).bulk_create(batch)
+        return users
+
+    def seed_venues(self, count, locations):
+        venues = []
+        for start, stop in self.batches(count):
+            batch = []
+            for index in range(start, stop):
+                latitude = self.random.uniform(*LATITUDE_RANGE)
+                longitude = self.random.uniform(*LONGITUDE_RANGE)
+                batch.append(
+                    Venue(
+                        google_place_id=f"seed-{self.uuid()}",
+                        name=self.random.choice(self.companies),
+                        address=self.random.choice(self.addresses),
+                        location=self.random.choice(locations),
+                        latitude=latitude,
+                        longitude=longitude,
+                        # bulk inserts skip save(), which sets the grid cell
+                        geo_cell=geo.cell_for(latitude, longitude),
+                    )
+                )
+            with transaction.atomic(using=self.using):
+                venues += Venue.objects.using(self.using).bulk_create(batch)
+        return venues
+
+    def seed_tags(self):
+        Tag.objects.using(self.using).bulk_create(
+            [Tag(name=label, slug=label) for label in EVENT_LABELS],
+            ignore_conflicts=True,
+        )
+        return list(Tag.objects.using(self.using).filter(name__in=EVENT_LABELS))
+
+    def seed_gigs(self, count, clients, agents, venues):
+        """
+        Create gigs and their event labels. Returns the number of gigs created.
+        """
+        statuses = [status for status, _ in Gig.STATUS_CHOICES]
+        location_types = [
+            location_type for location_type, _ in Gig.LOCATION_TYPE_CHOICES
+        ]
+        timezones = timezone_names()
+        tags = self.seed_tags()
+        content_type = ContentType.objects.db_manager(self.using).get_for_model(Gig)
+        now = timezone.now()
+        window = int(timedelta(days=30).total_seconds())
+
+        for start, stop in self.batches(count):
+            gigs = []
+            tagged_items = []
+            for index in range(start, stop):
+                status = statuses[index % len(statuses)]
+                location_type = location_types[index % len(location_types)]
+                start_datetime = now + timedelta(
+                    seconds=self.random.randint(60, window)
+                )
+                gig_id = self.uuid()
+                gigs.append(
+                    {
+                        "id": gig_id,
+                        "title": self.random.choice(self.titles),
+                        "description": self.random.choice(self.descriptions),
+                        "location_type": location_type,
+                        "venue_id": (
+                            self.random.choice(venues).pk
+                            if location_type == "physical"
+                            else None
+                        ),
+                        "start_datetime": start_datetime,
+                        "end_datetime": start_datetime + timedelta(hours=2),
+                        "timezone": timezones[index % len(timezones)],
+                        "compensation": Decimal(self.random.randint(1, 99999)).scaleb(
+                            -2
+                        ),
+                        "status": status,
+                        "client_id": self.random.choice(clients).pk,
+                        "agent_id": (
+                            self.random.choice(agents).pk
+                            if status in ("agent_confirmed", "completed")
+                            else None
+                        ),
+                        # auto_now fields are set by save(), which is skipped
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+                tagged_items += [
+                    {
+                        "content_type_id": content_type.pk,
+                        "object_id": gig_id,
+                        "tag_id": tag.pk,
+                    }
+                    for tag in self.random.sample(tags, LABELS_PER_GIG)
+                ]
+
+            with transaction.atomic(using=self.using):
+                self.insert(Gig, gigs)
+                self.insert(UUIDTaggedItem, tagged_items)
+        return count
+
+    def seed(self, users, locations, venues, gigs, index=True):
+        """
+        Seed the whole dataset. Returns the created users, in creation order.
+        """
+        location_rows = self.seed_locations(max(locations, 1))
+        user_rows = self.seed_users(max(users, 2), location_rows)
+        venue_rows = self.seed_venues(max(venues, 1), location_rows)
+        self.seed_gigs(
+            gigs,
+            clients=[user for user in user_rows if user.is_client],
+            agents=[user for user in user_rows if user.is_agent],
+            venues=venue_rows,
+        )
+        if index:
+            search.rebuild_index(batch_size=self.batch_size)
+            facets.rebuild_counts()
+        return user_rows
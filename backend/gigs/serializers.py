@@ -1,23 +1,63 @@
 from rest_framework import serializers
-from taggit.serializers import TaggitSerializer, TagListSerializerField
+from taggit.serializers import TagList, TaggitSerializer, TagListSerializerField
 
-from gigs.models import Gig, Venue
+from gigs import bulk, search, signals
+from gigs.models import Gig, GigApplication, Venue
+from gigs.resolvers import resolve_venue
+from gigs.scheduling import ensure_agent_available
 from gigs.validators import validate_start_end_datetime, validate_location_fields
-from core.models import Location
 from core.serializers import LocationSerializer
 
 
+class EventLabelListField(TagListSerializerField):
+    """
+    Tag list field listing the labels in alphabetical order, so the output does not
+    depend on the order the database returns the tags in.
+    """
+
+    def to_representation(self, value):
+        tags = super().to_representation(value)
+        return TagList(sorted(tags), pretty_print=tags.pretty_print)
+
+
 class VenueSerializer(serializers.ModelSerializer):
     google_place_id = serializers.CharField()
     location = LocationSerializer()
 
     class Meta:
         model = Venue
-        fields = ["id", "google_place_id", "name", "address", "location"]
+        fields = [
+            "id",
+            "google_place_id",
+            "name",
+            "address",
+            "location",
+            "latitude",
+            "longitude",
+        ]
+
+
+class GigListSerializer(serializers.ListSerializer):
+    """
+    Creates many gigs at once.
+
+    Each gig is validated like a single gig, errors are reported per gig in the
+    same order as the input. Valid input is created in one transaction with set
+    based queries, see gigs/bulk.py.
+    """
+
+    def create(self, validated_data):
+        gig_ids = [gig.pk for gig in bulk.create_gigs(validated_data)]
+        gigs = (
+            Gig.objects.select_related("venue__location")
+            .prefetch_related("event_label")
+            .in_bulk(gig_ids)
+        )
+        return [gigs[gig_id] for gig_id in gig_ids]
 
 
 class GigSerializer(TaggitSerializer, serializers.ModelSerializer):
-    event_label = TagListSerializerField()
+    event_label = EventLabelListField()
     venue = VenueSerializer(required=False, allow_null=True)
     status = serializers.ChoiceField(
         ["draft", "published"],
@@ -41,10 +81,12 @@ class GigSerializer(TaggitSerializer, serializers.ModelSerializer):
             "status",
             "client",
             "agent",
+            "application_count",
             "created_at",
             "updated_at",
         ]
         read_only_fields = ["client", "agent"]
+        list_serializer_class = GigListSerializer
 
     def __init__(self, *args, **kwargs):
         """
@@ -66,31 +108,120 @@ class GigSerializer(TaggitSerializer, serializers.ModelSerializer):
         - Start datetime is in the future.
         - End datetime is after start datetime.
         - Location fields are valid based on location type.
+        - The agent, if any, is not booked on another gig during the new times.
+          Serializers do not run Gig.clean, which checks it as well.
         """
         validate_start_end_datetime(
             data.get("start_datetime"), data.get("end_datetime")
         )
 
         validate_location_fields(data.get("location_type"), data.get("venue"))
+
+        instance = self.instance if isinstance(self.instance, Gig) else None
+        if instance is not None and instance.agent_id is not None:
+            times = (data.get("start_datetime"), data.get("end_datetime"))
+            # unchanged times were checked when the agent was booked
+            if times != (instance.start_datetime, instance.end_datetime):
+                ensure_agent_available(instance.agent_id, *times, exclude=instance.pk)
         return data
 
     def create(self, validated_data):
         """
-        Create a new gig instance.
+        Create a new gig instance, indexed for search once its labels are set.
         """
         if validated_data.get("venue"):
-            venue = validated_data.pop("venue")
-            location = venue.pop("location")
-            location, _ = Location.objects.get_or_create(**location)
-            venue, _ = Venue.objects.get_or_create(location=location, **venue)
-            validated_data["venue"] = venue
-        return super().create(validated_data)
+            validated_data["venue"] = resolve_venue(validated_data["venue"])
+        with signals.labelling_new_gigs() as gig_ids:
+            gig = super().create(validated_data)
+        search.index_gigs(gig_ids)
+        return gig
 
     def update(self, instance, validated_data):
         if validated_data.get("venue"):
-            venue = validated_data.pop("venue")
-            location = venue.pop("location")
-            location, _ = Location.objects.get_or_create(**location)
-            venue, _ = Venue.objects.get_or_create(location=location, **venue)
-            validated_data["venue"] = venue
+            validated_data["venue"] = resolve_venue(validated_data["venue"])
         return super().update(instance, validated_data)
+
+
+class GigApplicationSerializer(serializers.ModelSerializer):
+    agent_name = serializers.CharField(source="agent.full_name", read_only=True)
+    gig_title = serializers.CharField(source="gig.title", read_only=True)
+
+    class Meta:
+        model = GigApplication
+        fields = [
+            "id",
+            "gig",
+            "gig_title",
+            "agent",
+            "agent_name",
+            "message",
+            "status",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = ["gig", "agent", "status"]
+
+
+class GigFilterSerializer(serializers.Serializer):
+    """
+    Validates query parameters used to filter gig listings.
+    """
+
+    location_type = serializers.ChoiceField(Gig.LOCATION_TYPE_CHOICES, required=False)
+    country = serializers.CharField(required=False)
+    start_after = serializers.DateTimeField(required=False)
+    start_before = serializers.DateTimeField(required=False)
+    labels = serializers.CharField(
+        required=False,
+        help_text="Comma separated event labels, gigs with any of the labels match.",
+    )
+
+
+class GigDashboardSerializer(serializers.Serializer):
+    """
+    Validates query parameters of the client dashboard endpoint.
+    """
+
+    status = serializers.ChoiceField(Gig.STATUS_CHOICES, required=False)
+
+
+class GigSearchSerializer(serializers.Serializer):
+    """
+    Validates query parameters of the gig search endpoint.
+    """
+
+    q = serializers.CharField(
+        help_text="Words to look for in gig titles, descriptions and event labels."
+    )
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=20)
+    offset = serializers.IntegerField(min_value=0, default=0)
+
+
+class GigNearbySerializer(serializers.Serializer):
+    """
+    Validates query parameters of the nearby gigs endpoint.
+    """
+
+    latitude = serializers.FloatField(min_value=-90, max_value=90)
+    longitude = serializers.FloatField(min_value=-180, max_value=180)
+    radius_km = serializers.FloatField(min_value=0.1, max_value=500, default=10)
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=20)
+
+
+class GigRecommendationSerializer(serializers.Serializer):
+    """
+    Validates query parameters of the recommended gigs endpoint.
+    """
+
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=20)
+
+
+class ScheduleConflictSerializer(serializers.Serializer):
+    """
+    Two booked gigs of an agent overlapping each other, and when they overlap.
+    """
+
+    first = GigSerializer()
+    second = GigSerializer()
+    overlap_start = serializers.DateTimeField()
+    overlap_end = serializers.DateTimeField()
@@ -0,0 +1,125 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from gigs import facets, search
+from gigs.models import Gig, UUIDTaggedItem
+
+SEARCHABLE_FIELDS = {"title", "description"}
+
+# ids of the gigs created in a `labelling_new_gigs` block, None outside of one
+_new_gig_ids = ContextVar("new_gig_ids", default=None)
+
+
+@contextmanager
+def labelling_new_gigs():
+    """
+    Leave the gigs created in the block unindexed and untouched while their labels
+    are set, instead of indexing them on insert and again per label change.
+    Yields the ids of the created gigs, the caller indexes them after the block.
+    """
+    gig_ids = []
+    token = _new_gig_ids.set(gig_ids)
+    try:
+        yield gig_ids
+    finally:
+        _new_gig_ids.reset(token)
+
+
+def is_new_gig(instance):
+    gig_ids = _new_gig_ids.get()
+    return gig_ids is not None and instance.pk in gig_ids
+
+
+@receiver(post_save, sender=Gig)
+def index_saved_gig(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Refresh the gig's search entry, unless the save did not touch searchable fields.
+    """
+    gig_ids = _new_gig_ids.get()
+    if created and gig_ids is not None:
+        gig_ids.append(instance.pk)
+        return
+    if update_fields is not None and not SEARCHABLE_FIELDS.intersection(update_fields):
+        return
+    search.index_gigs([instance.pk])
+
+
+def labels_changed(instance, action, pk_set):
+    """
+    Return True once a gig's labels actually changed. Taggit sends add and remove
+    signals even when there is nothing to add or remove.
+    """
+    if not isinstance(instance, Gig):
+        return False
+    if action in ("post_add", "post_remove"):
+        return bool(pk_set)
+    return action == "post_clear"
+
+
+@receiver(post_delete, sender=Gig)
+def remove_deleted_gig(sender, instance, **kwargs):
+    search.remove_gigs([instance.pk])
+
+
+@receiver(m2m_changed, sender=UUIDTaggedItem)
+def index_retagged_gig(sender, instance, action, pk_set, **kwargs):
+    """
+    Refresh the search entry of a gig whose event labels changed, once per change
+    rather than once per tagged item.
+    """
+    if labels_changed(instance, action, pk_set) and not is_new_gig(instance):
+        search.index_gigs([instance.pk])
+
+
+@receiver(post_save, sender=Gig)
+def count_status_change(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Move the gig's event label counts when its status changed.
+    """
+    if update_fields is not None and "status" not in update_fields:
+        return
+
+    loaded_status = getattr(instance, "_loaded_status", None)
+    instance._loaded_status = instance.status
+    if created or loaded_status is None:
+        return
+    facets.move_gigs([instance.pk], loaded_status, instance.status)
+
+
+@receiver(pre_delete, sender=Gig)
+def uncount_deleted_gig(sender, instance, **kwargs):
+    tag_ids = instance.event_label.values_list("id", flat=True)
+    facets.remove_labels(getattr(instance, "_loaded_status", instance.status), tag_ids)
+
+
+@receiver(m2m_changed, sender=UUIDTaggedItem)
+def count_relabelled_gig(sender, instance, action, pk_set, **kwargs):
+    """
+    Keep event label counts in step with labels added to or removed from a gig.
+    """
+    if not isinstance(instance, Gig):
+        return
+
+    if action == "post_add":
+        facets.add_labels(instance.status, pk_set)
+    elif action == "post_remove":
+        facets.remove_labels(instance.status, pk_set)
+    elif action == "pre_clear":
+        tag_ids = instance.event_label.values_list("id", flat=True)
+        facets.remove_labels(instance.status, tag_ids)
+
+
+@receiver(m2m_changed, sender=UUIDTaggedItem)
+def touch_relabelled_gig(sender, instance, action, pk_set, **kwargs):
+    """
+    Bump the gig's updated_at when its labels change, so conditional GETs see the
+    change. The row is updated in place to avoid a full save. New gigs were just
+    inserted with the current time.
+    """
+    if labels_changed(instance, action, pk_set) and not is_new_gig(instance):
+        instance.updated_at = timezone.now()
+        Gig.objects.filter(pk=instance.pk).update(updated_at=instance.updated_at)
@@ -0,0 +1,45 @@
+"""
+Moves gigs whose end datetime has passed out of the active statuses.
+
+Agent confirmed gigs are completed and published gigs nobody took on are
+cancelled. Expired gigs are found through the (status, end_datetime) index and
+moved in small batches, each batch being its own transaction so the gigs table is
+only ever locked for one short UPDATE at a time.
+"""
+
+from django.utils import timezone
+
+from gigs import transitions
+from gigs.models import Gig
+
+# status of expired gigs -> transition moving them out of it
+EXPIRY_TRANSITIONS = {
+    "agent_confirmed": "complete",
+    "published": "cancel",
+}
+
+
+def sweep_expired_gigs(now=None, batch_size=500):
+    """
+    Complete or cancel every gig that ended before `now`.
+    Returns the number of moved gigs per status they were moved to.
+    """
+    now = now or timezone.now()
+    moved = {}
+    for status, transition in EXPIRY_TRANSITIONS.items():
+        _, target = transitions.TRANSITIONS[transition]
+        moved[target] = 0
+        while True:
+            gig_ids = list(
+                Gig.objects.filter(status=status, end_datetime__lte=now)
+                .order_by("end_datetime")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not gig_ids:
+                break
+            # the transition checks the status again, gigs that changed since
+            # they were selected are left alone
+            moved[target] += len(
+                transitions.transition_gigs(gig_ids, transition, sources=[status])
+            )
+    return moved
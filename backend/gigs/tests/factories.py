@@ -3,7 +3,9 @@ from faker import Faker as RealFaker
 
 from django.utils import timezone
 
+from core.timezones import timezone_names
 from gigs.models import Gig, Venue
+from gigs.seeding import EVENT_LABELS
 from users.tests.factories import UserFactory
 from core.tests.factories import LocationFactory
 
@@ -13,21 +15,9 @@ real_faker = RealFaker()
 class GigFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Gig
+        skip_postgeneration_save = True
 
     title = factory.Faker("sentence", nb_words=4)
-    event_label = factory.Faker(
-        "words",
-        nb=3,
-        ext_word_list=[
-            "conference",
-            "workshop",
-            "meetup",
-            "corporate",
-            "party",
-            "wedding",
-        ],
-        unique=True,
-    )
     description = factory.Faker("paragraph", nb_sentences=5)
 
     location_type = factory.Iterator(Gig.LOCATION_TYPE_CHOICES, getter=lambda c: c[0])
@@ -40,7 +30,7 @@ class GigFactory(factory.django.DjangoModelFactory):
     end_datetime = factory.LazyAttribute(
         lambda o: o.start_datetime + timezone.timedelta(hours=2)
     )
-    timezone = factory.Iterator(Gig.TIMEZONES_CHOICES, getter=lambda c: c[0])
+    timezone = factory.Iterator(timezone_names())
 
     compensation = factory.Faker(
         "pydecimal", left_digits=3, right_digits=2, positive=True
@@ -57,6 +47,18 @@ class GigFactory(factory.django.DjangoModelFactory):
         )
     )
 
+    @factory.post_generation
+    def event_label(self, create, extracted, **kwargs):
+        """
+        Tags can only be set once the gig is saved.
+        """
+        if not create:
+            return
+
+        if extracted is None:
+            extracted = real_faker.words(nb=3, ext_word_list=EVENT_LABELS, unique=True)
+        self.event_label.set(extracted)
+
 
 class VenueFactory(factory.django.DjangoModelFactory):
     class Meta:
@@ -0,0 +1,129 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from gigs import applications
+from gigs.models import Gig, GigApplication
+from gigs.tests.factories import GigFactory
+from users.tests.factories import UserFactory
+
+
+class ApplicationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.agent = UserFactory(default_role="agent")
+        cls.gig = GigFactory(status="published")
+
+    def application_count(self):
+        return Gig.objects.values_list("application_count", flat=True).get(
+            pk=self.gig.pk
+        )
+
+    def test_apply_counts_the_application(self):
+        application = applications.apply(self.gig, self.agent, "Pick me")
+
+        self.assertEqual(application.status, "pending")
+        self.assertEqual(application.message, "Pick me")
+        self.assertEqual(self.application_count(), 1)
+
+        applications.apply(self.gig, UserFactory(default_role="agent"))
+        self.assertEqual(self.application_count(), 2)
+
+    def test_cannot_apply_twice(self):
+        applications.apply(self.gig, self.agent)
+        with self.assertRaises(ValidationError) as context:
+            applications.apply(self.gig, self.agent)
+
+        self.assertEqual(
+            context.exception.message_dict["gig"],
+            ["You have already applied to this gig."],
+        )
+        self.assertEqual(self.application_count(), 1)
+
+    def test_only_published_gigs_can_be_applied_to(self):
+        gig = GigFactory(status="draft")
+        with self.assertRaises(ValidationError):
+            applications.apply(gig, self.agent)
+        self.assertFalse(GigApplication.objects.exists())
+
+    def test_cannot_apply_to_own_gig(self):
+        gig = GigFactory(status="published", client=self.agent)
+        with self.assertRaises(ValidationError):
+            applications.apply(gig, self.agent)
+
+    def test_withdraw_and_reapply(self):
+        applications.apply(self.gig, self.agent)
+
+        self.assertTrue(applications.withdraw(self.gig, self.agent))
+        self.assertEqual(self.application_count(), 0)
+        self.assertFalse(applications.withdraw(self.gig, self.agent))
+        self.assertEqual(self.application_count(), 0)
+
+        application = applications.apply(self.gig, self.agent, "Available again")
+        self.assertEqual(application.status, "pending")
+        self.assertEqual(application.message, "Available again")
+        self.assertEqual(self.application_count(), 1)
+        self.assertEqual(GigApplication.objects.count(), 1)
+
+
+class AcceptApplicationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.gig = GigFactory(status="published", event_label=["wedding"])
+        cls.agents = [UserFactory(default_role="agent") for _ in range(3)]
+
+    def setUp(self):
+        self.applications = [
+            applications.apply(self.gig, agent) for agent in self.agents
+        ]
+
+    def statuses(self):
+        return [
+            GigApplication.objects.get(pk=application.pk).status
+            for application in self.applications
+        ]
+
+    def test_accept_confirms_the_agent_and_rejects_the_others(self):
+        applications.accept(self.applications[1])
+
+        gig = Gig.objects.get(pk=self.gig.pk)
+        self.assertEqual(gig.status, "agent_confirmed")
+        self.assertEqual(gig.agent, self.agents[1])
+        self.assertEqual(self.statuses(), ["rejected", "accepted", "rejected"])
+
+    def test_only_one_agent_can_be_confirmed(self):
+        first, second = self.applications[:2]
+        applications.accept(first)
+
+        with self.assertRaises(ValidationError) as context:
+            applications.accept(second)
+        self.assertEqual(
+            context.exception.message_dict["gig"],
+            ["This gig already has a confirmed agent."],
+        )
+        self.assertEqual(Gig.objects.get(pk=self.gig.pk).agent, self.agents[0])
+
+    def test_withdrawn_application_cannot_be_accepted(self):
+        applications.withdraw(self.gig, self.agents[0])
+
+        with self.assertRaises(ValidationError):
+            applications.accept(self.applications[0])
+
+        # nothing was changed
+        gig = Gig.objects.get(pk=self.gig.pk)
+        self.assertEqual(gig.status, "published")
+        self.assertIsNone(gig.agent)
+        self.assertEqual(self.statuses(), ["withdrawn", "pending", "pending"])
+
+    def test_agent_booked_on_an_overlapping_gig_cannot_be_confirmed(self):
+        GigFactory(
+            status="agent_confirmed",
+            agent=self.agents[0],
+            start_datetime=self.gig.start_datetime,
+            end_datetime=self.gig.end_datetime,
+        )
+
+        with self.assertRaises(ValidationError) as context:
+            applications.accept(self.applications[0])
+        self.assertIn("agent", context.exception.message_dict)
+        self.assertEqual(Gig.objects.get(pk=self.gig.pk).status, "published")
+        self.assertEqual(self.statuses(), ["pending", "pending", "pending"])
@@ -0,0 +1,183 @@
+from django.test import AsyncClient
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from gigs.models import Gig
+from gigs.tests.factories import GigFactory
+from users.tests.factories import UserFactory
+
+
+def bearer(user):
+    return f"Bearer {RefreshToken.for_user(user).access_token}"
+
+
+def gig_data(**overrides):
+    start = timezone.now() + timezone.timedelta(days=2)
+    return {
+        "title": "Async gig",
+        "description": "A description of the async gig, long enough to be valid.",
+        "eventLabel": ["conference", "wedding"],
+        "locationType": "virtual",
+        "startDatetime": start.isoformat(),
+        "endDatetime": (start + timezone.timedelta(hours=2)).isoformat(),
+        "timezone": "Africa/Nairobi",
+        "compensation": "150.00",
+        **overrides,
+    }
+
+
+class AsyncGigViewTests(APITestCase):
+    def setUp(self):
+        self.client_user = UserFactory(default_role="client")
+        self.other_client = UserFactory(default_role="client")
+        self.agent = UserFactory(default_role="agent")
+        self.gig = GigFactory(
+            client=self.client_user, status="draft", event_label=["wedding", "party"]
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=bearer(self.client_user))
+
+    def review_url(self, gig):
+        return reverse("async-gig-client-review", kwargs={"pk": gig.pk})
+
+    def test_create(self):
+        response = self.client.post(reverse("async-gig-create"), gig_data())
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        gig = Gig.objects.get(pk=response.json()["id"])
+        self.assertEqual(gig.client, self.client_user)
+        self.assertEqual(sorted(gig.event_label.names()), ["conference", "wedding"])
+
+    def test_create_validation_errors(self):
+        response = self.client.post(
+            reverse("async-gig-create"), gig_data(timezone="Mars/Olympus")
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("timezone", response.json())
+
+    def test_authentication_is_required(self):
+        self.client.credentials()
+        response = self.client.post(reverse("async-gig-create"), gig_data())
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn("Bearer", response.headers["WWW-Authenticate"])
+
+    def test_invalid_token_is_rejected(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer not-a-token")
+        response = self.client.get(self.review_url(self.gig))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_agents_cannot_create(self):
+        self.client.credentials(HTTP_AUTHORIZATION=bearer(self.agent))
+        response = self.client.post(reverse("async-gig-create"), gig_data())
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_review_matches_the_sync_view(self):
+        response = self.client.get(self.review_url(self.gig))
+        sync_response = self.client.get(
+            reverse("gig-client-review", kwargs={"pk": self.gig.pk})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), sync_response.json())
+        self.assertEqual(response.headers["ETag"], sync_response.headers["ETag"])
+        self.assertEqual(
+            response.headers["Last-Modified"], sync_response.headers["Last-Modified"]
+        )
+
+    def test_review_of_unknown_gig_is_not_found(self):
+        url = self.review_url(self.gig)
+        self.gig.delete()
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_review_of_other_clients_gig_is_forbidden(self):
+        self.client.credentials(HTTP_AUTHORIZATION=bearer(self.other_client))
+        response = self.client.get(self.review_url(self.gig))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_review_matching_etag_is_not_modified(self):
+        etag = self.client.get(self.review_url(self.gig)).headers["ETag"]
+
+        response = self.client.get(self.review_url(self.gig), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.headers["ETag"], etag)
+
+    def test_review_etag_changes_when_labels_change(self):
+        etag = self.client.get(self.review_url(self.gig)).headers["ETag"]
+        self.gig.event_label.add("meetup")
+
+        response = self.client.get(self.review_url(self.gig), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_update(self):
+        response = self.client.put(
+            reverse("async-gig-update", kwargs={"pk": self.gig.pk}),
+            gig_data(title="Updated async gig"),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.gig.refresh_from_db()
+        self.assertEqual(self.gig.title, "Updated async gig")
+
+    def test_update_of_confirmed_gig_is_forbidden(self):
+        gig = GigFactory(client=self.client_user, status="agent_confirmed")
+        response = self.client.put(
+            reverse("async-gig-update", kwargs={"pk": gig.pk}), gig_data()
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_publish(self):
+        url = reverse("async-gig-publish", kwargs={"pk": self.gig.pk})
+        response = self.client.post(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.gig.refresh_from_db()
+        self.assertEqual(self.gig.status, "published")
+
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class AsyncGigViewAsgiTests(APITestCase):
+    """
+    The views served by Django's ASGI request handler, on the event loop.
+    """
+
+    def setUp(self):
+        self.client_user = UserFactory(default_role="client")
+        self.gig = GigFactory(client=self.client_user, event_label=["wedding"])
+        self.async_client = AsyncClient()
+        self.headers = {"Authorization": bearer(self.client_user)}
+
+    async def test_review(self):
+        response = await self.async_client.get(
+            reverse("async-gig-client-review", kwargs={"pk": self.gig.pk}),
+            headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["id"], str(self.gig.pk))
+        self.assertEqual(response.json()["eventLabel"], ["wedding"])
+
+    async def test_create(self):
+        response = await self.async_client.post(
+            reverse("async-gig-create"),
+            gig_data(),
+            content_type="application/json",
+            headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(await Gig.objects.filter(pk=response.json()["id"]).aexists())
@@ -0,0 +1,120 @@
+from django.test import TestCase
+from django.utils import timezone
+from taggit.models import Tag
+
+from core.models import Location
+from core.tests.factories import LocationFactory
+from gigs import bulk, facets, search
+from gigs.models import Gig, Venue
+from gigs.tests.factories import VenueFactory
+from users.tests.factories import UserFactory
+
+
+class CreateGigsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.client_user = UserFactory(default_role="client")
+        cls.location = LocationFactory()
+        cls.venue = VenueFactory(location=cls.location)
+        Tag.objects.create(name="Wedding")
+
+    def gig_data(self, **overrides):
+        start = timezone.now() + timezone.timedelta(days=3)
+        return {
+            "title": "Bulk Gig",
+            "description": "A description that is long enough to pass validation checks.",
+            "event_label": ["wedding"],
+            "location_type": "virtual",
+            "start_datetime": start,
+            "end_datetime": start + timezone.timedelta(hours=2),
+            "timezone": "UTC",
+            "compensation": "100.00",
+            "status": "published",
+            "client": self.client_user,
+            **overrides,
+        }
+
+    def venue_data(self, google_place_id, **location):
+        return {
+            "google_place_id": google_place_id,
+            "name": "New Venue",
+            "address": "1 Main Street",
+            "location": {
+                "city": "Nairobi",
+                "state_region": "Nairobi",
+                "country": "Kenya",
+                **location,
+            },
+            "latitude": -1.28,
+            "longitude": 36.82,
+        }
+
+    def test_gigs_are_created_in_order(self):
+        gigs = bulk.create_gigs(
+            [self.gig_data(title="First"), self.gig_data(title="Second")]
+        )
+        self.assertEqual([gig.title for gig in gigs], ["First", "Second"])
+        self.assertEqual(Gig.objects.filter(client=self.client_user).count(), 2)
+
+    def test_labels_match_existing_tags_case_insensitively(self):
+        gigs = bulk.create_gigs(
+            [
+                self.gig_data(event_label=["wedding", "Gala"]),
+                self.gig_data(event_label=["WEDDING", "gala"]),
+            ]
+        )
+        self.assertEqual(Tag.objects.filter(name__iexact="wedding").count(), 1)
+        self.assertEqual(Tag.objects.filter(name__iexact="gala").count(), 1)
+        for gig in gigs:
+            self.assertEqual(sorted(gig.event_label.names()), ["Gala", "Wedding"])
+
+    def test_labels_with_taken_slugs_get_a_free_slug(self):
+        Tag.objects.create(name="live-music", slug="live-music")
+        gig = bulk.create_gigs([self.gig_data(event_label=["Live Music"])])[0]
+        tag = gig.event_label.get()
+        self.assertEqual(tag.name, "Live Music")
+        self.assertNotEqual(tag.slug, "live-music")
+
+    def test_venues_and_locations_are_reused_or_created_once(self):
+        existing = {
+            "google_place_id": self.venue.google_place_id,
+            "name": "Renamed",
+            "address": "Elsewhere",
+            "location": {
+                "city": self.location.city,
+                "state_region": self.location.state_region,
+                "country": self.location.country,
+            },
+        }
+        locations = Location.objects.count()
+        gigs = bulk.create_gigs(
+            [
+                self.gig_data(location_type="physical", venue=existing),
+                self.gig_data(location_type="physical", venue=self.venue_data("a")),
+                self.gig_data(location_type="physical", venue=self.venue_data("a")),
+                self.gig_data(location_type="physical", venue=self.venue_data("b")),
+            ]
+        )
+        self.assertEqual(gigs[0].venue, self.venue)
+        self.assertEqual(gigs[1].venue, gigs[2].venue)
+        self.assertEqual(gigs[1].venue.location, gigs[3].venue.location)
+        self.assertEqual(Location.objects.count(), locations + 1)
+        self.assertEqual(Venue.objects.get(google_place_id="a").geo_cell, "887:2168")
+
+    def test_gigs_are_searchable_and_counted(self):
+        gig = bulk.create_gigs([self.gig_data(title="Rooftop wedding party")])[0]
+        match = search.build_match_expression("rooftop")
+        self.assertEqual(search.search_gig_ids(match, Gig.objects.all(), 10), [gig.id])
+        self.assertEqual(facets.label_counts(), [{"label": "Wedding", "count": 1}])
+
+    def test_queries_do_not_grow_with_the_number_of_gigs(self):
+        gigs_data = [
+            self.gig_data(
+                location_type="physical",
+                venue=self.venue_data(f"place-{i}", city=f"City {i}"),
+                event_label=[f"label {i}", "wedding"],
+            )
+            for i in range(20)
+        ]
+        with self.assertNumQueries(24):
+            bulk.create_gigs(gigs_data)
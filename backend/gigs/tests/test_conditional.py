@@ -0,0 +1,198 @@
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from gigs.models import Gig
+from gigs.tests.factories import GigFactory
+from users.tests.factories import UserFactory
+
+
+class GigClientReviewConditionalTests(APITestCase):
+    def setUp(self):
+        self.client_user = UserFactory(default_role="client")
+        self.gig = GigFactory(client=self.client_user, event_label=["wedding"])
+        self.url = reverse("gig-client-review", kwargs={"pk": self.gig.pk})
+        self.client.force_authenticate(user=self.client_user)
+
+    def test_response_carries_validators(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.headers["ETag"].startswith('"'))
+        self.assertEqual(
+            response.headers["Last-Modified"],
+            http_date(int(self.gig.updated_at.timestamp())),
+        )
+
+    def test_matching_etag_is_not_modified(self):
+        etag = self.client.get(self.url).headers["ETag"]
+
+        # gig and its label ids, no serialization
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.headers["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_if_modified_since_is_not_modified(self):
+        last_modified = self.client.get(self.url).headers["Last-Modified"]
+
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_changes_when_gig_is_updated(self):
+        etag = self.client.get(self.url).headers["ETag"]
+        self.gig.title = "Renamed gig"
+        self.gig.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_etag_changes_when_labels_change(self):
+        etag = self.client.get(self.url).headers["ETag"]
+        self.gig.event_label.add("gala")
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_label_change_bumps_updated_at(self):
+        updated_at = self.gig.updated_at
+        self.gig.event_label.set(["gala"])
+
+        self.gig.refresh_from_db()
+        self.assertGreater(self.gig.updated_at, updated_at)
+
+    def test_other_client_gets_no_validators(self):
+        self.client.force_authenticate(user=UserFactory(default_role="client"))
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertNotIn("ETag", response.headers)
+
+
+class GigListConditionalTests(APITestCase):
+    def setUp(self):
+        self.client_user = UserFactory(default_role="client")
+        GigFactory.create_batch(2, client=self.client_user, status="published")
+        self.client.force_authenticate(user=self.client_user)
+
+    def test_feed_matching_etag_is_not_modified(self):
+        url = reverse("gig-feed")
+        etag = self.client.get(url).headers["ETag"]
+
+        # the page only, its rows are not represented
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertNotIn("Last-Modified", response.headers)
+
+    def test_feed_etag_changes_when_listed_gig_is_updated(self):
+        url = reverse("gig-feed")
+        etag = self.client.get(url).headers["ETag"]
+        gig = Gig.objects.first()
+        gig.title = "Renamed gig"
+        gig.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_feed_etag_ignores_gigs_on_other_pages(self):
+        url = reverse("gig-feed")
+        params = {"page_size": 1}
+        etag = self.client.get(url, params).headers["ETag"]
+        gig = Gig.objects.order_by("start_datetime", "id").last()
+        gig.title = "Renamed gig"
+        gig.save()
+
+        response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_feed_etag_changes_when_gig_is_added(self):
+        url = reverse("gig-feed")
+        etag = self.client.get(url).headers["ETag"]
+        GigFactory(status="published")
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 3)
+
+    def test_feed_etag_changes_when_gig_is_removed(self):
+        url = reverse("gig-feed")
+        etag = self.client.get(url).headers["ETag"]
+        Gig.objects.first().delete()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_feed_etag_depends_on_filters(self):
+        url = reverse("gig-feed")
+        etag = self.client.get(url).headers["ETag"]
+
+        response = self.client.get(
+            url,
+            {
+                "start_after": (
+                    timezone.now() + timezone.timedelta(days=365)
+                ).isoformat()
+            },
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_facets_etag_changes_when_gig_on_other_page_changes_the_counts(self):
+        url = reverse("gig-facets")
+        later = GigFactory(
+            status="draft",
+            location_type="virtual",
+            venue=None,
+            event_label=["gala"],
+            start_datetime=timezone.now() + timezone.timedelta(days=400),
+        )
+        params = {"location_type": "virtual", "page_size": 1}
+        etag = self.client.get(url, params).headers["ETag"]
+        later.publish()
+
+        response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn({"label": "gala", "count": 1}, response.data["facets"])
+
+    def test_facets_etag_ignores_filtered_out_gigs(self):
+        url = reverse("gig-facets")
+        other = GigFactory(
+            status="draft", location_type="virtual", venue=None, event_label=["gala"]
+        )
+        params = {"location_type": "physical"}
+        etag = self.client.get(url, params).headers["ETag"]
+        other.publish()
+
+        response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_dashboard_etag_changes_when_unlisted_gig_changes_the_counts(self):
+        url = reverse("gig-dashboard")
+        draft = GigFactory(client=self.client_user, status="draft")
+        params = {"status": "published"}
+        etag = self.client.get(url, params).headers["ETag"]
+        draft.publish()
+
+        response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status_counts"]["draft"], 0)
@@ -0,0 +1,71 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from gigs import facets
+from gigs.models import EventLabelCount
+from gigs.tests.factories import GigFactory
+
+
+def counts(status="published"):
+    return {row["label"]: row["count"] for row in facets.label_counts(status)}
+
+
+class EventLabelCountTests(TestCase):
+    def test_counts_follow_added_and_removed_labels(self):
+        gig = GigFactory(status="published", event_label=["party", "wedding"])
+        GigFactory(status="published", event_label=["party"])
+        self.assertEqual(counts(), {"party": 2, "wedding": 1})
+
+        gig.event_label.remove("party")
+        self.assertEqual(counts(), {"party": 1, "wedding": 1})
+
+        gig.event_label.add("meetup")
+        self.assertEqual(counts(), {"party": 1, "wedding": 1, "meetup": 1})
+
+        gig.event_label.clear()
+        self.assertEqual(counts(), {"party": 1})
+
+    def test_counts_follow_status_changes(self):
+        gig = GigFactory(status="draft", event_label=["party"])
+        self.assertEqual(counts("draft"), {"party": 1})
+        self.assertEqual(counts(), {})
+
+        gig.status = "published"
+        gig.save()
+        self.assertEqual(counts("draft"), {})
+        self.assertEqual(counts(), {"party": 1})
+
+    def test_status_change_on_instance_loaded_from_db(self):
+        gig = GigFactory(status="draft", event_label=["party"])
+
+        loaded_gig = type(gig).objects.get(pk=gig.pk)
+        loaded_gig.status = "cancelled"
+        loaded_gig.save()
+        self.assertEqual(counts("draft"), {})
+        self.assertEqual(counts("cancelled"), {"party": 1})
+
+    def test_deleted_gigs_are_uncounted(self):
+        gig = GigFactory(status="published", event_label=["party"])
+        gig.delete()
+        self.assertEqual(counts(), {})
+
+    def test_counts_are_ordered_by_popularity(self):
+        GigFactory(status="published", event_label=["party", "wedding"])
+        GigFactory(status="published", event_label=["wedding"])
+        self.assertEqual(
+            facets.label_counts(),
+            [{"label": "wedding", "count": 2}, {"label": "party", "count": 1}],
+        )
+
+    def test_rebuild_command_recomputes_counts(self):
+        GigFactory(status="published", event_label=["party", "wedding"])
+        GigFactory(status="draft", event_label=["party"])
+        EventLabelCount.objects.update(count=100)
+
+        out = StringIO()
+        call_command("rebuild_event_label_counts", stdout=out)
+        self.assertIn("Wrote 3 event label counts.", out.getvalue())
+        self.assertEqual(counts(), {"party": 1, "wedding": 1})
+        self.assertEqual(counts("draft"), {"party": 1})
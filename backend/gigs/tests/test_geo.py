@@ -0,0 +1,70 @@
+from django.test import SimpleTestCase, TestCase
+
+from gigs import geo
+from gigs.models import Gig
+from gigs.tests.factories import GigFactory, VenueFactory
+
+
+class GridCellTests(SimpleTestCase):
+    def test_cell_for_coordinates(self):
+        self.assertEqual(geo.cell_for(-1.2921, 36.8219), "887:2168")
+        self.assertEqual(geo.cell_for(90, 180), "1799:0")
+        self.assertEqual(geo.cell_for(None, 36.8219), "")
+
+    def test_cells_cover_the_search_circle(self):
+        cells = geo.cells_covering(-1.2921, 36.8219, 10)
+        self.assertIn(geo.cell_for(-1.2921, 36.8219), cells)
+        self.assertIn(geo.cell_for(-1.2921 + 0.089, 36.8219 + 0.089), cells)
+        self.assertLessEqual(len(cells), 9)
+
+    def test_cells_wrap_around_the_antimeridian(self):
+        cells = geo.cells_covering(0, 179.99, 5)
+        self.assertIn(geo.cell_for(0, -179.99), cells)
+
+    def test_large_radius_does_not_enumerate_cells(self):
+        self.assertIsNone(geo.cells_covering(0, 0, 400))
+
+    def test_haversine_distance(self):
+        # Nairobi to Mombasa
+        distances = geo.haversine_km(-1.2921, 36.8219, [-4.0435], [39.6682])
+        self.assertAlmostEqual(distances[0], 440.6, delta=1)
+
+
+class NearbyGigsTests(TestCase):
+    def gig_at(self, latitude, longitude):
+        return GigFactory(
+            status="published",
+            location_type="physical",
+            venue=VenueFactory(latitude=latitude, longitude=longitude),
+        )
+
+    def test_venue_save_sets_grid_cell(self):
+        venue = VenueFactory(latitude=-1.2921, longitude=36.8219)
+        self.assertEqual(venue.geo_cell, "887:2168")
+
+        venue.latitude = None
+        venue.save(update_fields=["latitude"])
+        venue.refresh_from_db()
+        self.assertEqual(venue.geo_cell, "")
+
+    def test_gigs_within_radius_nearest_first(self):
+        far = self.gig_at(-1.2921 + 0.08, 36.8219)  # about 8.9 km north
+        near = self.gig_at(-1.2921, 36.8219 + 0.01)  # about 1.1 km east
+        self.gig_at(-1.2921 + 0.2, 36.8219)  # about 22 km north
+        GigFactory(status="published", location_type="virtual")
+
+        results = geo.nearby_gigs(Gig.objects.all(), -1.2921, 36.8219, 10)
+        self.assertEqual([gig_id for gig_id, _ in results], [near.id, far.id])
+        self.assertAlmostEqual(results[0][1], 1.11, delta=0.01)
+
+    def test_gigs_across_the_antimeridian(self):
+        gig = self.gig_at(0, -179.99)
+        results = geo.nearby_gigs(Gig.objects.all(), 0, 179.99, 5)
+        self.assertEqual([gig_id for gig_id, _ in results], [gig.id])
+
+    def test_large_radius_uses_bounding_box(self):
+        mombasa = self.gig_at(-4.0435, 39.6682)
+        results = geo.nearby_gigs(Gig.objects.all(), -1.2921, 36.8219, 450)
+        self.assertEqual([gig_id for gig_id, _ in results], [mombasa.id])
+
+        self.assertEqual(geo.nearby_gigs(Gig.objects.all(), -1.2921, 36.8219, 430), [])
@@ -3,6 +3,7 @@ from django.utils import timezone
 from django.core.exceptions import ValidationError
 
 from gigs.tests.factories import GigFactory, VenueFactory
+from users.tests.factories import UserFactory
 
 
 class GigModelTests(TestCase):
@@ -95,6 +96,20 @@ class GigModelTests(TestCase):
             "Venue is not appropriate for virtual gigs.",
         )
 
+    def test_clean_validates_agent_is_an_agent(self):
+        gig = GigFactory(
+            status="published",
+            location_type="virtual",
+            agent=UserFactory(default_role="client"),
+        )
+        with self.assertRaises(ValidationError) as context:
+            gig.full_clean()
+
+        self.assertEqual(
+            context.exception.message_dict["agent"][0],
+            "Agent must be an actual agent in app.",
+        )
+
 
 class VenueModelTests(TestCase):
     def test_str_method_returns_name(self):
@@ -0,0 +1,177 @@
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.testing import QueryBudgetTestMixin
+from gigs import applications
+from gigs.serializers import GigSerializer
+from gigs.tests.factories import GigFactory, VenueFactory
+from users.tests.factories import UserFactory
+
+PAGE = 5
+
+# taggit resolves and adds labels one by one
+TAGGIT = ("taggit_tag", "gigs_uuidtaggeditem")
+# status changes decrement the old status counts and increment the new ones
+LABEL_COUNTS = ("event_label_counts",)
+
+
+class GigQueryBudgetTests(QueryBudgetTestMixin, APITestCase):
+    """
+    Every gig endpoint runs against several rows, so queries run once per row show
+    up as repeated shapes.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.client_user = UserFactory(default_role="client")
+        cls.agent = UserFactory(default_role="agent")
+        cls.agent.preferred_labels.set(["wedding"])
+
+        cls.gigs = [
+            GigFactory(
+                client=cls.client_user,
+                status="published",
+                location_type="physical",
+                venue=VenueFactory(latitude=-1.2921, longitude=36.8219),
+                title=f"Wedding gig {index}",
+                event_label=["wedding", "party"],
+            )
+            for index in range(PAGE)
+        ]
+        cls.draft = GigFactory(
+            client=cls.client_user, status="draft", location_type="virtual"
+        )
+        for _ in range(PAGE):
+            applications.apply(cls.gigs[0], UserFactory(default_role="agent"))
+        for gig in cls.gigs[1:]:
+            applications.apply(gig, cls.agent)
+
+        start = timezone.now() + timezone.timedelta(days=2)
+        for offset in range(PAGE):
+            GigFactory(
+                status="agent_confirmed",
+                agent=cls.agent,
+                start_datetime=start + timezone.timedelta(minutes=offset),
+                end_datetime=start + timezone.timedelta(hours=3),
+            )
+
+    def gig_data(self, **overrides):
+        return {
+            "title": "Budget gig",
+            "description": "A detailed description with sufficient length for validation.",
+            "event_label": ["wedding", "party"],
+            "location_type": "physical",
+            "venue": {
+                "google_place_id": "place-budget",
+                "name": "Budget Hall",
+                "address": "1 Budget Street",
+                "location": {
+                    "city": "Nairobi",
+                    "state_region": "Nairobi",
+                    "country": "Kenya",
+                },
+            },
+            "start_datetime": (timezone.now() + timezone.timedelta(days=1)).isoformat(),
+            "end_datetime": (
+                timezone.now() + timezone.timedelta(days=1, hours=2)
+            ).isoformat(),
+            "compensation": "150.00",
+            **overrides,
+        }
+
+    def get(self, url_name, user, data=None, **kwargs):
+        self.client.force_authenticate(user=user)
+        with self.assertWithinQueryBudget(url_name):
+            response = self.client.get(reverse(url_name, kwargs=kwargs), data)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_feed(self):
+        self.get("gig-feed", self.agent, {"page_size": PAGE})
+
+    def test_facets(self):
+        self.get("gig-facets", self.agent, {"page_size": PAGE})
+
+    def test_dashboard(self):
+        self.get("gig-dashboard", self.client_user, {"page_size": PAGE})
+
+    def test_nearby(self):
+        self.get("gig-nearby", self.agent, {"latitude": -1.2921, "longitude": 36.8219})
+
+    def test_recommendations(self):
+        self.get("gig-recommendations", self.agent)
+
+    def test_search(self):
+        self.get("gig-search", self.agent, {"q": "wedding"})
+
+    def test_schedule_conflicts(self):
+        response = self.get("gig-schedule-conflicts", self.agent)
+        self.assertGreater(len(response.data["results"]), 1)
+
+    def test_client_review(self):
+        self.get("gig-client-review", self.client_user, pk=self.gigs[0].pk)
+
+    def test_gig_applications(self):
+        self.get("gig-applications", self.client_user, pk=self.gigs[0].pk)
+
+    def test_agent_applications(self):
+        self.get("agent-applications", self.agent)
+
+    def test_create(self):
+        self.client.force_authenticate(user=self.client_user)
+        # the gig is indexed for search once labelled
+        with self.assertWithinQueryBudget("gig-create", allow_repeated=TAGGIT):
+            response = self.client.post(reverse("gig-create"), self.gig_data())
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_bulk_create(self):
+        gigs = [self.gig_data(title=f"Budget gig {index}") for index in range(PAGE)]
+        self.client.force_authenticate(user=self.client_user)
+        # venues and locations are looked up again once the missing ones are created
+        with self.assertWithinQueryBudget(
+            "gig-bulk-create", allow_repeated=('FROM "venues"', 'FROM "locations"')
+        ):
+            response = self.client.post(reverse("gig-bulk-create"), gigs)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_update(self):
+        gig = self.gigs[1]
+        data = {**GigSerializer(gig).data, "title": "Updated budget gig"}
+        self.client.force_authenticate(user=self.client_user)
+        with self.assertWithinQueryBudget("gig-update", allow_repeated=TAGGIT):
+            response = self.client.put(
+                reverse("gig-update", kwargs={"pk": gig.pk}), data
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_publish(self):
+        self.client.force_authenticate(user=self.client_user)
+        with self.assertWithinQueryBudget("gig-publish", allow_repeated=LABEL_COUNTS):
+            response = self.client.post(
+                reverse("gig-publish", kwargs={"pk": self.draft.pk})
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_apply(self):
+        self.client.force_authenticate(user=UserFactory(default_role="agent"))
+        with self.assertWithinQueryBudget("gig-apply"):
+            response = self.client.post(
+                reverse("gig-apply", kwargs={"pk": self.gigs[1].pk})
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_accept_application(self):
+        application = self.gigs[0].applications.first()
+        self.client.force_authenticate(user=self.client_user)
+        with self.assertWithinQueryBudget(
+            "gig-application-accept", allow_repeated=LABEL_COUNTS
+        ):
+            response = self.client.post(
+                reverse(
+                    "gig-application-accept",
+                    kwargs={"pk": self.gigs[0].pk, "application_pk": application.pk},
+                )
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,143 @@
+import uuid
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from core.tests.factories import LocationFactory
+from gigs import recommendations
+from gigs.recommendations import CandidatePool
+from gigs.tests.factories import GigFactory, VenueFactory
+from users.tests.factories import UserFactory
+
+
+class ScoreTests(SimpleTestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.in_two_days = (self.now + timezone.timedelta(days=2)).timestamp()
+
+    def pool(self, **columns):
+        size = len(next(iter(columns.values())))
+        defaults = {
+            "ids": [uuid.uuid4() for _ in range(size)],
+            "location_levels": [recommendations.NO_MATCH] * size,
+            "label_matches": [0] * size,
+            "compensations": [100.0] * size,
+            "start_timestamps": [self.in_two_days] * size,
+            "preferred_label_count": 2,
+        }
+        return CandidatePool(**{**defaults, **columns})
+
+    def test_closer_gigs_score_higher(self):
+        pool = self.pool(
+            location_levels=[
+                recommendations.NO_MATCH,
+                recommendations.SAME_COUNTRY,
+                recommendations.SAME_REGION,
+                recommendations.SAME_CITY,
+            ]
+        )
+        scores = recommendations.score(pool, now=self.now)
+        self.assertEqual(list(scores.argsort()), [0, 1, 2, 3])
+
+    def test_preferred_labels_score_higher(self):
+        pool = self.pool(label_matches=[0, 2, 1])
+        scores = recommendations.score(pool, now=self.now)
+        self.assertEqual(list(scores.argsort()), [0, 2, 1])
+
+    def test_better_paid_gigs_score_higher(self):
+        pool = self.pool(compensations=[50.0, 5000.0, 500.0])
+        scores = recommendations.score(pool, now=self.now)
+        self.assertEqual(list(scores.argsort()), [0, 2, 1])
+
+    def test_gigs_starting_too_soon_or_far_away_score_lower(self):
+        pool = self.pool(
+            start_timestamps=[
+                (self.now + timezone.timedelta(hours=2)).timestamp(),
+                self.in_two_days,
+                (self.now + timezone.timedelta(days=60)).timestamp(),
+            ]
+        )
+        scores = recommendations.score(pool, now=self.now)
+        self.assertEqual(list(scores.argsort()), [0, 2, 1])
+
+    def test_top_matches_are_best_first(self):
+        pool = self.pool(label_matches=[0, 2, 1, 2])
+        scores = recommendations.score(pool, now=self.now)
+
+        matches = recommendations.top_matches(pool, scores, limit=2)
+        self.assertEqual([gig_id for gig_id, _ in matches], [pool.ids[1], pool.ids[3]])
+
+    def test_empty_pool(self):
+        pool = CandidatePool([], [], [], [], [], 0)
+        scores = recommendations.score(pool, now=self.now)
+        self.assertEqual(recommendations.top_matches(pool, scores, limit=5), [])
+
+
+class CandidatePoolTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.location = LocationFactory(
+            city="Nairobi", state_region="Nairobi County", country="Kenya"
+        )
+        cls.agent = UserFactory(default_role="agent", location=cls.location)
+        cls.agent.preferred_labels.set(["wedding", "party"])
+
+    def physical_gig(self, location, **kwargs):
+        return GigFactory(
+            status="published",
+            location_type="physical",
+            venue=VenueFactory(location=location),
+            **kwargs,
+        )
+
+    def test_pool_contains_only_open_upcoming_gigs(self):
+        open_gig = GigFactory(status="published", location_type="virtual")
+        GigFactory(status="draft", location_type="virtual")
+        GigFactory(
+            status="published",
+            location_type="virtual",
+            agent=UserFactory(default_role="agent"),
+        )
+        GigFactory(
+            status="published",
+            location_type="virtual",
+            start_datetime=timezone.now() - timezone.timedelta(days=1),
+        )
+
+        pool = CandidatePool.for_agent(self.agent)
+        self.assertEqual(pool.ids, [open_gig.id])
+
+    def test_location_levels_and_label_matches(self):
+        same_city = self.physical_gig(self.location, event_label=["wedding", "party"])
+        same_region = self.physical_gig(
+            LocationFactory(
+                city="Karen", state_region="Nairobi County", country="Kenya"
+            ),
+            event_label=["wedding"],
+        )
+        same_country = self.physical_gig(
+            LocationFactory(city="Mombasa", state_region="Mombasa", country="Kenya"),
+            event_label=["meetup"],
+        )
+        elsewhere = self.physical_gig(LocationFactory(country="Uganda"))
+        virtual = GigFactory(status="published", location_type="virtual")
+
+        pool = CandidatePool.for_agent(self.agent)
+        levels = dict(zip(pool.ids, pool.location_levels))
+        matches = dict(zip(pool.ids, pool.label_matches))
+
+        self.assertEqual(levels[same_city.id], recommendations.SAME_CITY)
+        self.assertEqual(levels[same_region.id], recommendations.SAME_REGION)
+        self.assertEqual(levels[same_country.id], recommendations.SAME_COUNTRY)
+        self.assertEqual(levels[elsewhere.id], recommendations.NO_MATCH)
+        self.assertEqual(levels[virtual.id], recommendations.VIRTUAL)
+        self.assertEqual(matches[same_city.id], 2)
+        self.assertEqual(matches[same_region.id], 1)
+        self.assertEqual(matches[same_country.id], 0)
+
+    def test_recommend_ranks_best_match_first(self):
+        best = self.physical_gig(self.location, event_label=["wedding", "party"])
+        self.physical_gig(LocationFactory(country="Uganda"), event_label=["meetup"])
+
+        matches = recommendations.recommend(self.agent, limit=1)
+        self.assertEqual([gig_id for gig_id, _ in matches], [best.id])
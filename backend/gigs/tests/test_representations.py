@@ -0,0 +1,83 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from gigs import representations
+from gigs.models import Gig
+from gigs.serializers import GigSerializer
+from gigs.tests.factories import GigFactory, VenueFactory
+from users.tests.factories import UserFactory
+
+
+class RepresentGigsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        GigFactory(
+            location_type="physical",
+            venue=VenueFactory(latitude=-1.2921, longitude=36.8219),
+            event_label=["wedding", "Gala", "after party"],
+            compensation="1234.50",
+        )
+        GigFactory(
+            location_type="physical",
+            venue=VenueFactory(),
+            status="agent_confirmed",
+            agent=UserFactory(default_role="agent"),
+            event_label=[],
+            timezone="Africa/Nairobi",
+        )
+        GigFactory(
+            location_type="virtual",
+            venue=None,
+            start_datetime=timezone.now().replace(microsecond=0)
+            + timezone.timedelta(days=3),
+            end_datetime=timezone.now().replace(microsecond=0)
+            + timezone.timedelta(days=3, hours=1),
+        )
+
+    def queryset(self):
+        return Gig.objects.order_by("start_datetime", "id")
+
+    def test_output_is_identical_to_gig_serializer(self):
+        expected = GigSerializer(
+            self.queryset()
+            .select_related("venue__location")
+            .prefetch_related("event_label"),
+            many=True,
+        ).data
+
+        compiled = representations.represent_gigs(self.queryset())
+
+        renderer = JSONRenderer()
+        self.assertEqual(renderer.render(compiled), renderer.render(expected))
+
+    def test_output_is_identical_in_another_time_zone(self):
+        with timezone.override("Africa/Nairobi"):
+            expected = GigSerializer(self.queryset(), many=True).data
+            compiled = representations.represent_gigs(self.queryset())
+
+        renderer = JSONRenderer()
+        self.assertEqual(renderer.render(compiled), renderer.render(expected))
+
+    def test_queries_do_not_depend_on_the_number_of_gigs(self):
+        with self.assertNumQueries(2):
+            representations.represent_gigs(self.queryset())
+
+    def test_represent_gigs_by_id(self):
+        gig = Gig.objects.first()
+        by_id = representations.represent_gigs_by_id([gig.id])
+        self.assertEqual(list(by_id), [gig.id])
+        self.assertEqual(by_id[gig.id]["title"], gig.title)
+
+
+class BenchmarkCommandTests(TestCase):
+    def test_benchmark_leaves_no_gigs_behind(self):
+        out = StringIO()
+        call_command(
+            "benchmark_gig_representation", "--rows", "20", "--repeat", "1", stdout=out
+        )
+        self.assertIn("output identical", out.getvalue())
+        self.assertFalse(Gig.objects.exists())
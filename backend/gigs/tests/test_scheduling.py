@@ -0,0 +1,122 @@
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from gigs.scheduling import AgentSchedule, ensure_agent_available
+from gigs.tests.factories import GigFactory
+from users.tests.factories import UserFactory
+
+START = timezone.datetime(2030, 1, 1, tzinfo=timezone.get_default_timezone())
+
+
+def hours(count):
+    return START + timezone.timedelta(hours=count)
+
+
+class AgentScheduleTests(SimpleTestCase):
+    def setUp(self):
+        # a long gig spanning two short ones, and a gig later on
+        self.schedule = AgentSchedule(
+            [
+                ("late", hours(20), hours(22)),
+                ("short", hours(2), hours(3)),
+                ("long", hours(0), hours(10)),
+                ("after", hours(5), hours(6)),
+            ]
+        )
+
+    def test_gigs_are_sorted_by_start(self):
+        self.assertEqual(self.schedule.ids, ["long", "short", "after", "late"])
+
+    def test_is_free(self):
+        self.assertFalse(self.schedule.is_free(hours(8), hours(9)))
+        self.assertFalse(self.schedule.is_free(hours(21), hours(30)))
+        self.assertTrue(self.schedule.is_free(hours(12), hours(18)))
+        self.assertTrue(self.schedule.is_free(hours(-5), hours(-1)))
+
+    def test_touching_gigs_do_not_overlap(self):
+        self.assertTrue(self.schedule.is_free(hours(10), hours(20)))
+        self.assertTrue(self.schedule.is_free(hours(22), hours(23)))
+        self.assertTrue(self.schedule.is_free(hours(-1), hours(0)))
+
+    def test_overlapping(self):
+        self.assertEqual(
+            self.schedule.overlapping(hours(2), hours(5.5)), ["long", "short", "after"]
+        )
+        self.assertEqual(
+            self.schedule.overlapping(hours(9), hours(21)), ["long", "late"]
+        )
+        self.assertEqual(self.schedule.overlapping(hours(10), hours(20)), [])
+
+    def test_conflicts(self):
+        self.assertEqual(
+            self.schedule.conflicts(),
+            [
+                ("long", "short", hours(2), hours(3)),
+                ("long", "after", hours(5), hours(6)),
+            ],
+        )
+
+    def test_empty_schedule(self):
+        schedule = AgentSchedule([])
+        self.assertTrue(schedule.is_free(hours(0), hours(1)))
+        self.assertEqual(schedule.overlapping(hours(0), hours(1)), [])
+        self.assertEqual(schedule.conflicts(), [])
+
+
+class AgentAvailabilityTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.agent = UserFactory(default_role="agent")
+        cls.start = timezone.now() + timezone.timedelta(days=3)
+        cls.booked = GigFactory(
+            status="agent_confirmed",
+            agent=cls.agent,
+            start_datetime=cls.start,
+            end_datetime=cls.start + timezone.timedelta(hours=4),
+        )
+
+    def test_overlapping_booking_is_rejected(self):
+        with self.assertRaises(ValidationError) as context:
+            ensure_agent_available(
+                self.agent.pk,
+                self.start + timezone.timedelta(hours=3),
+                self.start + timezone.timedelta(hours=5),
+            )
+        self.assertEqual(
+            context.exception.message_dict["agent"],
+            ["Agent is already booked on another gig during this time."],
+        )
+
+    def test_gig_does_not_conflict_with_itself(self):
+        ensure_agent_available(
+            self.agent.pk,
+            self.booked.start_datetime,
+            self.booked.end_datetime,
+            exclude=self.booked.pk,
+        )
+
+    def test_gigs_not_booked_are_ignored(self):
+        GigFactory(
+            status="completed",
+            agent=self.agent,
+            start_datetime=self.start + timezone.timedelta(days=1),
+            end_datetime=self.start + timezone.timedelta(days=1, hours=2),
+        )
+        ensure_agent_available(
+            self.agent.pk,
+            self.start + timezone.timedelta(days=1),
+            self.start + timezone.timedelta(days=1, hours=1),
+        )
+
+    def test_assigning_a_booked_agent_fails_validation(self):
+        gig = GigFactory(
+            status="published",
+            location_type="virtual",
+            start_datetime=self.start + timezone.timedelta(hours=1),
+            end_datetime=self.start + timezone.timedelta(hours=2),
+        )
+        gig.agent = self.agent
+        with self.assertRaises(ValidationError) as context:
+            gig.full_clean()
+        self.assertIn("agent", context.exception.message_dict)
@@ -0,0 +1,115 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from gigs import search, signals
+from gigs.models import Gig
+from gigs.tests.factories import GigFactory
+
+
+def search_ids(query, queryset=None, limit=20):
+    queryset = queryset if queryset is not None else Gig.objects.all()
+    return search.search_gig_ids(search.build_match_expression(query), queryset, limit)
+
+
+class BuildMatchExpressionTests(TestCase):
+    def test_words_are_quoted_and_prefix_matched(self):
+        self.assertEqual(
+            search.build_match_expression("wedding photo"), '"wedding"* "photo"*'
+        )
+
+    def test_fts_syntax_is_not_interpreted(self):
+        self.assertEqual(
+            search.build_match_expression('title:"party" OR NEAR(a'),
+            '"title"* "party"* "OR"* "NEAR"* "a"*',
+        )
+
+    def test_query_without_words_returns_none(self):
+        self.assertIsNone(search.build_match_expression("  *!? "))
+
+
+class SearchIndexTests(TestCase):
+    def test_gigs_are_indexed_on_save(self):
+        gig = GigFactory(title="Annual Robotics Expo")
+        self.assertEqual(search_ids("robotics"), [gig.id])
+
+        gig.title = "Annual Gardening Expo"
+        gig.save()
+        self.assertEqual(search_ids("robotics"), [])
+        self.assertEqual(search_ids("garden"), [gig.id])
+
+    def test_event_labels_are_indexed(self):
+        gig = GigFactory(event_label=["hackathon"])
+        self.assertEqual(search_ids("hackathon"), [gig.id])
+
+        gig.event_label.set(["seminar"])
+        self.assertEqual(search_ids("hackathon"), [])
+        self.assertEqual(search_ids("seminar"), [gig.id])
+
+    def test_new_gigs_are_left_to_the_caller_while_labelled(self):
+        with CaptureQueriesContext(connection) as queries:
+            with signals.labelling_new_gigs() as gig_ids:
+                gig = GigFactory(
+                    title="Annual Robotics Expo", event_label=["hackathon"]
+                )
+
+        self.assertEqual(gig_ids, [gig.id])
+        # neither indexed nor touched when the labels were set
+        self.assertEqual(
+            [
+                query["sql"]
+                for query in queries
+                if search.SEARCH_TABLE in query["sql"]
+                or query["sql"].startswith('UPDATE "gigs"')
+            ],
+            [],
+        )
+
+        search.index_gigs(gig_ids)
+        self.assertEqual(search_ids("robotics hackathon"), [gig.id])
+
+    def test_deleted_gigs_are_removed_from_index(self):
+        gig = GigFactory(title="Annual Robotics Expo")
+        gig.delete()
+        self.assertEqual(search_ids("robotics"), [])
+
+    def test_title_matches_rank_above_description_matches(self):
+        in_description = GigFactory(
+            title="Quarterly review",
+            description="We need someone to attend the robotics demo and take notes for us.",
+        )
+        in_title = GigFactory(title="Robotics demo")
+
+        self.assertEqual(search_ids("robotics"), [in_title.id, in_description.id])
+
+    def test_search_is_restricted_to_queryset(self):
+        published = GigFactory(title="Robotics demo", status="published")
+        GigFactory(title="Robotics demo", status="draft")
+        GigFactory(
+            title="Robotics demo",
+            status="published",
+            start_datetime=timezone.now() + timezone.timedelta(days=400),
+        )
+
+        queryset = Gig.objects.filter(
+            status="published",
+            start_datetime__lt=timezone.now() + timezone.timedelta(days=365),
+        )
+        self.assertEqual(search_ids("robotics", queryset), [published.id])
+
+    def test_rebuild_command_recreates_index(self):
+        gig = GigFactory(title="Annual Robotics Expo", event_label=["hackathon"])
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {search.SEARCH_TABLE}")
+        self.assertEqual(search_ids("robotics"), [])
+
+        out = StringIO()
+        call_command("rebuild_gig_search_index", batch_size=1, stdout=out)
+        self.assertIn("Indexed 1 gigs.", out.getvalue())
+
+        self.assertEqual(search_ids("robotics"), [gig.id])
+        self.assertEqual(search_ids("hackathon"), [gig.id])
@@ -0,0 +1,97 @@
+from collections import Counter
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from core.models import Location
+from gigs import search
+from gigs.models import EventLabelCount, Gig, UUIDTaggedItem, Venue
+from gigs.seeding import EVENT_LABELS, LABELS_PER_GIG, Seeder
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class SeederTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = Seeder(seed=7, batch_size=8, pool_size=20).seed(
+            users=10, locations=4, venues=5, gigs=30
+        )
+
+    def test_rows_are_created(self):
+        self.assertEqual(get_user_model().objects.count(), 10)
+        self.assertEqual(Venue.objects.count(), 5)
+        self.assertEqual(Gig.objects.count(), 30)
+        self.assertEqual(UUIDTaggedItem.objects.count(), 30 * LABELS_PER_GIG)
+
+    def test_users_alternate_roles_and_share_the_password(self):
+        roles = Counter(user.default_role for user in self.users)
+        self.assertEqual(roles, {"agent": 5, "client": 5})
+        user = get_user_model().objects.get(email="user1@example.com")
+        self.assertTrue(user.is_client)
+        self.assertTrue(user.check_password("password"))
+
+    def test_gigs_follow_the_factory_distributions(self):
+        statuses = Counter(Gig.objects.values_list("status", flat=True))
+        self.assertEqual(set(statuses), {status for status, _ in Gig.STATUS_CHOICES})
+
+        for gig in Gig.objects.select_related("client", "agent"):
+            self.assertTrue(gig.client.is_client)
+            self.assertEqual(
+                gig.agent is not None, gig.status in ("agent_confirmed", "completed")
+            )
+            self.assertEqual(gig.venue_id is not None, gig.location_type == "physical")
+            self.assertLess(gig.start_datetime, gig.end_datetime)
+            labels = list(gig.event_label.names())
+            self.assertEqual(len(labels), LABELS_PER_GIG)
+            self.assertTrue(set(labels) <= set(EVENT_LABELS))
+
+    def test_search_index_and_label_counts_are_rebuilt(self):
+        gig = Gig.objects.first()
+        match = search.build_match_expression(gig.title)
+        self.assertIn(gig.pk, search.search_gig_ids(match, Gig.objects.all(), 30))
+        self.assertEqual(
+            sum(EventLabelCount.objects.values_list("count", flat=True)),
+            30 * LABELS_PER_GIG,
+        )
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class SeederDeterminismTests(TestCase):
+    def seed(self):
+        Seeder(seed=3, pool_size=20).seed(
+            users=4, locations=2, venues=2, gigs=10, index=False
+        )
+        return sorted(
+            Gig.objects.values_list("id", "title", "compensation", "client__email")
+        )
+
+    def test_same_seed_gives_the_same_rows(self):
+        first = self.seed()
+        Gig.objects.all().delete()
+        get_user_model().objects.all().delete()
+        Venue.objects.all().delete()
+        Location.objects.all().delete()
+        self.assertEqual(self.seed(), first)
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class SeedDataCommandTests(TestCase):
+    def test_command_reports_the_seeded_rows(self):
+        out = StringIO()
+        call_command(
+            "seed_data",
+            "--gigs=12",
+            "--users=4",
+            "--locations=2",
+            "--venues=3",
+            "--batch-size=5",
+            "--skip-index",
+            stdout=out,
+        )
+
+        self.assertIn(
+            "Seeded 4 users, 2 locations, 3 venues and 12 gigs", out.getvalue()
+        )
+        self.assertEqual(Gig.objects.count(), 12)
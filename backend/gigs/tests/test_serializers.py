@@ -42,6 +42,13 @@ class GigSerializerTests(TestCase):
         self.assertEqual(Gig.objects.count(), 1)
         self.assertEqual(gig.title, "New Test Gig")
 
+    def test_unknown_timezone_is_rejected(self):
+        serializer = GigSerializer(data={**self.valid_data, "timezone": "Mars/Olympus"})
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(
+            serializer.errors["timezone"], ["Mars/Olympus is not a valid time zone."]
+        )
+
     def test_nested_venue_serializer_is_correctly_linked_during_create_and_update(
         self,
     ):
@@ -85,6 +92,54 @@ class GigSerializerTests(TestCase):
         self.assertEqual(updated_gig.venue.name, "Updated Grand Hall")
         self.assertEqual(updated_gig.venue.location.city, "Test City")
 
+    def test_existing_venue_is_reused_by_google_place_id(self):
+        data_with_venue = {
+            **self.valid_data,
+            "location_type": "physical",
+            "venue": self.venue,
+        }
+        client = UserFactory(default_role="client")
+        serializer = GigSerializer(data=data_with_venue)
+        self.assertTrue(serializer.is_valid())
+        first = serializer.save(client=client)
+
+        renamed = {**data_with_venue, "venue": {**self.venue, "name": "Renamed Hall"}}
+        serializer = GigSerializer(data=renamed)
+        self.assertTrue(serializer.is_valid())
+        second = serializer.save(client=client)
+
+        self.assertEqual(second.venue.pk, first.venue.pk)
+        self.assertEqual(Venue.objects.count(), 1)
+
+    def test_existing_venue_is_not_rewritten(self):
+        data_with_venue = {
+            **self.valid_data,
+            "location_type": "physical",
+            "venue": self.venue,
+        }
+        client = UserFactory(default_role="client")
+        serializer = GigSerializer(data=data_with_venue)
+        self.assertTrue(serializer.is_valid())
+        first = serializer.save(client=client)
+
+        # another client submits different details for the same place
+        renamed = {
+            **data_with_venue,
+            "venue": {
+                **self.venue,
+                "name": "Renamed Hall",
+                "location": {**self.venue["location"], "city": "Other City"},
+            },
+        }
+        serializer = GigSerializer(data=renamed)
+        self.assertTrue(serializer.is_valid())
+        second = serializer.save(client=UserFactory(default_role="client"))
+
+        self.assertEqual(second.venue.pk, first.venue.pk)
+        venue = Venue.objects.select_related("location").get()
+        self.assertEqual(venue.name, self.venue["name"])
+        self.assertEqual(venue.location.city, self.venue["location"]["city"])
+
     def test_client_field_is_read_only(self):
         """Test that client cannot be set using input data during gig creation or update."""
         serializer = GigSerializer()
@@ -0,0 +1,60 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from gigs import facets, sweeper
+from gigs.models import Gig
+from gigs.tests.factories import GigFactory
+
+
+def ended_gig(status, **kwargs):
+    start = timezone.now() - timezone.timedelta(days=1)
+    return GigFactory(
+        status=status,
+        start_datetime=start,
+        end_datetime=start + timezone.timedelta(hours=2),
+        **kwargs,
+    )
+
+
+class SweepExpiredGigsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.confirmed = [ended_gig("agent_confirmed") for _ in range(3)]
+        cls.published = ended_gig("published", event_label=["wedding"])
+        cls.draft = ended_gig("draft")
+        cls.upcoming = GigFactory(
+            status="published",
+            start_datetime=timezone.now() + timezone.timedelta(days=1),
+            end_datetime=timezone.now() + timezone.timedelta(days=1, hours=2),
+        )
+
+    def status_of(self, gig):
+        return Gig.objects.values_list("status", flat=True).get(pk=gig.pk)
+
+    def test_expired_gigs_are_completed_or_cancelled(self):
+        moved = sweeper.sweep_expired_gigs(batch_size=2)
+
+        self.assertEqual(moved, {"completed": 3, "cancelled": 1})
+        for gig in self.confirmed:
+            self.assertEqual(self.status_of(gig), "completed")
+        self.assertEqual(self.status_of(self.published), "cancelled")
+        self.assertEqual(self.status_of(self.draft), "draft")
+        self.assertEqual(self.status_of(self.upcoming), "published")
+
+    def test_label_counts_are_moved(self):
+        sweeper.sweep_expired_gigs()
+        self.assertEqual(
+            facets.label_counts("cancelled"), [{"label": "wedding", "count": 1}]
+        )
+
+    def test_second_sweep_has_nothing_to_do(self):
+        sweeper.sweep_expired_gigs()
+        self.assertEqual(sweeper.sweep_expired_gigs(), {"completed": 0, "cancelled": 0})
+
+    def test_command(self):
+        out = StringIO()
+        call_command("sweep_expired_gigs", "--batch-size", "1", stdout=out)
+        self.assertIn("Completed 3 gigs, cancelled 1 gigs.", out.getvalue())
@@ -0,0 +1,111 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from gigs import facets, transitions
+from gigs.models import Gig
+from gigs.tests.factories import GigFactory
+from users.tests.factories import UserFactory
+
+
+class TransitionGigsTests(TestCase):
+    def test_only_gigs_in_a_source_status_move(self):
+        draft = GigFactory(status="draft")
+        published = GigFactory(status="published")
+
+        moved = transitions.transition_gigs([draft.pk, published.pk], "publish")
+
+        self.assertEqual(moved, [draft.pk])
+        draft.refresh_from_db()
+        self.assertEqual(draft.status, "published")
+
+    def test_transition_from_several_statuses(self):
+        gigs = [
+            GigFactory(status=status)
+            for status in ["draft", "published", "agent_confirmed", "completed"]
+        ]
+
+        moved = transitions.transition_gigs([gig.pk for gig in gigs], "cancel")
+
+        self.assertCountEqual(moved, [gig.pk for gig in gigs[:3]])
+        self.assertEqual(
+            sorted(Gig.objects.values_list("status", flat=True)),
+            ["cancelled", "cancelled", "cancelled", "completed"],
+        )
+
+    def test_second_transition_loses(self):
+        gig = GigFactory(status="draft")
+        self.assertEqual(transitions.transition_gigs([gig.pk], "publish"), [gig.pk])
+        self.assertEqual(transitions.transition_gigs([gig.pk], "publish"), [])
+
+    def test_conditions_and_values(self):
+        agent = UserFactory(default_role="agent")
+        gig = GigFactory(status="published", agent=None)
+
+        moved = transitions.transition_gigs(
+            [gig.pk],
+            "confirm_agent",
+            values={"agent_id": agent.pk},
+            conditions={"agent_id": None},
+        )
+        self.assertEqual(moved, [gig.pk])
+        gig.refresh_from_db()
+        self.assertEqual(gig.agent, agent)
+        self.assertEqual(gig.status, "agent_confirmed")
+
+        # the gig has an agent now, the condition no longer holds
+        Gig.objects.filter(pk=gig.pk).update(status="published")
+        moved = transitions.transition_gigs(
+            [gig.pk], "confirm_agent", conditions={"agent_id": None}
+        )
+        self.assertEqual(moved, [])
+
+    def test_updated_at_is_refreshed(self):
+        gig = GigFactory(status="draft")
+        transitions.transition_gigs([gig.pk], "publish")
+        self.assertGreater(Gig.objects.get(pk=gig.pk).updated_at, gig.updated_at)
+
+    def test_label_counts_follow_the_transition(self):
+        gigs = [GigFactory(status="draft", event_label=["wedding"]) for _ in range(3)]
+
+        transitions.transition_gigs([gig.pk for gig in gigs[:2]], "publish")
+
+        self.assertEqual(
+            facets.label_counts("published"), [{"label": "wedding", "count": 2}]
+        )
+        self.assertEqual(
+            facets.label_counts("draft"), [{"label": "wedding", "count": 1}]
+        )
+
+    def test_many_gigs_are_moved_in_batches(self):
+        gigs = [GigFactory(status="draft", event_label=[]) for _ in range(5)]
+
+        with mock.patch.object(transitions, "BATCH_SIZE", 2):
+            moved = transitions.transition_gigs([gig.pk for gig in gigs], "publish")
+
+        self.assertCountEqual(moved, [gig.pk for gig in gigs])
+
+
+class TransitionGigTests(TestCase):
+    def test_instance_is_updated_when_the_gig_moves(self):
+        gig = GigFactory(status="draft")
+        self.assertTrue(transitions.transition_gig(gig, "publish"))
+        self.assertEqual(gig.status, "published")
+        self.assertEqual(Gig.objects.get(pk=gig.pk).updated_at, gig.updated_at)
+
+    def test_stale_instance_loses(self):
+        gig = GigFactory(status="draft")
+        Gig.objects.filter(pk=gig.pk).update(status="cancelled")
+
+        self.assertFalse(transitions.transition_gig(gig, "publish"))
+        self.assertEqual(gig.status, "draft")
+
+    def test_publish_only_writes_the_status(self):
+        gig = GigFactory(status="draft")
+        Gig.objects.filter(pk=gig.pk).update(title="Changed elsewhere")
+
+        gig.publish()
+
+        saved = Gig.objects.get(pk=gig.pk)
+        self.assertEqual(saved.status, "published")
+        self.assertEqual(saved.title, "Changed elsewhere")
@@ -3,7 +3,24 @@ import uuid
 from django.test import SimpleTestCase
 from django.urls import reverse, resolve
 
-from gigs.views import GigCreateView, GigUpdateView, PublishGig, GigClientReviewView
+from gigs.views import (
+    GigCreateView,
+    GigBulkCreateView,
+    GigUpdateView,
+    PublishGig,
+    GigClientReviewView,
+    GigFeedView,
+    GigDashboardView,
+    GigSearchView,
+    GigFacetView,
+    GigNearbyView,
+    GigRecommendationView,
+    ScheduleConflictView,
+    GigApplyView,
+    GigApplicationListView,
+    AgentApplicationListView,
+    AcceptApplicationView,
+)
 
 
 class GigUrlsTests(SimpleTestCase):
@@ -13,6 +30,12 @@ class GigUrlsTests(SimpleTestCase):
         resolver = resolve(url)
         self.assertEqual(resolver.func.view_class, GigCreateView)
 
+    def test_gig_bulk_create_url(self):
+        url = reverse("gig-bulk-create")
+        self.assertEqual(url, "/api/gigs/new/bulk/")
+        resolver = resolve(url)
+        self.assertEqual(resolver.func.view_class, GigBulkCreateView)
+
     def test_gig_client_review_url(self):
         gig_id = uuid.uuid4()
         url = reverse("gig-client-review", kwargs={"pk": gig_id})
@@ -33,3 +56,77 @@ class GigUrlsTests(SimpleTestCase):
         self.assertEqual(url, f"/api/gigs/{gig_id}/publish/")
         resolver = resolve(url)
         self.assertEqual(resolver.func.view_class, PublishGig)
+
+    def test_gig_feed_url(self):
+        url = reverse("gig-feed")
+        self.assertEqual(url, "/api/gigs/")
+        resolver = resolve(url)
+        self.assertEqual(resolver.func.view_class, GigFeedView)
+
+    def test_gig_search_url(self):
+        url = reverse("gig-search")
+        self.assertEqual(url, "/api/gigs/search/")
+        resolver = resolve(url)
+        self.assertEqual(resolver.func.view_class, GigSearchView)
+
+    def test_gig_facets_url(self):
+        url = reverse("gig-facets")
+        self.assertEqual(url, "/api/gigs/facets/")
+        resolver = resolve(url)
+        self.assertEqual(resolver.func.view_class, GigFacetView)
+
+    def test_gig_nearby_url(self):
+        url = reverse("gig-nearby")
+        self.assertEqual(url, "/api/gigs/nearby/")
+        resolver = resolve(url)
+        self.assertEqual(resolver.func.view_class, GigNearbyView)
+
+    def test_gig_dashboard_url(self):
+        url = reverse("gig-dashboard")
+        self.assertEqual(url, "/api/gigs/mine/")
+        resolver = resolve(url)
+        self.assertEqual(resolver.func.view_class, GigDashboardView)
+
+    def test_gig_recommendations_url(self):
+        url = reverse("gig-recommendations")
+        self.assertEqual(url, "/api/gigs/recommended/")
+        resolver = resolve(url)
+        self.assertEqual(resolver.func.view_class, GigRecommendationView)
+
+    def test_gig_schedule_conflicts_url(self):
+        url = reverse("gig-schedule-conflicts")
+        self.assertEqual(url, "/api/gigs/schedule/conflicts/")
+        resolver = resolve(url)
+        self.assertEqual(resolver.func.view_class, ScheduleConflictView)
+
+    def test_gig_apply_url(self):
+        gig_id = uuid.uuid4()
+        url = reverse("gig-apply", kwargs={"pk": gig_id})
+        self.assertEqual(url, f"/api/gigs/{gig_id}/apply/")
+        resolver = resolve(url)
+        self.assertEqual(resolver.func.view_class, GigApplyView)
+
+    def test_gig_applications_url(self):
+        gig_id = uuid.uuid4()
+        url = reverse("gig-applications", kwargs={"pk": gig_id})
+        self.assertEqual(url, f"/api/gigs/{gig_id}/applications/")
+        resolver = resolve(url)
+        self.assertEqual(resolver.func.view_class, GigApplicationListView)
+
+    def test_agent_applications_url(self):
+        url = reverse("agent-applications")
+        self.assertEqual(url, "/api/gigs/applications/mine/")
+        resolver = resolve(url)
+        self.assertEqual(resolver.func.view_class, AgentApplicationListView)
+
+    def test_gig_application_accept_url(self):
+        gig_id, application_id = uuid.uuid4(), uuid.uuid4()
+        url = reverse(
+            "gig-application-accept",
+            kwargs={"pk": gig_id, "application_pk": application_id},
+        )
+        self.assertEqual(
+            url, f"/api/gigs/{gig_id}/applications/{application_id}/accept/"
+        )
+        resolver = resolve(url)
+        self.assertEqual(resolver.func.view_class, AcceptApplicationView)
@@ -1,14 +1,21 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from gigs.tests.factories import GigFactory
+from gigs.tests.factories import GigFactory, VenueFactory
+from gigs import applications
 from gigs.models import Gig
 from gigs.serializers import GigSerializer
 from users.tests.factories import UserFactory
 
 
+def user_queries(queries):
+    return [query["sql"] for query in queries if '"users"' in query["sql"]]
+
+
 class GigCreateViewTests(APITestCase):
     def setUp(self):
         self.url = reverse("gig-create")
@@ -43,6 +50,14 @@ class GigCreateViewTests(APITestCase):
         response = self.client.post(self.url, self.valid_gig_data)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
+    def test_create_gig_runs_no_user_queries(self):
+        self.client.force_authenticate(user=self.client_user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, self.valid_gig_data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(user_queries(queries), [])
+
     def test_only_client_users_can_create_gigs(self):
         self.client.force_authenticate(user=self.agent_user)
         response = self.client.post(self.url, self.valid_gig_data)
@@ -65,6 +80,72 @@ class GigCreateViewTests(APITestCase):
         )
 
 
+class GigBulkCreateViewTests(APITestCase):
+    def setUp(self):
+        self.url = reverse("gig-bulk-create")
+        self.client_user = UserFactory(default_role="client")
+        self.client.force_authenticate(user=self.client_user)
+
+        start = timezone.now() + timezone.timedelta(days=1)
+        self.valid_gig_data = {
+            "title": "Test Gig",
+            "description": "This is a detailed description with sufficient length for validation.",
+            "event_label": ["conference", "workshop"],
+            "location_type": "virtual",
+            "start_datetime": start.isoformat(),
+            "end_datetime": (start + timezone.timedelta(hours=2)).isoformat(),
+            "compensation": "150.00",
+            "status": "draft",
+        }
+
+    def test_bulk_create_gigs_success(self):
+        response = self.client.post(
+            self.url,
+            [self.valid_gig_data, {**self.valid_gig_data, "title": "Second Gig"}],
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [gig["title"] for gig in response.data], ["Test Gig", "Second Gig"]
+        )
+        self.assertEqual(
+            sorted(response.data[0]["event_label"]), ["conference", "workshop"]
+        )
+        self.assertEqual(Gig.objects.filter(client=self.client_user).count(), 2)
+
+    def test_errors_are_reported_per_gig_and_nothing_is_created(self):
+        response = self.client.post(
+            self.url,
+            [
+                self.valid_gig_data,
+                {**self.valid_gig_data, "description": "Less than fifty chars"},
+            ],
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertEqual(
+            response.data[1]["description"][0], "Must be at least 50 characters long"
+        )
+        self.assertFalse(Gig.objects.exists())
+
+    def test_gig_count_is_limited(self):
+        response = self.client.post(self.url, [], format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(
+            self.url, [self.valid_gig_data] * 101, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_only_client_users_can_create_gigs(self):
+        self.client.force_authenticate(user=UserFactory(default_role="agent"))
+        response = self.client.post(self.url, [self.valid_gig_data], format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
 class GigClientReviewViewTests(APITestCase):
     @classmethod
     def setUpTestData(cls):
@@ -133,6 +214,54 @@ class GigUpdateViewTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["title"], "Updated Gig Title")
 
+    def test_put_update_runs_no_user_queries(self):
+        updated_gig = {
+            **self.gig_data,
+            "title": "Updated Gig Title",
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(self.url, updated_gig)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(user_queries(queries), [])
+
+    def test_put_update_cannot_double_book_the_agent(self):
+        agent = UserFactory(default_role="agent")
+        start = timezone.now() + timezone.timedelta(days=10)
+        GigFactory(
+            status="agent_confirmed",
+            agent=agent,
+            start_datetime=start,
+            end_datetime=start + timezone.timedelta(hours=2),
+        )
+        gig = GigFactory(
+            status="published",
+            location_type="virtual",
+            venue=None,
+            client=self.client_user,
+            agent=agent,
+            start_datetime=start + timezone.timedelta(days=1),
+            end_datetime=start + timezone.timedelta(days=1, hours=2),
+        )
+
+        # moved onto the agent's other booking
+        response = self.client.put(
+            reverse("gig-update", kwargs={"pk": gig.id}),
+            {
+                **GigSerializer(gig).data,
+                "start_datetime": (start + timezone.timedelta(hours=1)).isoformat(),
+                "end_datetime": (start + timezone.timedelta(hours=3)).isoformat(),
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["agent"][0],
+            "Agent is already booked on another gig during this time.",
+        )
+        gig.refresh_from_db()
+        self.assertEqual(gig.start_datetime, start + timezone.timedelta(days=1))
+
     def test_patch_update_not_allowed(self):
         response = self.client.patch(
             self.url,
@@ -263,6 +392,12 @@ class PublishGigViewTests(APITestCase):
         self.gig.refresh_from_db()
         self.assertEqual(self.gig.status, "published")
 
+    def test_publish_with_post(self):
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.gig.refresh_from_db()
+        self.assertEqual(self.gig.status, "published")
+
     def test_only_draft_gigs_can_be_published(self):
         # publish gig
         self.gig.publish()
@@ -307,3 +442,567 @@ class PublishGigViewTests(APITestCase):
             response.data["detail"],
             "You do not have permission to perform this action on this gig",
         )
+
+
+class GigFeedViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory(default_role="agent")
+        start = timezone.now() + timezone.timedelta(days=1)
+
+        cls.published = [
+            GigFactory(
+                status="published",
+                location_type="virtual",
+                start_datetime=start + timezone.timedelta(hours=i),
+            )
+            for i in range(5)
+        ]
+        cls.draft = GigFactory(status="draft", start_datetime=start)
+
+    def setUp(self):
+        self.url = reverse("gig-feed")
+        self.client.force_authenticate(user=self.user)
+
+    def test_only_published_gigs_are_listed_in_start_order(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [gig["id"] for gig in response.data["results"]],
+            [str(gig.id) for gig in self.published],
+        )
+        self.assertIsNone(response.data["next"])
+
+    def test_cursor_pagination_walks_through_all_pages(self):
+        ids = []
+        url = f"{self.url}?page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            ids.extend(gig["id"] for gig in response.data["results"])
+            url = response.data["next"]
+
+        self.assertEqual(ids, [str(gig.id) for gig in self.published])
+
+    def test_gigs_with_same_start_datetime_are_not_skipped(self):
+        start = self.published[0].start_datetime
+        tied = [
+            GigFactory(
+                status="published", location_type="virtual", start_datetime=start
+            )
+            for _ in range(3)
+        ]
+
+        ids = []
+        url = f"{self.url}?page_size=1"
+        while url:
+            response = self.client.get(url)
+            ids.extend(gig["id"] for gig in response.data["results"])
+            url = response.data["next"]
+
+        expected = sorted([self.published[0], *tied], key=lambda gig: str(gig.id))
+        self.assertEqual(ids[:4], [str(gig.id) for gig in expected])
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(len(ids), 8)
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(f"{self.url}?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_filter_by_location_type_and_country(self):
+        venue = VenueFactory(location__country="Kenya")
+        physical_gig = GigFactory(
+            status="published", location_type="physical", venue=venue
+        )
+        GigFactory(status="published", location_type="physical")
+
+        response = self.client.get(f"{self.url}?location_type=physical&country=Kenya")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [gig["id"] for gig in response.data["results"]], [str(physical_gig.id)]
+        )
+        self.assertEqual(
+            response.data["results"][0]["venue"]["location"]["country"], "Kenya"
+        )
+
+    def test_invalid_filter_returns_400(self):
+        response = self.client.get(f"{self.url}?location_type=underwater")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("location_type", response.data)
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        for _ in range(5):
+            GigFactory(status="published", location_type="physical")
+
+        # one query for the page and one to prefetch the event labels
+        with self.assertNumQueries(2):
+            response = self.client.get(f"{self.url}?page_size=10")
+        self.assertEqual(len(response.data["results"]), 10)
+
+    def test_authentication_required(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class GigDashboardViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.client_user = UserFactory(default_role="client")
+        start = timezone.now() + timezone.timedelta(days=1)
+        cls.gigs = [
+            GigFactory(
+                client=cls.client_user,
+                status=gig_status,
+                location_type="physical",
+                start_datetime=start + timezone.timedelta(hours=i),
+                end_datetime=start + timezone.timedelta(hours=i + 1),
+            )
+            for i, gig_status in enumerate(
+                ["draft", "published", "published", "agent_confirmed", "cancelled"]
+            )
+        ]
+        # another client's gig
+        GigFactory(status="published")
+
+    def setUp(self):
+        self.url = reverse("gig-dashboard")
+        self.client.force_authenticate(user=self.client_user)
+
+    def test_client_gigs_are_listed_with_status_counts(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [gig["id"] for gig in response.data["results"]],
+            [str(gig.id) for gig in self.gigs],
+        )
+        self.assertEqual(
+            response.data["status_counts"],
+            {
+                "draft": 1,
+                "published": 2,
+                "agent_confirmed": 1,
+                "completed": 0,
+                "cancelled": 1,
+            },
+        )
+
+    def test_filter_by_status(self):
+        response = self.client.get(self.url, {"status": "published"})
+
+        self.assertEqual(
+            [gig["id"] for gig in response.data["results"]],
+            [str(gig.id) for gig in self.gigs[1:3]],
+        )
+        self.assertEqual(response.data["status_counts"]["draft"], 1)
+
+    def test_invalid_status_returns_400(self):
+        response = self.client.get(self.url, {"status": "unknown"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_query_count_does_not_depend_on_page_size(self):
+        # page, event labels and status counts
+        for page_size in [1, 5]:
+            with self.assertNumQueries(3):
+                response = self.client.get(self.url, {"page_size": page_size})
+            self.assertEqual(len(response.data["results"]), page_size)
+
+    def test_only_client_users_can_access_view(self):
+        self.client.force_authenticate(user=UserFactory(default_role="agent"))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class GigSearchViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory(default_role="agent")
+        cls.gigs = [
+            GigFactory(
+                title=f"Robotics demo {i}",
+                status="published",
+                location_type="virtual",
+            )
+            for i in range(3)
+        ]
+        GigFactory(title="Robotics demo draft", status="draft")
+
+    def setUp(self):
+        self.url = reverse("gig-search")
+        self.client.force_authenticate(user=self.user)
+
+    def test_search_returns_published_matches(self):
+        response = self.client.get(self.url, {"q": "robotics"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertCountEqual(
+            [gig["id"] for gig in response.data["results"]],
+            [str(gig.id) for gig in self.gigs],
+        )
+        self.assertIsNone(response.data["next"])
+
+    def test_search_pages_with_offset(self):
+        ids = []
+        response = self.client.get(self.url, {"q": "robotics", "limit": 2})
+        ids.extend(gig["id"] for gig in response.data["results"])
+        self.assertIsNotNone(response.data["next"])
+
+        response = self.client.get(response.data["next"])
+        ids.extend(gig["id"] for gig in response.data["results"])
+        self.assertIsNone(response.data["next"])
+        self.assertCountEqual(ids, [str(gig.id) for gig in self.gigs])
+
+    def test_search_accepts_feed_filters(self):
+        response = self.client.get(
+            self.url, {"q": "robotics", "location_type": "physical"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [])
+
+    def test_query_is_required(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("q", response.data)
+
+    def test_query_without_words_returns_no_results(self):
+        response = self.client.get(self.url, {"q": "***"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [])
+
+
+class GigFacetViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory(default_role="agent")
+        cls.party = GigFactory(status="published", event_label=["party"])
+        cls.wedding = GigFactory(status="published", event_label=["wedding", "party"])
+        cls.meetup = GigFactory(status="published", event_label=["meetup"])
+        GigFactory(status="draft", event_label=["party"])
+
+    def setUp(self):
+        self.url = reverse("gig-facets")
+        self.client.force_authenticate(user=self.user)
+
+    def test_gigs_and_label_counts_are_returned_together(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertEqual(
+            response.data["facets"],
+            [
+                {"label": "party", "count": 2},
+                {"label": "meetup", "count": 1},
+                {"label": "wedding", "count": 1},
+            ],
+        )
+
+    def test_filter_by_labels(self):
+        response = self.client.get(self.url, {"labels": "Wedding,meetup"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertCountEqual(
+            [gig["id"] for gig in response.data["results"]],
+            [str(self.wedding.id), str(self.meetup.id)],
+        )
+
+    def test_label_counts_follow_the_filters(self):
+        response = self.client.get(self.url, {"labels": "Wedding,meetup"})
+
+        # the matching gigs across all pages, not every published gig
+        self.assertEqual(
+            response.data["facets"],
+            [
+                {"label": "meetup", "count": 1},
+                {"label": "party", "count": 1},
+                {"label": "wedding", "count": 1},
+            ],
+        )
+
+        response = self.client.get(self.url, {"labels": "party", "page_size": 1})
+
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(
+            response.data["facets"],
+            [{"label": "party", "count": 2}, {"label": "wedding", "count": 1}],
+        )
+
+
+class GigNearbyViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory(default_role="agent")
+        cls.near = GigFactory(
+            status="published",
+            location_type="physical",
+            venue=VenueFactory(latitude=-1.2921, longitude=36.8319),
+        )
+        GigFactory(
+            status="draft",
+            location_type="physical",
+            venue=VenueFactory(latitude=-1.2921, longitude=36.8319),
+        )
+        GigFactory(
+            status="published",
+            location_type="physical",
+            venue=VenueFactory(latitude=-4.0435, longitude=39.6682),
+        )
+
+    def setUp(self):
+        self.url = reverse("gig-nearby")
+        self.client.force_authenticate(user=self.user)
+
+    def test_published_gigs_within_radius_are_listed_with_distance(self):
+        response = self.client.get(
+            self.url, {"latitude": -1.2921, "longitude": 36.8219, "radius_km": 10}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [gig["id"] for gig in response.data["results"]], [str(self.near.id)]
+        )
+        self.assertAlmostEqual(
+            response.data["results"][0]["distance_km"], 1.11, delta=0.01
+        )
+
+    def test_coordinates_are_required(self):
+        response = self.client.get(self.url, {"latitude": -1.2921})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("longitude", response.data)
+
+
+class GigRecommendationViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.agent = UserFactory(default_role="agent")
+        cls.agent.preferred_labels.set(["wedding"])
+        cls.wedding = GigFactory(
+            status="published", location_type="virtual", event_label=["wedding"]
+        )
+        cls.meetup = GigFactory(
+            status="published", location_type="virtual", event_label=["meetup"]
+        )
+
+    def setUp(self):
+        self.url = reverse("gig-recommendations")
+        self.client.force_authenticate(user=self.agent)
+
+    def test_gigs_are_ranked_for_agent(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [gig["id"] for gig in response.data["results"]],
+            [str(self.wedding.id), str(self.meetup.id)],
+        )
+        self.assertGreater(
+            response.data["results"][0]["score"], response.data["results"][1]["score"]
+        )
+
+    def test_only_agents_can_get_recommendations(self):
+        self.client.force_authenticate(user=UserFactory(default_role="client"))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(
+            response.data["detail"], "You must be an agent to perform this action."
+        )
+
+
+class ScheduleConflictViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.agent = UserFactory(default_role="agent")
+        start = timezone.now() + timezone.timedelta(days=2)
+        cls.first = GigFactory(
+            status="agent_confirmed",
+            agent=cls.agent,
+            start_datetime=start,
+            end_datetime=start + timezone.timedelta(hours=3),
+        )
+        cls.second = GigFactory(
+            status="agent_confirmed",
+            agent=cls.agent,
+            start_datetime=start + timezone.timedelta(hours=2),
+            end_datetime=start + timezone.timedelta(hours=5),
+        )
+        # back to back with the second gig, not a conflict
+        GigFactory(
+            status="agent_confirmed",
+            agent=cls.agent,
+            start_datetime=start + timezone.timedelta(hours=5),
+            end_datetime=start + timezone.timedelta(hours=6),
+        )
+
+    def setUp(self):
+        self.url = reverse("gig-schedule-conflicts")
+        self.client.force_authenticate(user=self.agent)
+
+    def test_overlapping_gigs_are_listed(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
+
+        conflict = response.data["results"][0]
+        self.assertEqual(conflict["first"]["id"], str(self.first.id))
+        self.assertEqual(conflict["second"]["id"], str(self.second.id))
+        self.assertEqual(
+            conflict["overlap_start"],
+            self.second.start_datetime.isoformat().replace("+00:00", "Z"),
+        )
+        self.assertEqual(
+            conflict["overlap_end"],
+            self.first.end_datetime.isoformat().replace("+00:00", "Z"),
+        )
+
+    def test_only_agents_can_list_conflicts(self):
+        self.client.force_authenticate(user=UserFactory(default_role="client"))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class GigApplyViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.agent = UserFactory(default_role="agent")
+        cls.gig = GigFactory(status="published")
+
+    def setUp(self):
+        self.url = reverse("gig-apply", kwargs={"pk": self.gig.id})
+        self.client.force_authenticate(user=self.agent)
+
+    def test_apply_success(self):
+        response = self.client.post(self.url, {"message": "Pick me"})
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["status"], "pending")
+        self.assertEqual(response.data["agent"], self.agent.id)
+        self.gig.refresh_from_db()
+        self.assertEqual(self.gig.application_count, 1)
+
+    def test_applying_twice_returns_400(self):
+        self.client.post(self.url)
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["gig"], ["You have already applied to this gig."]
+        )
+
+    def test_withdraw(self):
+        self.client.post(self.url)
+
+        response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_only_agents_can_apply(self):
+        self.client.force_authenticate(user=UserFactory(default_role="client"))
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class GigApplicationListViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.client_user = UserFactory(default_role="client")
+        cls.gig = GigFactory(status="published", client=cls.client_user)
+        cls.applications = [
+            applications.apply(cls.gig, UserFactory(default_role="agent"))
+            for _ in range(3)
+        ]
+
+    def setUp(self):
+        self.url = reverse("gig-applications", kwargs={"pk": self.gig.id})
+        self.client.force_authenticate(user=self.client_user)
+
+    def test_applications_are_paginated_oldest_first(self):
+        response = self.client.get(self.url, {"page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = [application["id"] for application in response.data["results"]]
+
+        response = self.client.get(response.data["next"])
+        ids += [application["id"] for application in response.data["results"]]
+
+        self.assertEqual(
+            ids, [str(application.id) for application in self.applications]
+        )
+        self.assertIsNone(response.data["next"])
+
+    def test_client_must_be_gig_owner(self):
+        self.client.force_authenticate(user=UserFactory(default_role="client"))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class AgentApplicationListViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.agent = UserFactory(default_role="agent")
+        cls.gigs = [GigFactory(status="published") for _ in range(2)]
+        for gig in cls.gigs:
+            applications.apply(gig, cls.agent)
+        # another agent's application
+        applications.apply(cls.gigs[0], UserFactory(default_role="agent"))
+
+    def setUp(self):
+        self.url = reverse("agent-applications")
+        self.client.force_authenticate(user=self.agent)
+
+    def test_agent_applications_are_listed(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [application["gig_title"] for application in response.data["results"]],
+            [gig.title for gig in self.gigs],
+        )
+
+    def test_only_agents_can_list_applications(self):
+        self.client.force_authenticate(user=UserFactory(default_role="client"))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class AcceptApplicationViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.client_user = UserFactory(default_role="client")
+        cls.agent = UserFactory(default_role="agent")
+
+    def setUp(self):
+        self.gig = GigFactory(status="published", client=self.client_user)
+        self.application = applications.apply(self.gig, self.agent)
+        self.url = reverse(
+            "gig-application-accept",
+            kwargs={"pk": self.gig.id, "application_pk": self.application.id},
+        )
+        self.client.force_authenticate(user=self.client_user)
+
+    def test_accept_success(self):
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.gig.refresh_from_db()
+        self.assertEqual(self.gig.status, "agent_confirmed")
+        self.assertEqual(self.gig.agent, self.agent)
+
+    def test_second_confirmation_fails(self):
+        self.client.post(self.url)
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["gig"], ["This gig already has a confirmed agent."]
+        )
+
+    def test_application_must_belong_to_the_gig(self):
+        other_gig = GigFactory(status="published", client=self.client_user)
+        url = reverse(
+            "gig-application-accept",
+            kwargs={"pk": other_gig.id, "application_pk": self.application.id},
+        )
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_client_must_be_gig_owner(self):
+        self.client.force_authenticate(user=UserFactory(default_role="client"))
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
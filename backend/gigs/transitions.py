@@ -0,0 +1,127 @@
+"""
+Atomic gig status transitions.
+
+A transition moves gigs from one of its source statuses to its target status with
+a single conditional `UPDATE ... WHERE status = <source> RETURNING id`. The
+database decides which gigs moved, so two concurrent requests can never both
+win the same transition, and only the changed columns are written.
+
+Gig lifecycle:
+
+    draft -> published -> agent_confirmed -> completed
+      \\          \\              \\
+       +----------+--------------+--> cancelled
+"""
+
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from gigs import facets
+from gigs.models import Gig
+
+# name -> (source statuses, target status)
+TRANSITIONS = {
+    "publish": (("draft",), "published"),
+    "confirm_agent": (("published",), "agent_confirmed"),
+    "complete": (("agent_confirmed",), "completed"),
+    "cancel": (("draft", "published", "agent_confirmed"), "cancelled"),
+}
+
+# keeps the number of query parameters well below SQLite's limit
+BATCH_SIZE = 500
+
+
+def _update_returning(using, gig_ids, source, assignments, conditions):
+    """
+    Set `assignments` on the given gigs that are in the `source` status and meet
+    `conditions`. Returns the ids of the gigs that were updated.
+    """
+    connection = connections[using]
+    quote_name = connection.ops.quote_name
+
+    def column(field_name):
+        return Gig._meta.get_field(field_name)
+
+    set_sql = ", ".join(
+        f"{quote_name(column(name).column)} = %s" for name in assignments
+    )
+    set_params = [
+        column(name).get_db_prep_save(value, connection)
+        for name, value in assignments.items()
+    ]
+
+    where_sql = [f"{quote_name(column('status').column)} = %s"]
+    where_params = [source]
+    for name, value in conditions.items():
+        if value is None:
+            where_sql.append(f"{quote_name(column(name).column)} IS NULL")
+        else:
+            where_sql.append(f"{quote_name(column(name).column)} = %s")
+            where_params.append(column(name).get_db_prep_value(value, connection))
+
+    pk_field = Gig._meta.pk
+    pk_column = quote_name(pk_field.column)
+    updated = []
+    with connection.cursor() as cursor:
+        for start in range(0, len(gig_ids), BATCH_SIZE):
+            batch = gig_ids[start : start + BATCH_SIZE]
+            cursor.execute(
+                f"UPDATE {quote_name(Gig._meta.db_table)} SET {set_sql} "
+                f"WHERE {' AND '.join(where_sql)} "
+                f"AND {pk_column} IN ({', '.join(['%s'] * len(batch))}) "
+                f"RETURNING {pk_column}",
+                [
+                    *set_params,
+                    *where_params,
+                    *(pk_field.get_db_prep_value(pk, connection) for pk in batch),
+                ],
+            )
+            updated += [pk_field.to_python(pk) for (pk,) in cursor.fetchall()]
+    return updated
+
+
+def transition_gigs(gig_ids, transition, values=None, conditions=None, sources=None):
+    """
+    Apply a transition to many gigs at once.
+
+    `values` are other fields to set on the moved gigs and `conditions` other
+    fields that must have the given value for a gig to move (None for NULL), both
+    keyed by field attname, e.g. `agent_id`. `sources` narrows the transition down
+    to some of its source statuses.
+    Gigs not in a source status of the transition, or not meeting the conditions,
+    are left untouched. Returns the ids of the gigs that moved.
+    """
+    all_sources, target = TRANSITIONS[transition]
+    sources = [source for source in all_sources if sources is None or source in sources]
+    gig_ids = list(gig_ids)
+    if not gig_ids:
+        return []
+
+    assignments = {"status": target, "updated_at": timezone.now(), **(values or {})}
+    using = router.db_for_write(Gig)
+    moved = []
+    with transaction.atomic(using=using):
+        for source in sources:
+            moved_from_source = _update_returning(
+                using, gig_ids, source, assignments, conditions or {}
+            )
+            # bulk updates send no signals, move the label counts here
+            facets.move_gigs(moved_from_source, source, target)
+            moved += moved_from_source
+    return moved
+
+
+def transition_gig(gig, transition, values=None, conditions=None):
+    """
+    Apply a transition to a single gig. Returns True if the gig moved, in which
+    case the instance is updated with the written values.
+    """
+    _, target = TRANSITIONS[transition]
+    values = {"updated_at": timezone.now(), **(values or {})}
+    if not transition_gigs([gig.pk], transition, values, conditions):
+        return False
+
+    for field_name, value in {"status": target, **values}.items():
+        setattr(gig, field_name, value)
+    gig._loaded_status = gig.status
+    return True
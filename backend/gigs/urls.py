@@ -1,10 +1,74 @@
 from django.urls import path
 
-from gigs.views import GigCreateView, GigClientReviewView, GigUpdateView, PublishGig
+from gigs.asyncviews import (
+    AsyncGigClientReviewView,
+    AsyncGigCreateView,
+    AsyncGigUpdateView,
+    AsyncPublishGig,
+)
+from gigs.views import (
+    GigCreateView,
+    GigBulkCreateView,
+    GigClientReviewView,
+    GigUpdateView,
+    PublishGig,
+    GigFeedView,
+    GigDashboardView,
+    GigSearchView,
+    GigFacetView,
+    GigNearbyView,
+    GigRecommendationView,
+    ScheduleConflictView,
+    GigApplyView,
+    GigApplicationListView,
+    AgentApplicationListView,
+    AcceptApplicationView,
+)
 
 urlpatterns = [
+    path("", GigFeedView.as_view(), name="gig-feed"),
+    path(
+        "applications/mine/",
+        AgentApplicationListView.as_view(),
+        name="agent-applications",
+    ),
+    path("facets/", GigFacetView.as_view(), name="gig-facets"),
+    path("mine/", GigDashboardView.as_view(), name="gig-dashboard"),
+    path("nearby/", GigNearbyView.as_view(), name="gig-nearby"),
+    path("recommended/", GigRecommendationView.as_view(), name="gig-recommendations"),
+    path("search/", GigSearchView.as_view(), name="gig-search"),
+    path(
+        "schedule/conflicts/",
+        ScheduleConflictView.as_view(),
+        name="gig-schedule-conflicts",
+    ),
     path("new/", GigCreateView.as_view(), name="gig-create"),
+    path("new/bulk/", GigBulkCreateView.as_view(), name="gig-bulk-create"),
     path("<uuid:pk>/review/", GigClientReviewView.as_view(), name="gig-client-review"),
     path("<uuid:pk>/edit/", GigUpdateView.as_view(), name="gig-update"),
     path("<uuid:pk>/publish/", PublishGig.as_view(), name="gig-publish"),
+    # async variants, for the ASGI application
+    path("async/new/", AsyncGigCreateView.as_view(), name="async-gig-create"),
+    path(
+        "async/<uuid:pk>/review/",
+        AsyncGigClientReviewView.as_view(),
+        name="async-gig-client-review",
+    ),
+    path(
+        "async/<uuid:pk>/edit/", AsyncGigUpdateView.as_view(), name="async-gig-update"
+    ),
+    path(
+        "async/<uuid:pk>/publish/", AsyncPublishGig.as_view(), name="async-gig-publish"
+    ),
+    path("<uuid:pk>/apply/", GigApplyView.as_view(), name="gig-apply"),
+    path(
+        "<uuid:pk>/applications/",
+        GigApplicationListView.as_view(),
+        name="gig-applications",
+    ),
+    path(
+        "<uuid:pk>/applications/<uuid:application_pk>/accept/",
+        AcceptApplicationView.as_view(),
+        name="gig-application-accept",
+    ),
 ]
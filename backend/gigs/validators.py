@@ -1,23 +1,36 @@
 from django.core.exceptions import ValidationError
 from django.utils import timezone
+from users.identity import get_loaded_user
 from users.models import CustomUser
 
 
 def validate_client(value):
     """
     Custom validator to ensure the user is a client.
-    """
-    client = CustomUser.objects.get(pk=value)
-    if not client.is_client:
+    Uses the user if the request already loaded it, otherwise checks the flag in
+    the database rather than loading the whole user.
+    """
+    client = get_loaded_user(value)
+    if client is not None:
+        is_client = client.is_client
+    else:
+        is_client = CustomUser.objects.filter(pk=value, is_client=True).exists()
+    if not is_client:
         raise ValidationError("Client must be an actual client in app.")
 
 
 def validate_agent(value):
     """
     Custom validator to ensure the user is an agent.
-    """
-    agent = CustomUser.objects.get(pk=value)
-    if not agent.is_agent:
+    Uses the user if the request already loaded it, otherwise checks the flag in
+    the database rather than loading the whole user.
+    """
+    agent = get_loaded_user(value)
+    if agent is not None:
+        is_agent = agent.is_agent
+    else:
+        is_agent = CustomUser.objects.filter(pk=value, is_agent=True).exists()
+    if not is_agent:
         raise ValidationError("Agent must be an actual agent in app.")
 
 
@@ -1,15 +1,53 @@
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Count, Q
+from django.utils import timezone
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import generics
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.utils.urls import replace_query_param
 
-from gigs.models import Gig
-from gigs.serializers import GigSerializer
+from gigs import (
+    applications,
+    facets,
+    geo,
+    recommendations,
+    representations,
+    search,
+)
+from gigs.scheduling import AgentSchedule
+from gigs.filters import filter_gigs, has_filters
+from gigs.models import Gig, GigApplication
+from gigs.pagination import ApplicationPagination, KeysetPagination
+from gigs.serializers import (
+    GigSerializer,
+    GigApplicationSerializer,
+    GigDashboardSerializer,
+    GigSearchSerializer,
+    GigNearbySerializer,
+    GigRecommendationSerializer,
+    ScheduleConflictSerializer,
+)
 from gigs.permissions import IsGigOwner, IsEditableGigStatus
-from core.permissions import IsClient
+from core import replicas
+from core.mixins import ConditionalGetMixin, ListConditionalGetMixin
+from core.permissions import IsAgent, IsClient
+
+
+class CompiledGigListMixin:
+    """
+    List gigs through the compiled read representation instead of GigSerializer,
+    which produces the same output for a fraction of the CPU time, by providing
+    the page hooks of ListConditionalGetMixin. See gigs/representations.py.
+    """
+
+    def get_page_queryset(self):
+        return representations.values(self.filter_queryset(self.get_queryset()))
+
+    def represent_page(self, page, queryset):
+        return representations.represent_rows(page, using=queryset.db)
 
 
 class GigCreateView(generics.CreateAPIView):
@@ -29,17 +67,52 @@ class GigCreateView(generics.CreateAPIView):
         serializer.save(client=self.request.user)
 
 
-class GigClientReviewView(generics.RetrieveAPIView):
+class GigBulkCreateView(generics.CreateAPIView):
+    """
+    Create many gigs at once, up to MAX_GIGS per request.
+
+    Only clients can create gigs. Either every gig is created or none is, errors
+    are reported per gig in the same order as the request body.
+    """
+
+    MAX_GIGS = 100
+
+    serializer_class = GigSerializer
+    permission_classes = [IsAuthenticated, IsClient]
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.update(many=True, allow_empty=False, max_length=self.MAX_GIGS)
+        return super().get_serializer(*args, **kwargs)
+
+    def perform_create(self, serializer):
+        serializer.save(client=self.request.user)
+
+
+class GigClientReviewView(ConditionalGetMixin, generics.RetrieveAPIView):
     """
     Retrieve a gig for client review.
     Used for general review with possible updates on the gig.
     Clients can only access their own gigs.
+
+    Supports conditional requests, unchanged gigs are answered with 304 Not Modified.
     """
 
     queryset = Gig.objects.all()
     serializer_class = GigSerializer
     permission_classes = [IsAuthenticated, IsClient, IsGigOwner]
 
+    def get_object(self):
+        # looked up once for both the validators and the response
+        if not hasattr(self, "_gig"):
+            self._gig = super().get_object()
+        return self._gig
+
+    def get_validators(self):
+        gig = self.get_object()
+        return representations.gig_version(
+            gig.updated_at, gig.event_label.values_list("name", flat=True)
+        )
+
 
 class GigUpdateView(generics.UpdateAPIView):
     """
@@ -60,6 +133,7 @@ class PublishGig(APIView):
     """
     Move gig from draft to published.
     Only draft gigs can be published.
+    POST is preferred, GET is kept for existing clients.
     """
 
     permission_classes = [IsAuthenticated, IsClient, IsGigOwner]
@@ -70,6 +144,15 @@ class PublishGig(APIView):
         return obj
 
     def get(self, request, pk, format=None):
+        # a safe method that writes: read from the primary and pin the user, as
+        # ReplicaPinMiddleware does for unsafe requests
+        with replicas.read_from(None):
+            response = self.post(request, pk, format)
+        if response.status_code < 400:
+            replicas.pin_user(request.user.pk)
+        return response
+
+    def post(self, request, pk, format=None):
         gig = self.get_object()
 
         try:
@@ -78,3 +161,312 @@ class PublishGig(APIView):
             return Response(e.message_dict, status=status.HTTP_400_BAD_REQUEST)
 
         return Response({"detail": "Gig published successfully"})
+
+
+class GigFeedView(CompiledGigListMixin, ListConditionalGetMixin, generics.ListAPIView):
+    """
+    List published gigs ordered by start datetime.
+
+    Results are cursor paginated, follow the `next` link to get the following page.
+    Can be filtered by location type, venue country and start datetime bounds.
+    """
+
+    serializer_class = GigSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        queryset = (
+            Gig.objects.filter(status="published")
+            .select_related("venue__location")
+            .prefetch_related("event_label")
+        )
+        return filter_gigs(queryset, self.request.query_params)
+
+
+class GigFacetView(GigFeedView):
+    """
+    List published gigs along with the number of matching gigs per event label.
+
+    Accepts the same filters and pagination as the gig feed, use the `labels`
+    filter to narrow the gigs down to the selected facets. Facets count the gigs
+    matching the filters across all pages, from the materialized counts when
+    there are no filters.
+    """
+
+    def get_extra_data(self):
+        if has_filters(self.request.query_params):
+            return {"facets": facets.gig_label_counts(self.get_queryset())}
+        return {"facets": facets.label_counts()}
+
+
+class GigDashboardView(
+    CompiledGigListMixin, ListConditionalGetMixin, generics.ListAPIView
+):
+    """
+    List the requesting client's gigs ordered by start datetime, along with the
+    number of their gigs in each status.
+
+    Results are cursor paginated and can be narrowed down to a single status.
+    Status counts always cover all of the client's gigs.
+    """
+
+    serializer_class = GigSerializer
+    permission_classes = [IsAuthenticated, IsClient]
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        params = GigDashboardSerializer(data=self.request.query_params)
+        params.is_valid(raise_exception=True)
+
+        queryset = (
+            Gig.objects.filter(client=self.request.user)
+            .select_related("venue__location")
+            .prefetch_related("event_label")
+        )
+        if "status" in params.validated_data:
+            queryset = queryset.filter(status=params.validated_data["status"])
+        return queryset
+
+    def get_status_counts(self):
+        """
+        Count the client's gigs per status with a single conditional aggregate.
+        """
+        return Gig.objects.filter(client=self.request.user).aggregate(
+            **{
+                status: Count("id", filter=Q(status=status))
+                for status, _ in Gig.STATUS_CHOICES
+            }
+        )
+
+    def get_extra_data(self):
+        return {"status_counts": self.get_status_counts()}
+
+
+class GigSearchView(generics.GenericAPIView):
+    """
+    Full text search over published gigs.
+
+    Matches the words in `q` against gig titles, descriptions and event labels,
+    best matches first. Accepts the same filters as the gig feed.
+    """
+
+    serializer_class = GigSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, format=None):
+        params = GigSearchSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        limit = params.validated_data["limit"]
+        offset = params.validated_data["offset"]
+
+        queryset = filter_gigs(
+            Gig.objects.filter(status="published"), request.query_params
+        )
+        match_expression = search.build_match_expression(params.validated_data["q"])
+        gig_ids = []
+        if match_expression is not None:
+            # fetch one extra id to know whether there is a next page
+            gig_ids = search.search_gig_ids(
+                match_expression, queryset, limit + 1, offset
+            )
+
+        next_link = None
+        if len(gig_ids) > limit:
+            gig_ids = gig_ids[:limit]
+            next_link = replace_query_param(
+                request.build_absolute_uri(), "offset", offset + limit
+            )
+
+        gigs = representations.represent_gigs_by_id(gig_ids)
+        results = [gigs[gig_id] for gig_id in gig_ids if gig_id in gigs]
+        return Response({"next": next_link, "results": results})
+
+
+class GigNearbyView(generics.GenericAPIView):
+    """
+    List published physical gigs within a radius of a point, nearest first.
+
+    Each gig includes its venue's distance from the point in km.
+    Accepts the same filters as the gig feed.
+    """
+
+    serializer_class = GigSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, format=None):
+        params = GigNearbySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        queryset = filter_gigs(
+            Gig.objects.filter(status="published", location_type="physical"),
+            request.query_params,
+        )
+        nearest = geo.nearby_gigs(
+            queryset,
+            params.validated_data["latitude"],
+            params.validated_data["longitude"],
+            params.validated_data["radius_km"],
+        )[: params.validated_data["limit"]]
+
+        gigs = representations.represent_gigs_by_id([gig_id for gig_id, _ in nearest])
+        results = [
+            {**gigs[gig_id], "distance_km": round(distance, 3)}
+            for gig_id, distance in nearest
+        ]
+        return Response({"results": results})
+
+
+class GigRecommendationView(generics.GenericAPIView):
+    """
+    List the published gigs best matching the requesting agent, best first.
+
+    Gigs are scored on closeness to the agent's location, overlap with the agent's
+    preferred labels, compensation and how soon they start.
+    """
+
+    serializer_class = GigSerializer
+    permission_classes = [IsAuthenticated, IsAgent]
+
+    def get(self, request, format=None):
+        params = GigRecommendationSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        matches = recommendations.recommend(
+            request.user, limit=params.validated_data["limit"]
+        )
+
+        gigs = representations.represent_gigs_by_id([gig_id for gig_id, _ in matches])
+        results = [
+            {**gigs[gig_id], "score": round(score, 4)} for gig_id, score in matches
+        ]
+        return Response({"results": results})
+
+
+class ScheduleConflictView(generics.GenericAPIView):
+    """
+    List pairs of upcoming gigs the requesting agent is booked on that overlap,
+    ordered by the start of the earlier gig.
+    """
+
+    serializer_class = ScheduleConflictSerializer
+    permission_classes = [IsAuthenticated, IsAgent]
+
+    def get(self, request, format=None):
+        schedule = AgentSchedule.for_agent(request.user.pk, ending_after=timezone.now())
+        conflicts = schedule.conflicts()
+
+        gigs = (
+            Gig.objects.select_related("venue__location")
+            .prefetch_related("event_label")
+            .in_bulk({gig_id for conflict in conflicts for gig_id in conflict[:2]})
+        )
+        serializer = self.get_serializer(
+            [
+                {
+                    "first": gigs[first_id],
+                    "second": gigs[second_id],
+                    "overlap_start": overlap_start,
+                    "overlap_end": overlap_end,
+                }
+                for first_id, second_id, overlap_start, overlap_end in conflicts
+            ],
+            many=True,
+        )
+        return Response({"results": serializer.data})
+
+
+class GigApplyView(APIView):
+    """
+    Apply to a published gig with POST, withdraw the pending application with DELETE.
+    Only agents can apply to gigs.
+    """
+
+    permission_classes = [IsAuthenticated, IsAgent]
+
+    def get_object(self):
+        return generics.get_object_or_404(Gig, pk=self.kwargs["pk"])
+
+    def post(self, request, pk, format=None):
+        gig = self.get_object()
+        serializer = GigApplicationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            application = applications.apply(
+                gig, request.user, serializer.validated_data.get("message", "")
+            )
+        except DjangoValidationError as e:
+            return Response(e.message_dict, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            GigApplicationSerializer(application).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+    def delete(self, request, pk, format=None):
+        gig = self.get_object()
+        if not applications.withdraw(gig, request.user):
+            return Response(
+                {"detail": "You have no pending application to this gig."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class GigApplicationListView(generics.ListAPIView):
+    """
+    List the applications to a gig, oldest first.
+    Clients can only list the applications to their own gigs.
+    """
+
+    serializer_class = GigApplicationSerializer
+    permission_classes = [IsAuthenticated, IsClient, IsGigOwner]
+    pagination_class = ApplicationPagination
+
+    def get_queryset(self):
+        gig = generics.get_object_or_404(Gig, pk=self.kwargs["pk"])
+        self.check_object_permissions(self.request, gig)
+        return gig.applications.select_related("gig", "agent")
+
+
+class AcceptApplicationView(APIView):
+    """
+    Accept an application, confirming its agent on the gig.
+    The other pending applications to the gig are rejected.
+    Clients can only accept applications to their own gigs.
+    """
+
+    permission_classes = [IsAuthenticated, IsClient, IsGigOwner]
+
+    def get_object(self):
+        application = generics.get_object_or_404(
+            GigApplication.objects.select_related("gig"),
+            pk=self.kwargs["application_pk"],
+            gig_id=self.kwargs["pk"],
+        )
+        self.check_object_permissions(self.request, application.gig)
+        return application
+
+    def post(self, request, pk, application_pk, format=None):
+        application = self.get_object()
+
+        try:
+            applications.accept(application)
+        except DjangoValidationError as e:
+            return Response(e.message_dict, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({"detail": "Agent confirmed successfully"})
+
+
+class AgentApplicationListView(generics.ListAPIView):
+    """
+    List the requesting agent's applications, oldest first.
+    """
+
+    serializer_class = GigApplicationSerializer
+    permission_classes = [IsAuthenticated, IsAgent]
+    pagination_class = ApplicationPagination
+
+    def get_queryset(self):
+        return self.request.user.gig_applications.select_related("gig", "agent")
@@ -0,0 +1,63 @@
+"""
+Request-scoped identity map of users.
+
+Validators, permissions and serializers sometimes need a user by primary key
+while that user is already loaded, usually as `request.user`. `get_loaded_user`
+answers from the request's authenticated user without querying, callers fall
+back to a query of their own, fetching only what they need.
+
+`UserIdentityMapMiddleware` opens a map for each request. Outside a request, e.g.
+in management commands, no user is loaded.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from users.models import CustomUser
+
+_current_map = ContextVar("user_identity_map", default=None)
+
+
+class UserIdentityMap:
+    """
+    The users already loaded for a request: its authenticated user.
+    """
+
+    def __init__(self, request=None):
+        self.request = request
+
+    def authenticated_user(self):
+        # DRF sets the authenticated user on the underlying request as well
+        user = getattr(self.request, "user", None)
+        if user is not None and user.is_authenticated:
+            return user
+        return None
+
+    def get(self, pk):
+        user = self.authenticated_user()
+        if user is not None and user.pk == pk:
+            return user
+        return None
+
+
+@contextmanager
+def identity_map(request=None):
+    """
+    Open an identity map for the duration of the block.
+    """
+    token = _current_map.set(UserIdentityMap(request))
+    try:
+        yield _current_map.get()
+    finally:
+        _current_map.reset(token)
+
+
+def get_loaded_user(pk):
+    """
+    Return the user with the given primary key if the current request already
+    loaded it, without querying, or None.
+    """
+    current_map = _current_map.get()
+    if current_map is None:
+        return None
+    return current_map.get(CustomUser._meta.pk.to_python(pk))
@@ -0,0 +1,31 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from users.identity import identity_map
+
+
+class UserIdentityMapMiddleware:
+    """
+    Open a user identity map for each request, see users/identity.py.
+
+    Runs natively under both WSGI and ASGI, so async views are not pushed into a
+    thread by this middleware. The map is held in a context variable, which is
+    copied into `sync_to_async` calls made by the view.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with identity_map(request):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with identity_map(request):
+            return await self.get_response(request)
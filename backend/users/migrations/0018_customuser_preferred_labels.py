@@ -0,0 +1,30 @@
+# Generated by Django 5.2.12 on 2026-10-18 13:08
+
+import taggit.managers
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gigs", "0019_venue_coordinates"),
+        (
+            "taggit",
+            "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx",
+        ),
+        ("users", "0017_remove_customuser_first_name_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customuser",
+            name="preferred_labels",
+            field=taggit.managers.TaggableManager(
+                blank=True,
+                help_text="A comma-separated list of tags.",
+                through="gigs.UUIDTaggedItem",
+                to="taggit.Tag",
+                verbose_name="Preferred Labels",
+            ),
+        ),
+    ]
@@ -7,6 +7,7 @@ from django.contrib.auth.models import (
     PermissionsMixin,
 )
 from django.db import models
+from taggit.managers import TaggableManager
 
 
 class CustomUserManager(BaseUserManager):
@@ -68,6 +69,13 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
         choices=DEFAULT_ROLE_CHOICES,
     )  # default role when signing in, determined at sign up
 
+    # event labels an agent would like to be matched with
+    preferred_labels = TaggableManager(
+        through="gigs.UUIDTaggedItem",
+        verbose_name="Preferred Labels",
+        blank=True,
+    )
+
     is_staff = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
 
@@ -87,3 +95,14 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
         Return email as string representation of the User.
         """
         return self.email
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        """
+        Load every deferred field in one query when one of them is accessed.
+        Users authenticated from their token only have their roles loaded, see
+        StatelessJWTAuthentication.
+        """
+        deferred = self.get_deferred_fields()
+        if fields is not None and set(fields) <= deferred:
+            fields = list(deferred)
+        super().refresh_from_db(using, fields, from_queryset)
@@ -1,6 +1,7 @@
-from core.models import Location
+from core.resolvers import resolve_location
 from core.serializers import LocationSerializer
 from rest_framework import serializers
+from taggit.serializers import TagListSerializerField
 from users.models import CustomUser
 
 
@@ -10,6 +11,7 @@ class UserSerializer(serializers.ModelSerializer):
     """
 
     location = LocationSerializer()
+    preferred_labels = TagListSerializerField(required=False)
     confirm_password = serializers.CharField(write_only=True)
 
     class Meta:
@@ -24,6 +26,7 @@ class UserSerializer(serializers.ModelSerializer):
             "is_client",
             "is_agent",
             "default_role",
+            "preferred_labels",
             "created_at",
             "updated_at",
         ]
@@ -67,6 +70,7 @@ class UserSerializer(serializers.ModelSerializer):
         provided in the validated_data.
         """
         validated_data.pop("confirm_password")
+        preferred_labels = validated_data.pop("preferred_labels", [])
 
         # Set profile flags based on default_role
         default_role = validated_data.get("default_role")
@@ -74,8 +78,9 @@ class UserSerializer(serializers.ModelSerializer):
         validated_data["is_agent"] = default_role == "agent"
 
         location_data = validated_data.pop("location")
-        location, _ = Location.objects.get_or_create(**location_data)
-        validated_data["location"] = location
+        validated_data["location"] = resolve_location(location_data)
 
         user = CustomUser.objects.create_user(**validated_data)
+        if preferred_labels:
+            user.preferred_labels.set(preferred_labels)
         return user
@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from gigs.validators import validate_agent, validate_client
+
+from users.identity import get_loaded_user, identity_map
+from users.tests.factories import UserFactory
+
+
+class GetLoadedUserTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.other = UserFactory()
+
+    def test_authenticated_user_is_returned_without_query(self):
+        with identity_map(SimpleNamespace(user=self.user)):
+            with self.assertNumQueries(0):
+                self.assertIs(get_loaded_user(self.user.pk), self.user)
+
+    def test_string_primary_key_matches(self):
+        with identity_map(SimpleNamespace(user=self.user)):
+            with self.assertNumQueries(0):
+                self.assertIs(get_loaded_user(str(self.user.pk)), self.user)
+
+    def test_other_users_are_not_loaded(self):
+        with identity_map(SimpleNamespace(user=self.user)):
+            with self.assertNumQueries(0):
+                self.assertIsNone(get_loaded_user(self.other.pk))
+
+    def test_anonymous_user_is_ignored(self):
+        with identity_map(SimpleNamespace(user=AnonymousUser())):
+            self.assertIsNone(get_loaded_user(self.user.pk))
+
+    def test_without_map_no_user_is_loaded(self):
+        self.assertIsNone(get_loaded_user(self.user.pk))
+
+    def test_map_is_closed_after_block(self):
+        with identity_map(SimpleNamespace(user=self.user)):
+            pass
+
+        self.assertIsNone(get_loaded_user(self.user.pk))
+
+
+class GigUserValidatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.client_user = UserFactory(default_role="client")
+        cls.agent_user = UserFactory(default_role="agent")
+
+    def test_request_user_is_validated_without_query(self):
+        with identity_map(SimpleNamespace(user=self.client_user)):
+            with self.assertNumQueries(0):
+                validate_client(self.client_user.pk)
+
+    def test_wrong_role_is_rejected(self):
+        with identity_map(SimpleNamespace(user=self.client_user)):
+            with self.assertRaises(ValidationError):
+                validate_agent(self.client_user.pk)
+
+    def test_other_users_are_checked_without_loading_them(self):
+        with identity_map(SimpleNamespace(user=self.client_user)):
+            with CaptureQueriesContext(connection) as queries:
+                validate_agent(self.agent_user.pk)
+
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"users"."email"', queries[0]["sql"])
+
+    def test_other_users_with_the_wrong_role_are_rejected(self):
+        with identity_map(SimpleNamespace(user=self.agent_user)):
+            with self.assertRaises(ValidationError):
+                validate_agent(self.client_user.pk)
@@ -66,6 +66,25 @@ class TestUserSerializer(TestCase):
         self.assertFalse(user.is_client)
         self.assertEqual(user.default_role, self.user_valid_data_agent["default_role"])
 
+    def test_agent_preferred_labels_are_saved(self):
+        """
+        Verifies that preferred labels given at sign up are saved on the user
+        and included in the serialized output.
+        """
+        data = {
+            **self.user_valid_data_agent,
+            "preferred_labels": ["wedding", "conference"],
+        }
+        serializer = UserSerializer(data=data)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        user = serializer.save()
+
+        self.assertCountEqual(user.preferred_labels.names(), ["wedding", "conference"])
+        self.assertCountEqual(
+            UserSerializer(instance=user).data["preferred_labels"],
+            ["wedding", "conference"],
+        )
+
     def test_password_mismatch_validation(self):
         """
         Ensures the serializer raises a validation error if 'password'